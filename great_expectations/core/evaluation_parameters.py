@@ -2,8 +2,11 @@ import copy
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
+from functools import lru_cache
+from typing import Tuple
 
 from pyparsing import (
     CaselessKeyword,
@@ -26,6 +29,9 @@ from great_expectations.exceptions import EvaluationParameterError
 logger = logging.getLogger(__name__)
 _epsilon = 1e-12
 
+# Bound on the number of distinct parameter expressions whose compiled form is kept
+EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE = 1024
+
 
 class EvaluationParameterParser:
     """
@@ -208,6 +214,25 @@ def build_evaluation_parameters(
 
 
 expr = EvaluationParameterParser()
+# The parser's parse actions push onto its exprStack, so only one expression can be parsed at a time
+_parser_lock = threading.Lock()
+
+
+@lru_cache(maxsize=EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE)
+def _compile_evaluation_parameter_expression(
+    parameter_expression: str,
+) -> Tuple[tuple, tuple]:
+    """Parses a parameter expression once into its top-level tokens and the stack of operands and operators to
+    evaluate, both immutable so that they can be shared by concurrent evaluations.
+
+    Raises:
+        ParseException: if the expression cannot be parsed; failures are not cached
+    """
+    with _parser_lock:
+        # Calling get_parser clears the stack
+        parser = expr.get_parser()
+        tokens = parser.parseString(parameter_expression, parseAll=True)
+        return tuple(tokens), tuple(expr.exprStack)
 
 
 def find_evaluation_parameter_dependencies(parameter_expression):
@@ -222,13 +247,9 @@ def find_evaluation_parameter_dependencies(parameter_expression):
           - "other": set of non-GE URN strings that are required to evaluate the parameter expression
 
     """
-    expr = EvaluationParameterParser()
-
     dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
+        _, expr_stack = _compile_evaluation_parameter_expression(parameter_expression)
     except ParseException as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
@@ -238,7 +259,7 @@ def find_evaluation_parameter_dependencies(parameter_expression):
             f"Unable to parse evaluation parameter: {str(err)}"
         )
 
-    for word in expr.exprStack:
+    for word in expr_stack:
         if isinstance(word, (int, float)):
             continue
 
@@ -292,12 +313,11 @@ def parse_evaluation_parameter(
     if evaluation_parameters is None:
         evaluation_parameters = {}
 
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        L = parser.parseString(parameter_expression, parseAll=True)
+        L, expr_stack = _compile_evaluation_parameter_expression(parameter_expression)
     except ParseException as err:
         L = ["Parse Failure", parameter_expression, (str(err), err.line, err.column)]
+        expr_stack = tuple()
 
     if len(L) == 1 and L[0] not in evaluation_parameters:
         # In this special case there were no operations to find, so only one value, but we don't have something to
@@ -333,9 +353,13 @@ def parse_evaluation_parameter(
         return evaluation_parameters[L[0]]
 
     elif len(L) == 0 or L[0] != "Parse Failure":
-        for i, ob in enumerate(expr.exprStack):
-            if isinstance(ob, str) and ob in evaluation_parameters:
-                expr.exprStack[i] = str(evaluation_parameters[ob])
+        # Substitute into a copy, which evaluate_stack then consumes, leaving the compiled stack untouched
+        expr_stack = [
+            str(evaluation_parameters[ob])
+            if isinstance(ob, str) and ob in evaluation_parameters
+            else ob
+            for ob in expr_stack
+        ]
 
     else:
         err_str, err_line, err_col = L[-1]
@@ -344,7 +368,7 @@ def parse_evaluation_parameter(
         )
 
     try:
-        result = expr.evaluate_stack(expr.exprStack)
+        result = expr.evaluate_stack(expr_stack)
     except Exception as e:
         exception_traceback = traceback.format_exc()
         exception_message = (
@@ -358,6 +382,70 @@ def parse_evaluation_parameter(
     return result
 
 
+def fetch_store_evaluation_parameters(
+    expectation_configurations, evaluation_parameters=None, data_context=None
+):
+    """Fetch the values of the store-backed evaluation parameters (urn:great_expectations:stores URNs) of several
+    expectations up front, in one batch per store.
+
+    Parameters already present in evaluation_parameters, or whose store cannot fetch a batch, are left to
+    parse_evaluation_parameter, as are the parameters of a batch that fails: their errors are then reported by the
+    expectation that uses them.
+
+    Args:
+        expectation_configurations (list): the ExpectationConfigurations whose parameters to fetch
+        evaluation_parameters (dict): the evaluation parameters already available
+        data_context (DataContext): the data context providing the stores
+
+    Returns:
+        a dictionary of the fetched values, keyed by URN
+    """
+    if data_context is None:
+        return dict()
+    if evaluation_parameters is None:
+        evaluation_parameters = {}
+
+    store_queries = dict()
+    for expectation_configuration in expectation_configurations:
+        for value in expectation_configuration.kwargs.values():
+            if not isinstance(value, dict) or "$PARAMETER" not in value:
+                continue
+            if "$PARAMETER." + value["$PARAMETER"] in value:
+                continue
+            try:
+                dependencies = find_evaluation_parameter_dependencies(
+                    value["$PARAMETER"]
+                )
+            except EvaluationParameterError:
+                continue
+            for urn in dependencies["urns"]:
+                if urn in evaluation_parameters:
+                    continue
+                res = ge_urn.parseString(urn)
+                if res["urn_type"] != "stores":
+                    continue
+                store_queries.setdefault(res["store_name"], dict())[urn] = (
+                    res["metric_name"],
+                    res.get("metric_kwargs", {}),
+                )
+
+    fetched_parameters = dict()
+    for store_name, queries in store_queries.items():
+        store = data_context.stores.get(store_name)
+        if not hasattr(store, "get_query_results"):
+            continue
+        try:
+            results = store.get_query_results(list(queries.values()))
+        except Exception as e:
+            logger.warning(
+                f"Unable to fetch evaluation parameters from store {store_name}: {str(e)}"
+            )
+            continue
+        fetched_parameters.update(zip(queries.keys(), results))
+
+    return fetched_parameters
+
+
 def _deduplicate_evaluation_parameter_dependencies(dependencies):
     deduplicated = dict()
     for suite_name, required_metrics in dependencies.items():
@@ -0,0 +1,347 @@
+"""Mergeable sketches used to compute approximate column metrics.
+
+A sketch summarizes a column in a bounded amount of memory. Sketches built on different partitions (or chunks) of the
+same column can be merged into the sketch of the whole column, and they can be serialized with to_json_dict, e.g. to
+be kept in a MetricStore and merged with the sketches of later batches.
+"""
+import copy
+import logging
+import math
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.types import SerializableDictDot
+
+logger = logging.getLogger(__name__)
+
+_POWERS_OF_TWO = np.array([1 << i for i in range(64)], dtype=np.uint64)
+
+
+def _drop_null_values(values) -> pd.Series:
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values)
+    return values[values.notnull()]
+
+
+def _concatenate(values, other_values) -> np.ndarray:
+    # Concatenating with an empty array would change the dtype of integer values to float
+    if len(values) == 0:
+        return np.asarray(other_values)
+    if len(other_values) == 0:
+        return values
+    return np.concatenate([values, other_values])
+
+
+def merge_sketches(sketches):
+    """Returns a new sketch merging a list of sketches of the same type (None for an empty list). The sketches of the
+    list, which may be cached metric values, are left unchanged."""
+    sketches = [sketch for sketch in sketches if sketch is not None]
+    if len(sketches) == 0:
+        return None
+    return reduce(
+        lambda sketch, other: sketch.merge(other),
+        sketches[1:],
+        copy.deepcopy(sketches[0]),
+    )
+
+
+def build_sketch(sketch_class, allow_relative_error, **kwargs):
+    """Returns an empty sketch of sketch_class for the allow_relative_error of an expectation: True for a sketch of the
+    default size, or the relative error of the sketch as a float between 0 and 1"""
+    if allow_relative_error is True:
+        return sketch_class(**kwargs)
+    return sketch_class.from_relative_error(allow_relative_error, **kwargs)
+
+
+def sketch_from_json_dict(sketch_dict: dict):
+    """Returns the sketch serialized in sketch_dict by the to_json_dict method of a sketch"""
+    sketch_classes = {
+        sketch_class.sketch_type: sketch_class
+        for sketch_class in (KLLQuantileSketch, HyperLogLogSketch)
+    }
+    try:
+        sketch_class = sketch_classes[sketch_dict["sketch_type"]]
+    except KeyError:
+        raise ValueError(
+            f"Unrecognized sketch_type: {sketch_dict.get('sketch_type')}; expected one of "
+            f"{', '.join(sketch_classes.keys())}."
+        )
+    return sketch_class.from_json_dict(sketch_dict)
+
+
+class KLLQuantileSketch(SerializableDictDot):
+    """Quantile sketch of Karnin, Lang and Liberty ("Optimal Quantile Approximation in Streams", 2016).
+
+    Values are kept in a hierarchy of compactors: when a compactor is full, its sorted values are halved by keeping
+    every other value, and the kept values move to the next compactor, where each of them stands for twice as many
+    values. The rank error of a quantile is about 1.7 / k of the number of values.
+    """
+
+    sketch_type = "kll_quantiles"
+    # Values are added to the sketch in blocks of at most update_block_factor * k values, so that the compactors (and
+    # the arrays sorted to compact them) stay bounded in size however many values are added at once
+    update_block_factor = 64
+
+    def __init__(self, k=200, count=0, min_value=None, max_value=None, compactors=None):
+        if k < 8:
+            raise ValueError("KLLQuantileSketch requires k to be at least 8.")
+        self._k = k
+        self._count = count
+        self._min_value = min_value
+        self._max_value = max_value
+        if compactors:
+            self._compactors = [np.asarray(compactor) for compactor in compactors]
+        else:
+            self._compactors = [np.empty(0)]
+        # A fixed seed keeps the results of a validation reproducible
+        self._random = np.random.RandomState(k)
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float):
+        """Returns a sketch whose quantiles have a rank error of about relative_error"""
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be a float between 0 and 1.")
+        return cls(k=max(8, int(math.ceil(2 / relative_error))))
+
+    @property
+    def k(self):
+        return self._k
+
+    @property
+    def count(self):
+        return self._count
+
+    def _capacity(self, height):
+        depth = len(self._compactors) - height - 1
+        return int(math.ceil(self._k * (2 / 3) ** depth)) + 1
+
+    def _size(self):
+        return sum(len(compactor) for compactor in self._compactors)
+
+    def _max_size(self):
+        return sum(self._capacity(height) for height in range(len(self._compactors)))
+
+    def _compress(self):
+        while self._size() >= self._max_size():
+            for height, compactor in enumerate(self._compactors):
+                if len(compactor) < self._capacity(height):
+                    continue
+                if height + 1 == len(self._compactors):
+                    self._compactors.append(np.empty(0))
+                compactor = np.sort(compactor)
+                # An odd value out stays in the compactor
+                self._compactors[height] = compactor[
+                    len(compactor) - len(compactor) % 2 :
+                ]
+                compactor = compactor[: len(compactor) - len(compactor) % 2]
+                self._compactors[height + 1] = _concatenate(
+                    self._compactors[height + 1],
+                    compactor[self._random.randint(2) :: 2],
+                )
+                break
+
+    def update(self, values):
+        """Adds the non-null values to the sketch, and returns the sketch"""
+        values = _drop_null_values(values).to_numpy()
+        if len(values) == 0:
+            return self
+        self._count += len(values)
+        self._min_value = (
+            values.min()
+            if self._min_value is None
+            else min(self._min_value, values.min())
+        )
+        self._max_value = (
+            values.max()
+            if self._max_value is None
+            else max(self._max_value, values.max())
+        )
+        block_size = self.update_block_factor * self._k
+        for start in range(0, len(values), block_size):
+            self._compactors[0] = _concatenate(
+                self._compactors[0], values[start : start + block_size]
+            )
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLQuantileSketch"):
+        """Merges other into the sketch, and returns the sketch"""
+        if not isinstance(other, KLLQuantileSketch) or other.k != self.k:
+            raise ValueError(
+                "Only KLLQuantileSketch objects with the same k can be merged."
+            )
+        if other.count == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append(np.empty(0))
+        for height, compactor in enumerate(other._compactors):
+            self._compactors[height] = _concatenate(self._compactors[height], compactor)
+        self._count += other.count
+        self._min_value = (
+            other._min_value
+            if self._min_value is None
+            else min(self._min_value, other._min_value)
+        )
+        self._max_value = (
+            other._max_value
+            if self._max_value is None
+            else max(self._max_value, other._max_value)
+        )
+        self._compress()
+        return self
+
+    def quantiles(self, quantiles):
+        """Returns the approximate values of the quantiles, with the "nearest" interpolation of pandas"""
+        if self._count == 0:
+            return [np.nan for _ in quantiles]
+        values = reduce(_concatenate, self._compactors)
+        weights = np.concatenate(
+            [
+                np.full(len(compactor), 2 ** height, dtype=np.int64)
+                for height, compactor in enumerate(self._compactors)
+            ]
+        )
+        order = np.argsort(values, kind="mergesort")
+        values = values[order]
+        cumulative_weights = np.cumsum(weights[order])
+        total_weight = cumulative_weights[-1]
+
+        results = []
+        for quantile in quantiles:
+            if quantile <= 0:
+                results.append(self._min_value)
+            elif quantile >= 1:
+                results.append(self._max_value)
+            else:
+                rank = np.round(quantile * (total_weight - 1))
+                index = min(
+                    np.searchsorted(cumulative_weights, rank, side="right"),
+                    len(values) - 1,
+                )
+                results.append(values[index])
+        return convert_to_json_serializable(results)
+
+    def to_json_dict(self) -> dict:
+        return convert_to_json_serializable(
+            {
+                "sketch_type": self.sketch_type,
+                "k": self._k,
+                "count": self._count,
+                "min_value": self._min_value,
+                "max_value": self._max_value,
+                "compactors": [compactor.tolist() for compactor in self._compactors],
+            }
+        )
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: dict):
+        return cls(
+            k=sketch_dict["k"],
+            count=sketch_dict["count"],
+            min_value=sketch_dict["min_value"],
+            max_value=sketch_dict["max_value"],
+            compactors=sketch_dict["compactors"],
+        )
+
+
+class HyperLogLogSketch(SerializableDictDot):
+    """HyperLogLog sketch of the number of distinct values (Flajolet et al., 2007).
+
+    Each value is hashed to 64 bits: the first precision bits select one of 2 ** precision registers, which keeps the
+    largest position of the leftmost 1-bit in the remaining bits. The standard error of the estimate is about
+    1.04 / sqrt(2 ** precision).
+    """
+
+    sketch_type = "hyperloglog"
+
+    def __init__(self, precision=14, registers=None):
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLogSketch requires a precision between 4 and 18.")
+        self._precision = precision
+        if registers is None:
+            self._registers = np.zeros(1 << precision, dtype=np.uint8)
+        else:
+            self._registers = np.asarray(registers, dtype=np.uint8)
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float):
+        """Returns a sketch whose estimate has a standard error of about relative_error"""
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be a float between 0 and 1.")
+        precision = int(math.ceil(math.log2((1.04 / relative_error) ** 2)))
+        return cls(precision=min(max(precision, 4), 18))
+
+    @property
+    def precision(self):
+        return self._precision
+
+    def update(self, values):
+        """Adds the non-null values to the sketch, and returns the sketch"""
+        values = _drop_null_values(values)
+        if len(values) == 0:
+            return self
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        remainder_bits = 64 - self._precision
+        registers = (hashes >> np.uint64(remainder_bits)).astype(np.int64)
+        remainders = hashes & np.uint64((1 << remainder_bits) - 1)
+        # Position of the leftmost 1-bit in the remainder, computed from its bit length without float rounding
+        ranks = (
+            remainder_bits
+            + 1
+            - np.searchsorted(_POWERS_OF_TWO, remainders, side="right")
+        )
+        ranks = pd.Series(ranks).groupby(registers).max()
+        self._registers[ranks.index] = np.maximum(
+            self._registers[ranks.index], ranks.to_numpy()
+        )
+        return self
+
+    def merge(self, other: "HyperLogLogSketch"):
+        """Merges other into the sketch, and returns the sketch"""
+        if (
+            not isinstance(other, HyperLogLogSketch)
+            or other.precision != self.precision
+        ):
+            raise ValueError(
+                "Only HyperLogLogSketch objects with the same precision can be merged."
+            )
+        self._registers = np.maximum(self._registers, other._registers)
+        return self
+
+    def count(self) -> int:
+        """Returns the estimated number of distinct values"""
+        register_count = len(self._registers)
+        if register_count == 16:
+            alpha = 0.673
+        elif register_count == 32:
+            alpha = 0.697
+        elif register_count == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / register_count)
+        estimate = (
+            alpha
+            * register_count ** 2
+            / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        )
+        empty_registers = np.count_nonzero(self._registers == 0)
+        if estimate <= 2.5 * register_count and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = register_count * math.log(register_count / empty_registers)
+        return int(round(estimate))
+
+    def to_json_dict(self) -> dict:
+        return {
+            "sketch_type": self.sketch_type,
+            "precision": self._precision,
+            "registers": self._registers.tolist(),
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: dict):
+        return cls(
+            precision=sketch_dict["precision"], registers=sketch_dict["registers"]
+        )
@@ -15,7 +15,10 @@ from typing import List
 from dateutil.parser import parse
 
 from great_expectations import __version__ as ge_version
-from great_expectations.core.evaluation_parameters import build_evaluation_parameters
+from great_expectations.core.evaluation_parameters import (
+    build_evaluation_parameters,
+    fetch_store_evaluation_parameters,
+)
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import (
     ExpectationSuite,
@@ -910,6 +913,18 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            # Fetch the store-backed evaluation parameters of all expectations up front, in one batch per store
+            expectation_evaluation_parameters = runtime_evaluation_parameters
+            if self._config.get("interactive_evaluation", True):
+                expectation_evaluation_parameters = {
+                    **fetch_store_evaluation_parameters(
+                        expectations_to_evaluate,
+                        evaluation_parameters=runtime_evaluation_parameters,
+                        data_context=self._data_context,
+                    ),
+                    **runtime_evaluation_parameters,
+                }
+
             for expectation in expectations_to_evaluate:
 
                 try:
@@ -927,7 +942,7 @@ class DataAsset:
                         substituted_parameters,
                     ) = build_evaluation_parameters(
                         expectation.kwargs,
-                        runtime_evaluation_parameters,
+                        expectation_evaluation_parameters,
                         self._config.get("interactive_evaluation", True),
                         self._data_context,
                     )
@@ -3,32 +3,51 @@ import uuid
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.util import get_sqlalchemy_engine
 
 try:
     import sqlalchemy
     from sqlalchemy import (
         Column,
+        Index,
         MetaData,
         String,
         Table,
         and_,
-        column,
-        create_engine,
+        bindparam,
+        literal,
+        or_,
         select,
         text,
     )
+    from sqlalchemy.dialects import mysql, postgresql
     from sqlalchemy.engine.reflection import Inspector
     from sqlalchemy.engine.url import URL
     from sqlalchemy.exc import IntegrityError, NoSuchTableError, SQLAlchemyError
 except ImportError:
     sqlalchemy = None
-    create_engine = None
 
 
 logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    """Uses a database table with one column per key element and a value column as a store.
+
+    The key columns form the table's primary key (or, for existing tables without one, a unique index), so that keys
+    are looked up through an index and values can be written with the dialect's native upsert: INSERT ... ON CONFLICT
+    on PostgreSQL and SQLite, INSERT ... ON DUPLICATE KEY UPDATE on MySQL, and MERGE on SQL Server and Snowflake. Other
+    dialects update the row and insert it if no row was updated.
+
+    Statements are built once, with bound parameters, and their compiled forms are cached. The engine is shared with
+    every other component targeting the same database; its connection pool can be tuned with ``pool_options`` (see
+    great_expectations.util.SqlAlchemyEngineRegistry).
+    """
+
+    # Number of keys looked up per query when set_many checks which keys already exist
+    SET_MANY_CHUNK_SIZE = 100
+    MERGE_DIALECTS = ("mssql", "snowflake")
+
     def __init__(
         self,
         credentials,
@@ -38,6 +57,7 @@ class DatabaseStoreBackend(StoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        pool_options=None,
     ):
         super().__init__(
             fixed_length_key=fixed_length_key,
@@ -58,7 +78,7 @@ class DatabaseStoreBackend(StoreBackend):
         drivername = credentials.pop("drivername")
         schema = credentials.pop("schema", None)
         options = URL(drivername, **credentials)
-        self.engine = create_engine(options)
+        self.engine = get_sqlalchemy_engine(options, pool_options=pool_options)
 
         meta = MetaData(schema=schema)
         self.key_columns = key_columns
@@ -80,6 +100,7 @@ class DatabaseStoreBackend(StoreBackend):
                 raise ge_exceptions.StoreBackendError(
                     f"Unable to use table {table_name}: it exists, but does not have the expected schema."
                 )
+            has_unique_key = self._ensure_unique_key_index(table)
         except NoSuchTableError:
             table = Table(table_name, meta, *cols)
             try:
@@ -90,7 +111,14 @@ class DatabaseStoreBackend(StoreBackend):
                 raise ge_exceptions.StoreBackendError(
                     f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {str(e)}"
                 )
+            has_unique_key = True
         self._table = table
+        # Compiled statements are cached per backend; the engine itself may be shared with other stores
+        self._compiled_cache = {}
+        self._statement_engine = self.engine.execution_options(
+            compiled_cache=self._compiled_cache
+        )
+        self._build_statements(has_unique_key)
         # Initialize with store_backend_id
         self._store_backend_id = None
         self._store_backend_id = self.store_backend_id
@@ -113,43 +141,157 @@ class DatabaseStoreBackend(StoreBackend):
             self._store_backend_id = f"{self.STORE_BACKEND_ID_PREFIX}{store_id}"
         return self._store_backend_id.replace(self.STORE_BACKEND_ID_PREFIX, "")
 
-    def _get(self, key):
-        sel = (
-            select([column("value")])
-            .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    ]
-                )
+    def _ensure_unique_key_index(self, table):
+        """Makes sure the key columns of an existing table are its primary key or have a unique index, creating the
+        index if needed.
+
+        Returns:
+            whether the key columns are unique, which native upserts require
+        """
+        key_columns = {key_col.lower() for key_col in self.key_columns}
+        if {col.name.lower() for col in table.primary_key.columns} == key_columns:
+            return True
+        inspector = Inspector.from_engine(self.engine)
+        for index in inspector.get_indexes(table.name, schema=table.schema):
+            if (
+                index.get("unique")
+                and {col.lower() for col in index["column_names"]} == key_columns
+            ):
+                return True
+        index = Index(
+            f"ix_{table.name}_key",
+            *[getattr(table.columns, key_col) for key_col in self.key_columns],
+            unique=True,
+        )
+        try:
+            index.create(self.engine)
+        except SQLAlchemyError as e:
+            logger.warning(
+                f"Unable to create a unique index on the key columns of table {table.name}; values will be written "
+                f"without native upserts. SqlAlchemyError: {str(e)}"
             )
+            return False
+        return True
+
+    def _key_clause(self, key_columns=None):
+        if key_columns is None:
+            key_columns = self.key_columns
+        return and_(
+            *[
+                getattr(self._table.columns, key_col) == bindparam(f"key_{index}")
+                for index, key_col in enumerate(key_columns)
+            ]
         )
+
+    def _build_statements(self, has_unique_key):
+        key_clause = self._key_clause()
+        self._get_statement = select([self._table.columns["value"]]).where(key_clause)
+        self._has_key_statement = select([literal(1)]).where(key_clause).limit(1)
+        self._insert_statement = self._table.insert().values(
+            {
+                key_col: bindparam(f"key_{index}")
+                for index, key_col in enumerate(self.key_columns)
+            },
+            value=bindparam("new_value"),
+        )
+        self._update_statement = (
+            self._table.update().where(key_clause).values(value=bindparam("new_value"))
+        )
+        self._delete_statement = self._table.delete().where(key_clause)
+        self._list_keys_statements = {}
+        self._upsert_statement = (
+            self._build_upsert_statement() if has_unique_key else None
+        )
+
+    def _build_upsert_statement(self):
+        """Returns the dialect's native upsert statement, or None if the dialect has none we can use."""
+        dialect_name = self.engine.dialect.name
+        values = dict(
+            {
+                key_col: bindparam(f"key_{index}")
+                for index, key_col in enumerate(self.key_columns)
+            },
+            value=bindparam("new_value"),
+        )
+        if dialect_name == "postgresql":
+            insert = postgresql.insert(self._table).values(values)
+            return insert.on_conflict_do_update(
+                index_elements=[
+                    getattr(self._table.columns, key_col)
+                    for key_col in self.key_columns
+                ],
+                set_={"value": insert.excluded["value"]},
+            )
+        if dialect_name == "mysql":
+            insert = mysql.insert(self._table).values(values)
+            return insert.on_duplicate_key_update(value=insert.inserted["value"])
+
+        preparer = self.engine.dialect.identifier_preparer
+        table_name = preparer.format_table(self._table)
+        key_column_names = [preparer.quote(key_col) for key_col in self.key_columns]
+        value_column_name = preparer.quote("value")
+        key_params = [f":key_{index}" for index in range(len(self.key_columns))]
+        if dialect_name == "sqlite":
+            # ON CONFLICT ... DO UPDATE was added in SQLite 3.24
+            if self.engine.dialect.dbapi.sqlite_version_info < (3, 24, 0):
+                return None
+            return text(
+                f"INSERT INTO {table_name} ({', '.join(key_column_names)}, {value_column_name}) "
+                f"VALUES ({', '.join(key_params)}, :new_value) "
+                f"ON CONFLICT ({', '.join(key_column_names)}) "
+                f"DO UPDATE SET {value_column_name} = excluded.{value_column_name}"
+            )
+        if dialect_name in self.MERGE_DIALECTS:
+            source_columns = ", ".join(
+                [
+                    f"{key_param} AS {key_col}"
+                    for key_param, key_col in zip(key_params, key_column_names)
+                ]
+                + [f":new_value AS {value_column_name}"]
+            )
+            on_clause = " AND ".join(
+                f"target.{key_col} = source.{key_col}" for key_col in key_column_names
+            )
+            insert_columns = ", ".join(key_column_names + [value_column_name])
+            insert_values = ", ".join(
+                f"source.{col}" for col in key_column_names + [value_column_name]
+            )
+            return text(
+                f"MERGE INTO {table_name} AS target "
+                f"USING (SELECT {source_columns}) AS source ON {on_clause} "
+                f"WHEN MATCHED THEN UPDATE SET {value_column_name} = source.{value_column_name} "
+                f"WHEN NOT MATCHED THEN INSERT ({insert_columns}) VALUES ({insert_values});"
+            )
+        return None
+
+    @staticmethod
+    def _get_statement_params(key, value=None):
+        params = {f"key_{index}": key_element for index, key_element in enumerate(key)}
+        if value is not None:
+            params["new_value"] = value
+        return params
+
+    def _get(self, key):
         try:
-            return self.engine.execute(sel).fetchone()[0]
-        except (IndexError, SQLAlchemyError) as e:
+            row = self._statement_engine.execute(
+                self._get_statement, self._get_statement_params(key)
+            ).fetchone()
+        except SQLAlchemyError as e:
             logger.debug("Error fetching value: " + str(e))
+            row = None
+        if row is None:
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
+        return row[0]
 
     def _set(self, key, value, allow_update=True):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
-
+        params = self._get_statement_params(key, value)
         if allow_update:
-            if self.has_key(key):
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
-                )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
+            with self._statement_engine.begin() as connection:
+                self._upsert(connection, params)
+            return
 
         try:
-            self.engine.execute(ins)
+            self._statement_engine.execute(self._insert_statement, params)
         except IntegrityError as e:
             if self._get(key) == value:
                 logger.info(f"Key {str(key)} already exists with the same value.")
@@ -158,6 +300,85 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _upsert(self, connection, params):
+        if self._upsert_statement is not None:
+            connection.execute(self._upsert_statement, params)
+        elif connection.execute(self._update_statement, params).rowcount == 0:
+            connection.execute(self._insert_statement, params)
+
+    def _set_many(self, key_value_pairs, allow_update=True):
+        """Writes all key_value_pairs in one transaction.
+
+        With a native upsert, all keys are written with one executemany upsert. Otherwise existing keys are found with
+        one SELECT per SET_MANY_CHUNK_SIZE keys; the new keys are then inserted, and the existing ones updated, with one
+        executemany statement each.
+        """
+        # The last value set for a key wins, as with repeated calls to set
+        values_by_key = {tuple(key): value for key, value in key_value_pairs}
+        keys = list(values_by_key.keys())
+        try:
+            with self._statement_engine.begin() as connection:
+                if allow_update and self._upsert_statement is not None:
+                    if keys:
+                        connection.execute(
+                            self._upsert_statement,
+                            [
+                                self._get_statement_params(key, values_by_key[key])
+                                for key in keys
+                            ],
+                        )
+                    return [None] * len(key_value_pairs)
+
+                existing_keys = set()
+                for start in range(0, len(keys), self.SET_MANY_CHUNK_SIZE):
+                    existing_keys.update(
+                        self._get_existing_keys(
+                            connection, keys[start : start + self.SET_MANY_CHUNK_SIZE]
+                        )
+                    )
+                if existing_keys and not allow_update:
+                    raise ge_exceptions.StoreBackendError(
+                        f"Keys {sorted(existing_keys)} already exist and allow_update is False"
+                    )
+
+                new_rows = [
+                    self._get_statement_params(key, values_by_key[key])
+                    for key in keys
+                    if key not in existing_keys
+                ]
+                if new_rows:
+                    connection.execute(self._insert_statement, new_rows)
+                updated_rows = [
+                    self._get_statement_params(key, values_by_key[key])
+                    for key in keys
+                    if key in existing_keys
+                ]
+                if updated_rows:
+                    connection.execute(self._update_statement, updated_rows)
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to store {len(keys)} keys: got sqlalchemy error {str(e)}"
+            )
+        return [None] * len(key_value_pairs)
+
+    def _get_existing_keys(self, connection, keys):
+        sel = select(
+            [getattr(self._table.columns, col) for col in self.key_columns]
+        ).where(
+            or_(
+                *[
+                    and_(
+                        *[
+                            getattr(self._table.columns, key_col) == val
+                            for key_col, val in zip(self.key_columns, key)
+                        ]
+                    )
+                    for key in keys
+                ]
+            )
+        )
+        return {tuple(row) for row in connection.execute(sel).fetchall()}
+
     def _move(self):
         raise NotImplementedError
 
@@ -180,50 +401,39 @@ class DatabaseStoreBackend(StoreBackend):
         return engine_name + "://" + db_name + "/" + str(key[0])
 
     def _has_key(self, key):
-        sel = (
-            select([sqlalchemy.func.count(column("value"))])
-            .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    ]
-                )
-            )
-        )
         try:
-            return self.engine.execute(sel).fetchone()[0] == 1
-        except (IndexError, SQLAlchemyError) as e:
+            return (
+                self._statement_engine.execute(
+                    self._has_key_statement, self._get_statement_params(key)
+                ).fetchone()
+                is not None
+            )
+        except SQLAlchemyError as e:
             logger.debug("Error checking for value: " + str(e))
             return False
 
     def list_keys(self, prefix=()):
-        sel = (
-            select([column(col) for col in self.key_columns])
-            .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns[: len(prefix)], prefix)
-                    ]
-                )
+        # One statement is built, and cached, per prefix length
+        sel = self._list_keys_statements.get(len(prefix))
+        if sel is None:
+            sel = select(
+                [getattr(self._table.columns, col) for col in self.key_columns]
             )
-        )
-        return [tuple(row) for row in self.engine.execute(sel).fetchall()]
+            if prefix:
+                sel = sel.where(self._key_clause(self.key_columns[: len(prefix)]))
+            self._list_keys_statements[len(prefix)] = sel
+        return [
+            tuple(row)
+            for row in self._statement_engine.execute(
+                sel, self._get_statement_params(prefix)
+            ).fetchall()
+        ]
 
     def remove_key(self, key):
-        delete_statement = self._table.delete().where(
-            and_(
-                *[
-                    getattr(self._table.columns, key_col) == val
-                    for key_col, val in zip(self.key_columns, key)
-                ]
-            )
-        )
         try:
-            return self.engine.execute(delete_statement)
+            return self._statement_engine.execute(
+                self._delete_statement, self._get_statement_params(key)
+            )
         except SQLAlchemyError as e:
             raise ge_exceptions.StoreBackendError(
                 f"Unable to delete key: got sqlalchemy error {str(e)}"
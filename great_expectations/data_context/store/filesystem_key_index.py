@@ -0,0 +1,232 @@
+import datetime
+import json
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class FilesystemKeyIndex:
+    """A SQLite sidecar file that indexes the keys of a TupleFilesystemStoreBackend.
+
+    The index records the relative filepath, key and modification time of every file of the store, and the
+    modification time of every directory. It is kept up to date by the backend's writes, so that listing keys does not
+    need to walk the store. Files added, removed or renamed by anything else change the modification time of their
+    directories; when a listing finds such drift under its prefix, the prefix is rescanned and the index rebuilt for it.
+    (Files overwritten in place by anything else keep their indexed modification time until the next rescan.) Finding
+    drift takes a stat call per directory under the prefix, rather than reading every directory and a stat call per
+    file; every directory is checked, since a file added to an existing directory only changes that directory.
+
+    The sidecar file lives in the base directory of the store. It uses an in-memory journal, so that index
+    transactions do not create and delete journal files (which would change the base directory's modification time).
+    """
+
+    FILENAME = ".ge_key_index.sqlite"
+
+    def __init__(self, base_directory):
+        self._base_directory = base_directory
+        os.makedirs(base_directory, exist_ok=True)
+        self._path = os.path.join(base_directory, self.FILENAME)
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS files "
+                "(filepath TEXT PRIMARY KEY, key TEXT NOT NULL, mtime REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_files_mtime ON files (mtime)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS directories "
+                "(path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    @classmethod
+    def is_index_file(cls, filename):
+        return filename.startswith(cls.FILENAME)
+
+    @contextmanager
+    def _transaction(self):
+        connection = sqlite3.connect(self._path, timeout=30)
+        try:
+            connection.execute("PRAGMA journal_mode=MEMORY")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _full_path(self, relative_path):
+        return os.path.join(self._base_directory, relative_path)
+
+    @staticmethod
+    def _prefix_path(prefix):
+        return os.path.join(*prefix) if prefix else ""
+
+    @staticmethod
+    def _range_clause(column_name, prefix_path):
+        """Returns a clause matching prefix_path and the paths below it, which can use the primary key index."""
+        if not prefix_path:
+            return "1 = 1", []
+        separator = os.sep
+        return (
+            f"({column_name} = ? OR ({column_name} >= ? AND {column_name} < ?))",
+            [
+                prefix_path,
+                prefix_path + separator,
+                prefix_path + chr(ord(separator) + 1),
+            ],
+        )
+
+    @staticmethod
+    def _ancestors(filepath):
+        directory = os.path.dirname(filepath)
+        while True:
+            yield directory
+            if not directory:
+                return
+            directory = os.path.dirname(directory)
+
+    @staticmethod
+    def _to_timestamp(value):
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        return value
+
+    def _is_built(self, connection):
+        return (
+            connection.execute("SELECT 1 FROM state WHERE name = 'built'").fetchone()
+            is not None
+        )
+
+    def _is_stale(self, connection, prefix_path):
+        if not self._is_built(connection):
+            return True
+        clause, params = self._range_clause("path", prefix_path)
+        rows = connection.execute(
+            f"SELECT path, mtime_ns FROM directories WHERE {clause}", params
+        ).fetchall()
+        if not rows:
+            # A directory that was never indexed was created by someone else
+            return os.path.isdir(self._full_path(prefix_path))
+        for path, mtime_ns in rows:
+            try:
+                if os.stat(self._full_path(path)).st_mtime_ns != mtime_ns:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def list_keys(self, prefix, scan, modified_after=None, modified_before=None):
+        """Lists the indexed keys under prefix, rescanning it first if the index has drifted from the filesystem.
+
+        Args:
+            prefix: a tuple of leading key elements, as for StoreBackend.list_keys
+            scan: a function of a prefix returning the (filepath, key, mtime) tuples of the files under it and a
+                dictionary of the st_mtime_ns of the directories under it, by relative path
+            modified_after: only list keys of files modified at or after this datetime or timestamp
+            modified_before: only list keys of files modified before this datetime or timestamp
+
+        Returns:
+            a list of keys
+        """
+        prefix_path = self._prefix_path(prefix)
+        with self._transaction() as connection:
+            if self._is_stale(connection, prefix_path):
+                if not self._is_built(connection):
+                    prefix, prefix_path = (), ""
+                logger.debug(
+                    f"Rebuilding the key index of {self._base_directory} for prefix {prefix}"
+                )
+                entries, directory_mtimes = scan(prefix)
+                self._rebuild(connection, prefix_path, entries, directory_mtimes)
+                prefix_path = self._prefix_path(prefix)
+
+            clause, params = self._range_clause("filepath", prefix_path)
+            if modified_after is not None:
+                clause += " AND mtime >= ?"
+                params.append(self._to_timestamp(modified_after))
+            if modified_before is not None:
+                clause += " AND mtime < ?"
+                params.append(self._to_timestamp(modified_before))
+            rows = connection.execute(
+                f"SELECT key FROM files WHERE {clause} ORDER BY filepath", params
+            ).fetchall()
+        return [tuple(json.loads(key)) for (key,) in rows]
+
+    def _rebuild(self, connection, prefix_path, entries, directory_mtimes):
+        file_clause, file_params = self._range_clause("filepath", prefix_path)
+        directory_clause, directory_params = self._range_clause("path", prefix_path)
+        connection.execute(f"DELETE FROM files WHERE {file_clause}", file_params)
+        connection.execute(
+            f"DELETE FROM directories WHERE {directory_clause}", directory_params
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO files (filepath, key, mtime) VALUES (?, ?, ?)",
+            [(filepath, json.dumps(key), mtime) for filepath, key, mtime in entries],
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO directories (path, mtime_ns) VALUES (?, ?)",
+            directory_mtimes.items(),
+        )
+        if not prefix_path:
+            connection.execute(
+                "INSERT OR REPLACE INTO state (name, value) VALUES ('built', '1')"
+            )
+
+    def snapshot(self, filepath):
+        """Returns the st_mtime_ns of the directories containing filepath (None for missing ones), to be taken just
+        before the backend changes filepath and passed to record."""
+        directory_mtimes = {}
+        for directory in self._ancestors(filepath):
+            try:
+                directory_mtimes[directory] = os.stat(
+                    self._full_path(directory)
+                ).st_mtime_ns
+            except FileNotFoundError:
+                directory_mtimes[directory] = None
+        return directory_mtimes
+
+    def record(self, filepath, key, snapshot):
+        """Records that the backend wrote filepath (or removed it, if key is None).
+
+        The modification times of the directories containing filepath are updated, unless a directory had already
+        drifted from the index before the change (according to snapshot): that drift must still be found by the next
+        listing.
+        """
+        with self._transaction() as connection:
+            if not self._is_built(connection):
+                # The first listing will scan the whole store
+                return
+            if key is None:
+                connection.execute("DELETE FROM files WHERE filepath = ?", (filepath,))
+            else:
+                connection.execute(
+                    "INSERT OR REPLACE INTO files (filepath, key, mtime) VALUES (?, ?, ?)",
+                    (
+                        filepath,
+                        json.dumps(list(key)),
+                        os.stat(self._full_path(filepath)).st_mtime,
+                    ),
+                )
+            for directory in self._ancestors(filepath):
+                full_path = self._full_path(directory)
+                if not os.path.isdir(full_path):
+                    connection.execute(
+                        "DELETE FROM directories WHERE path = ?", (directory,)
+                    )
+                    continue
+                recorded = connection.execute(
+                    "SELECT mtime_ns FROM directories WHERE path = ?", (directory,)
+                ).fetchone()
+                mtime_before = snapshot.get(directory)
+                if mtime_before is None or (
+                    recorded is not None and recorded[0] == mtime_before
+                ):
+                    connection.execute(
+                        "INSERT OR REPLACE INTO directories (path, mtime_ns) VALUES (?, ?)",
+                        (directory, os.stat(full_path).st_mtime_ns),
+                    )
@@ -1,28 +1,21 @@
 import logging
+import threading
+import time
 from string import Template
+from typing import List, Optional, Tuple
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.data_context_key import StringKey
 from great_expectations.data_context.store.store import Store
+from great_expectations.util import get_sqlalchemy_engine
 
 try:
     import sqlalchemy
-    from sqlalchemy import (
-        Column,
-        MetaData,
-        String,
-        Table,
-        and_,
-        column,
-        create_engine,
-        select,
-        text,
-    )
+    from sqlalchemy import Column, MetaData, String, Table, and_, column, select, text
     from sqlalchemy.engine.url import URL
     from sqlalchemy.exc import SQLAlchemyError
 except ImportError:
     sqlalchemy = None
-    create_engine = None
 
 
 logger = logging.getLogger(__name__)
@@ -30,7 +23,12 @@ logger = logging.getLogger(__name__)
 
 class SqlAlchemyQueryStore(Store):
     """SqlAlchemyQueryStore stores queries by name, and makes it possible to retrieve the resulting value by query
-    name."""
+    name.
+
+    Results fetched in a batch with get_query_results are kept for query_result_cache_ttl seconds, so that the
+    evaluation parameters of several suites validated together only run each query once. The connection pool of the
+    engine can be tuned with ``pool_options`` (see great_expectations.util.SqlAlchemyEngineRegistry).
+    """
 
     _key_class = StringKey
 
@@ -41,6 +39,8 @@ class SqlAlchemyQueryStore(Store):
         store_backend=None,
         runtime_environment=None,
         store_name=None,
+        query_result_cache_ttl=30,
+        pool_options=None,
     ):
         if not sqlalchemy:
             raise ge_exceptions.DataContextError(
@@ -74,11 +74,17 @@ class SqlAlchemyQueryStore(Store):
         if "engine" in credentials:
             self.engine = credentials["engine"]
         elif "url" in credentials:
-            self.engine = create_engine(credentials["url"])
+            self.engine = get_sqlalchemy_engine(
+                credentials["url"], pool_options=pool_options
+            )
         else:
             drivername = credentials.pop("drivername")
             options = URL(drivername, **credentials)
-            self.engine = create_engine(options)
+            self.engine = get_sqlalchemy_engine(options, pool_options=pool_options)
+
+        self._query_result_cache_ttl = query_result_cache_ttl
+        self._query_result_cache = dict()
+        self._query_result_cache_lock = threading.Lock()
 
     def _convert_key(self, key):
         if isinstance(key, str):
@@ -91,7 +97,71 @@ class SqlAlchemyQueryStore(Store):
     def set(self, key, value):
         return super().set(self._convert_key(key), value)
 
+    def set_many(self, key_value_pairs):
+        return super().set_many(
+            (self._convert_key(key), value) for key, value in key_value_pairs
+        )
+
     def get_query_result(self, key, query_parameters=None):
+        query, return_type = self._build_query(key, query_parameters)
+        res = self.engine.execute(query).fetchall()
+        return self._convert_query_result(res, return_type)
+
+    def get_query_results(
+        self, queries: List[Tuple[str, Optional[dict]]]
+    ) -> List[object]:
+        """Runs several queries in a single session, returning their results in order.
+
+        Identical queries are only run once, and results fetched within the last query_result_cache_ttl seconds are
+        reused.
+
+        Args:
+            queries: a list of (key, query_parameters) tuples, as passed to get_query_result
+
+        Returns:
+            the list of query results
+        """
+        built_queries = [
+            self._build_query(key, query_parameters)
+            for key, query_parameters in queries
+        ]
+        now = time.monotonic()
+        results = dict()
+        with self._query_result_cache_lock:
+            for cache_key, (expires_at, result) in list(
+                self._query_result_cache.items()
+            ):
+                if expires_at <= now:
+                    del self._query_result_cache[cache_key]
+                else:
+                    results[cache_key] = result
+
+        missing_queries = [
+            built_query
+            for built_query in dict.fromkeys(built_queries)
+            if built_query not in results
+        ]
+        if len(missing_queries) > 0:
+            with self.engine.connect() as connection:
+                for query, return_type in missing_queries:
+                    res = connection.execute(query).fetchall()
+                    results[(query, return_type)] = self._convert_query_result(
+                        res, return_type
+                    )
+            logger.debug(
+                f"SqlAlchemyQueryStore ran {len(missing_queries)} queries for {len(queries)} query results"
+            )
+            expires_at = time.monotonic() + self._query_result_cache_ttl
+            with self._query_result_cache_lock:
+                for built_query in missing_queries:
+                    self._query_result_cache[built_query] = (
+                        expires_at,
+                        results[built_query],
+                    )
+
+        return [results[built_query] for built_query in built_queries]
+
+    def _build_query(self, key, query_parameters=None):
         if query_parameters is None:
             query_parameters = {}
         result = self._store_backend.get(self._convert_key(key).to_tuple())
@@ -110,7 +180,10 @@ class SqlAlchemyQueryStore(Store):
         assert query, "Query must be specified to use SqlAlchemyQueryStore"
 
         query = Template(query).safe_substitute(query_parameters)
-        res = self.engine.execute(query).fetchall()
+        return query, return_type
+
+    @staticmethod
+    def _convert_query_result(res, return_type):
         # NOTE: 20200617 - JPC: this approach is probably overly opinionated, but we can
         # adjust based on specific user requests
         res = [val for row in res for val in row]
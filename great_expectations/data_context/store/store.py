@@ -134,6 +134,24 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value)
             )
 
+    def set_many(self, key_value_pairs):
+        """Sets several keys at once, letting the store backend write them in bulk.
+
+        Args:
+            key_value_pairs: an iterable of (key, value) tuples
+
+        Returns:
+            the list of values returned by the store backend for each key
+        """
+        items = []
+        for key, value in key_value_pairs:
+            if key == StoreBackend.STORE_BACKEND_ID_KEY:
+                items.append((key, value))
+            else:
+                self._validate_key(key)
+                items.append((self.key_to_tuple(key), self.serialize(key, value)))
+        return self._store_backend.set_many(items)
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
@@ -17,6 +17,8 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Implementations may also override _set_many to write several keys in bulk.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -119,6 +121,27 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def set_many(self, key_value_pairs, **kwargs):
+        """Sets several keys at once.
+
+        Args:
+            key_value_pairs: a list of (key, value) tuples
+
+        Returns:
+            the list of values returned by the implementing setter for each key
+        """
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -162,6 +185,9 @@ class StoreBackend(metaclass=ABCMeta):
     def _set(self, key, value, **kwargs):
         raise NotImplementedError
 
+    def _set_many(self, key_value_pairs, **kwargs):
+        return [self._set(key, value, **kwargs) for key, value in key_value_pairs]
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs):
         raise NotImplementedError
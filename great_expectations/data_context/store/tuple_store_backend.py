@@ -1,11 +1,17 @@
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
+import datetime
 import logging
 import os
 import random
 import re
 import shutil
+import sqlite3
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 
+from great_expectations.data_context.store.filesystem_key_index import (
+    FilesystemKeyIndex,
+)
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 
@@ -21,6 +27,9 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     three components.
     """
 
+    # Each key is written to its own file or object, so bulk writes are issued from a pool of this many threads
+    SET_MANY_MAX_WORKERS = 8
+
     def __init__(
         self,
         filepath_template=None,
@@ -90,6 +99,21 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 )
             )
 
+    def _set_many(self, key_value_pairs, **kwargs):
+        return self._map_set_many(
+            lambda key_value_pair: self._set(*key_value_pair, **kwargs),
+            key_value_pairs,
+        )
+
+    def _map_set_many(self, set_fn, key_value_pairs):
+        """Calls set_fn on each (key, value) tuple from a thread pool, returning the results in order."""
+        if len(key_value_pairs) <= 1:
+            return [set_fn(key_value_pair) for key_value_pair in key_value_pairs]
+        with ThreadPoolExecutor(
+            max_workers=min(self.SET_MANY_MAX_WORKERS, len(key_value_pairs))
+        ) as executor:
+            return list(executor.map(set_fn, key_value_pairs))
+
     def _convert_key_to_filepath(self, key):
         # NOTE: This method uses a hard-coded forward slash as a separator,
         # and then replaces that with a platform-specific separator if requested (the default)
@@ -210,6 +234,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    With use_key_index, keys are listed from a :py:class:`FilesystemKeyIndex` sidecar file that the store's writes keep
+    up to date, instead of walking the base directory; see FilesystemKeyIndex for how changes made by others are found.
     """
 
     def __init__(
@@ -226,6 +253,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        use_key_index=False,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -256,6 +284,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 self.full_base_directory = os.path.join(root_directory, base_directory)
 
         os.makedirs(str(os.path.dirname(self.full_base_directory)), exist_ok=True)
+        self._key_index = (
+            FilesystemKeyIndex(self.full_base_directory) if use_key_index else None
+        )
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -278,62 +309,134 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     def _set(self, key, value, **kwargs):
         if not isinstance(key, tuple):
             key = key.to_tuple()
-        filepath = os.path.join(
-            self.full_base_directory, self._convert_key_to_filepath(key)
-        )
+        relative_filepath = os.path.normpath(self._convert_key_to_filepath(key))
+        filepath = os.path.join(self.full_base_directory, relative_filepath)
         path, filename = os.path.split(filepath)
 
+        if self._key_index is not None:
+            snapshot = self._key_index.snapshot(relative_filepath)
         os.makedirs(str(path), exist_ok=True)
         with open(filepath, "wb") as outfile:
             if isinstance(value, str):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
+        if self._key_index is not None:
+            self._key_index.record(
+                relative_filepath, self._get_listed_key(relative_filepath), snapshot
+            )
         return filepath
 
     def _move(self, source_key, dest_key, **kwargs):
-        source_path = os.path.join(
-            self.full_base_directory, self._convert_key_to_filepath(source_key)
+        relative_source_path = os.path.normpath(
+            self._convert_key_to_filepath(source_key)
         )
+        source_path = os.path.join(self.full_base_directory, relative_source_path)
 
-        dest_path = os.path.join(
-            self.full_base_directory, self._convert_key_to_filepath(dest_key)
-        )
+        relative_dest_path = os.path.normpath(self._convert_key_to_filepath(dest_key))
+        dest_path = os.path.join(self.full_base_directory, relative_dest_path)
         dest_dir, dest_filename = os.path.split(dest_path)
 
         if os.path.exists(source_path):
+            if self._key_index is not None:
+                source_snapshot = self._key_index.snapshot(relative_source_path)
+                dest_snapshot = self._key_index.snapshot(relative_dest_path)
             os.makedirs(dest_dir, exist_ok=True)
             shutil.move(source_path, dest_path)
+            if self._key_index is not None:
+                self._key_index.record(relative_source_path, None, source_snapshot)
+                self._key_index.record(
+                    relative_dest_path,
+                    self._get_listed_key(relative_dest_path),
+                    dest_snapshot,
+                )
             return dest_key
 
         return False
 
-    def list_keys(self, prefix=()):
-        key_list = []
+    def list_keys(self, prefix=(), modified_after=None, modified_before=None):
+        """Lists the keys of the store that start with prefix.
+
+        Args:
+            prefix: a tuple of leading key elements
+            modified_after: only list keys of files modified at or after this datetime or timestamp
+            modified_before: only list keys of files modified before this datetime or timestamp
+
+        Returns:
+            a list of keys
+        """
+        if self._key_index is not None:
+            try:
+                return self._key_index.list_keys(
+                    prefix,
+                    self._scan_keys,
+                    modified_after=modified_after,
+                    modified_before=modified_before,
+                )
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"Unable to use the key index of {self.full_base_directory}; scanning the directory instead. "
+                    f"Error: {str(e)}"
+                )
+
+        entries, _ = self._scan_keys(prefix)
+        if modified_after is not None or modified_before is not None:
+            modified_after, modified_before = [
+                value.timestamp() if isinstance(value, datetime.datetime) else value
+                for value in (modified_after, modified_before)
+            ]
+            entries = [
+                (filepath, key, mtime)
+                for filepath, key, mtime in entries
+                if (modified_after is None or mtime >= modified_after)
+                and (modified_before is None or mtime < modified_before)
+            ]
+        return [key for filepath, key, mtime in entries]
+
+    def _scan_keys(self, prefix=()):
+        """Walks the directory of prefix.
+
+        Returns:
+            the (filepath, key, mtime) tuples of the files of the store under prefix, and the st_mtime_ns of the
+            directories under prefix by relative path
+        """
+        entries = []
+        directory_mtimes = {}
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)
         ):
+            relative_root = os.path.relpath(root, self.full_base_directory)
+            if relative_root == ".":
+                relative_root = ""
+            directory_mtimes[relative_root] = os.stat(root).st_mtime_ns
             for file_ in files:
                 full_path, file_name = os.path.split(os.path.join(root, file_))
                 relative_path = os.path.relpath(full_path, self.full_base_directory,)
                 if relative_path == ".":
+                    if FilesystemKeyIndex.is_index_file(file_name):
+                        continue
                     filepath = file_name
                 else:
                     filepath = os.path.join(relative_path, file_name)
 
-                if self.filepath_prefix and not filepath.startswith(
-                    self.filepath_prefix
-                ):
-                    continue
-                elif self.filepath_suffix and not filepath.endswith(
-                    self.filepath_suffix
-                ):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
+                key = self._get_listed_key(filepath)
+                if key:
+                    entries.append(
+                        (filepath, key, os.path.getmtime(os.path.join(root, file_)))
+                    )
 
-        return key_list
+        return entries, directory_mtimes
+
+    def _get_listed_key(self, filepath):
+        """Returns the key list_keys lists for the file at filepath, or None if the file is not listed."""
+        if self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
+            return None
+        elif self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
+            return None
+        key = self._convert_filepath_to_key(filepath)
+        if key and not self.is_ignored_key(key):
+            return key
+        return None
 
     def rrmdir(self, mroot, curpath):
         """
@@ -353,14 +456,17 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
-        filepath = os.path.join(
-            self.full_base_directory, self._convert_key_to_filepath(key)
-        )
+        relative_filepath = os.path.normpath(self._convert_key_to_filepath(key))
+        filepath = os.path.join(self.full_base_directory, relative_filepath)
 
         if os.path.exists(filepath):
+            if self._key_index is not None:
+                snapshot = self._key_index.snapshot(relative_filepath)
             d_path = os.path.dirname(filepath)
             os.remove(filepath)
             self.rrmdir(self.full_base_directory, d_path)
+            if self._key_index is not None:
+                self._key_index.record(relative_filepath, None, snapshot)
             return True
         return False
 
@@ -503,6 +609,43 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         return s3_object_key
 
+    def _set_many(
+        self,
+        key_value_pairs,
+        content_encoding="utf-8",
+        content_type="application/json",
+    ):
+        import boto3
+
+        # Unlike resources, clients are thread-safe: a single client is shared by all the writes
+        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+
+        def put_object(key_value_pair):
+            key, value = key_value_pair
+            s3_object_key = self._build_s3_object_key(key)
+            try:
+                if isinstance(value, str):
+                    s3.put_object(
+                        Bucket=self.bucket,
+                        Key=s3_object_key,
+                        Body=value.encode(content_encoding),
+                        ContentEncoding=content_encoding,
+                        ContentType=content_type,
+                    )
+                else:
+                    s3.put_object(
+                        Bucket=self.bucket,
+                        Key=s3_object_key,
+                        Body=value,
+                        ContentType=content_type,
+                    )
+            except s3.exceptions.ClientError as e:
+                logger.debug(str(e))
+                raise StoreBackendError("Unable to set object in s3.")
+            return s3_object_key
+
+        return self._map_set_many(put_object, key_value_pairs)
+
     def _move(self, source_key, dest_key, **kwargs):
         import boto3
 
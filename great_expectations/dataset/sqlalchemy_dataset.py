@@ -19,7 +19,7 @@ from great_expectations.dataset.util import (
     get_approximate_percentile_disc_sql,
     get_sql_dialect_floating_point_infinity_value,
 )
-from great_expectations.util import import_library_module
+from great_expectations.util import get_sqlalchemy_engine, import_library_module
 
 from .dataset import Dataset
 from .pandas_dataset import PandasDataset
@@ -477,7 +477,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             self.engine = engine
         else:
             try:
-                self.engine = sa.create_engine(connection_string)
+                self.engine = get_sqlalchemy_engine(connection_string)
             except Exception as err:
                 # Currently we do no error handling if the engine doesn't work out of the box.
                 raise err
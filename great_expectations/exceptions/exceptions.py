@@ -316,6 +316,10 @@ class ExecutionEngineError(DataContextError):
         super().__init__(self.message)
 
 
+class ChunkedDataNotSupportedError(ExecutionEngineError):
+    pass
+
+
 class PartitionQueryError(DataContextError):
     def __init__(self, message):
         self.message = message
@@ -1,11 +1,20 @@
+import asyncio
 import copy
+import functools
 import logging
+import os
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ruamel.yaml import YAML
 
 from great_expectations.core.batch import Batch, BatchSpec
+from great_expectations.core.id_dict import IDDict
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import (
@@ -18,6 +27,49 @@ logger = logging.getLogger(__name__)
 yaml = YAML()
 yaml.default_flow_style = False
 
+_CACHE_MISS = object()
+
+# Metric values of these types cannot be modified in place, so the metric cache hands them out without copying them
+_IMMUTABLE_METRIC_VALUE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+# Tokens identifying the objects batch data is loaded from, keyed by their id(). An entry is dropped when its object is
+# garbage collected, so that an object later reusing the id gets a token of its own.
+_batch_data_tokens: Dict[int, Tuple[weakref.ref, str]] = {}
+_batch_data_tokens_lock = threading.RLock()
+
+
+def _get_batch_data_token(batch_data: Any) -> str:
+    """Returns a token identifying batch_data: the same object always gets the same token (so that execution engines
+    validating it can share metrics), and no two objects alive at the same time share one."""
+    key = id(batch_data)
+    with _batch_data_tokens_lock:
+        entry = _batch_data_tokens.get(key)
+        if entry is not None and entry[0]() is batch_data:
+            return entry[1]
+        token = uuid.uuid4().hex
+
+        def forget_token(_, key=key, token=token):
+            with _batch_data_tokens_lock:
+                if _batch_data_tokens.get(key, (None, None))[1] == token:
+                    del _batch_data_tokens[key]
+
+        try:
+            _batch_data_tokens[key] = (weakref.ref(batch_data, forget_token), token)
+        except TypeError:
+            # The object cannot be weakly referenced, so its token cannot be reused safely
+            pass
+        return token
+
+
+def _copy_metric_value(value: Any) -> Any:
+    if isinstance(value, _IMMUTABLE_METRIC_VALUE_TYPES):
+        return value
+    try:
+        return copy.deepcopy(value)
+    except (TypeError, copy.Error):
+        # e.g. values holding connections or locks, which are shared as they are
+        return value
+
 
 class NoOpDict:
     def __getitem__(self, item):
@@ -27,8 +79,91 @@ class NoOpDict:
         return None
 
 
+class MetricCache:
+    """A size-bounded, thread-safe cache of resolved metric values.
+
+    Entries are keyed by (batch_id, batch data token, MetricConfiguration.id), so that the same metric is only
+    computed once per batch, no matter how many expectations (or expectation suites) depend on it. A token identifying
+    the loaded batch data is part of the key because batch ids do not identify the data: e.g. every Batch built without
+    a batch_definition has the same id. When the cache is full, the least recently used entry is evicted. A max_size of
+    0 disables the cache.
+
+    Values are copied when they are stored and when they are returned (except for immutable scalars), so that callers
+    modifying a metric value do not change the value other callers get. A cache created with copy_values=False holds
+    the values themselves, e.g. lazy DataFrames which must be shared rather than copied.
+    """
+
+    def __init__(self, max_size: int = 1000, copy_values: bool = True):
+        self._max_size = max_size
+        self._copy_values = copy_values
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """Returns the cached value for key (marking it as recently used), or default on a miss."""
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._cache.move_to_end(key)
+            self._hits += 1
+        if not self._copy_values:
+            return value
+        return _copy_metric_value(value)
+
+    def __setitem__(self, key: Tuple, value: Any) -> None:
+        if self._max_size <= 0:
+            return
+        if self._copy_values:
+            value = _copy_metric_value(value)
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def __contains__(self, key: Tuple) -> bool:
+        with self._lock:
+            return key in self._cache
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def invalidate_batch(self, batch_id: str) -> None:
+        """Drops all cached metrics computed for batch_id."""
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == batch_id]:
+                del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    @property
+    def statistics(self) -> dict:
+        return {
+            "size": len(self._cache),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+
 class ExecutionEngine:
     recognized_batch_spec_defaults = set()
+    default_metric_cache_max_size = 1000
 
     def __init__(
         self,
@@ -37,18 +172,22 @@ class ExecutionEngine:
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache_max_size=None,
     ):
         self.name = name
         self._validator = validator
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
-        # (e.g. self.spark_df) over the lifetime of the dataset instance
+        # (e.g. self.spark_df) over the lifetime of the dataset instance; loading new batch data under an existing
+        # batch_id invalidates the metrics cached for that batch.
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache = {}
+        if not self._caching:
+            max_size = 0
+        elif metric_cache_max_size is None:
+            max_size = self.default_metric_cache_max_size
         else:
-            self._metric_cache = NoOpDict()
+            max_size = metric_cache_max_size
+        self._metric_cache = MetricCache(max_size=max_size)
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -66,6 +205,8 @@ class ExecutionEngine:
         }
 
         self._batch_data_dict = {}
+        # Tokens identifying the objects the batch data was loaded from, which are part of the metric cache keys
+        self._batch_data_tokens = {}
         if batch_data_dict is None:
             batch_data_dict = {}
         self._load_batch_data_from_dict(batch_data_dict)
@@ -117,6 +258,19 @@ class ExecutionEngine:
     def config(self) -> dict:
         return self._config
 
+    @property
+    def metric_cache(self) -> MetricCache:
+        """The cache of resolved metric values, keyed by batch_id, loaded batch data and metric id.
+
+        Execution engines validating the same batches may share a single cache (e.g. across the validations of an
+        ActionListValidationOperator run) by assigning it to each of them.
+        """
+        return self._metric_cache
+
+    @metric_cache.setter
+    def metric_cache(self, metric_cache: MetricCache) -> None:
+        self._metric_cache = metric_cache
+
     def get_batch_data(self, batch_spec: BatchSpec,) -> Any:
         """Interprets batch_data and returns the appropriate data.
 
@@ -135,7 +289,9 @@ class ExecutionEngine:
         Loads the specified batch_data into the execution engine
         """
         self._batch_data_dict[batch_id] = self._get_typed_batch_data(batch_data)
+        self._batch_data_tokens[batch_id] = _get_batch_data_token(batch_data)
         self._active_batch_data_id = batch_id
+        self._metric_cache.invalidate_batch(batch_id)
 
     def _load_batch_data_from_dict(self, batch_data_dict):
         """
@@ -149,6 +305,11 @@ class ExecutionEngine:
     def _get_typed_batch_data(self, batch_data):
         return batch_data
 
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Whether independent metrics may safely be resolved on several threads at the same time."""
+        return True
+
     def resolve_metrics(
         self,
         metrics_to_resolve: Iterable[MetricConfiguration],
@@ -158,6 +319,13 @@ class ExecutionEngine:
         """resolve_metrics is the main entrypoint for an execution engine. The execution engine will compute the value
         of the provided metrics.
 
+        Metrics found in the engine's metric cache for their batch are not recomputed, and newly-resolved metrics are
+        added to the cache.
+
+        If runtime_configuration includes an enabled "concurrency" configuration (e.g. {"concurrency": {"enabled": True,
+        "max_workers": 8}}) and the engine supports it, VALUE metrics and the metric bundle of each compute domain are
+        resolved concurrently on a thread pool. The resolved values are identical to those of serial resolution.
+
         Args:
             metrics_to_resolve: the metrics to evaluate
             metrics: already-computed metrics currently available to the engine
@@ -166,15 +334,165 @@ class ExecutionEngine:
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """
+        (
+            resolved_metrics,
+            metric_fn_calls,
+            metric_fn_bundle,
+            metric_cache_keys,
+        ) = self._prepare_metric_resolution(
+            metrics_to_resolve, metrics, runtime_configuration
+        )
+
+        grouped_resolved_metrics = self._resolve_metric_fn_call_group(metric_fn_calls)
+        resolved_metrics.update(grouped_resolved_metrics)
+        metric_fn_calls = self._get_ungrouped_metric_fn_calls(
+            metric_fn_calls, grouped_resolved_metrics
+        )
+
+        max_workers = self._get_concurrent_resolution_max_workers(runtime_configuration)
+        if max_workers is None:
+            for metric_to_resolve, metric_fn, metric_provider_kwargs in metric_fn_calls:
+                resolved_metrics[metric_to_resolve.id] = metric_fn(
+                    **metric_provider_kwargs
+                )
+            if len(metric_fn_bundle) > 0:
+                resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                metric_futures = [
+                    (
+                        metric_to_resolve.id,
+                        executor.submit(metric_fn, **metric_provider_kwargs),
+                    )
+                    for metric_to_resolve, metric_fn, metric_provider_kwargs in metric_fn_calls
+                ]
+                bundle_futures = [
+                    executor.submit(self.resolve_metric_bundle, domain_bundle)
+                    for domain_bundle in self._split_metric_fn_bundle_by_domain(
+                        metric_fn_bundle
+                    )
+                ]
+                for metric_id, metric_future in metric_futures:
+                    resolved_metrics[metric_id] = metric_future.result()
+                for bundle_future in bundle_futures:
+                    resolved_metrics.update(bundle_future.result())
+
+        self._cache_resolved_metrics(resolved_metrics, metric_cache_keys)
+        return resolved_metrics
+
+    async def resolve_metrics_async(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """An awaitable counterpart of resolve_metrics. The VALUE metrics and the metric bundle of each compute domain
+        are submitted together to a thread pool, so that their queries run concurrently (each on its own connection for
+        pooled engines), and are awaited together.
+
+        The size of the thread pool can be set with runtime_configuration {"concurrency": {"max_workers": n}}. Engines
+        which do not support concurrent metric resolution resolve the metrics one at a time, without blocking the event
+        loop.
+
+        Args:
+            metrics_to_resolve: the metrics to evaluate
+            metrics: already-computed metrics currently available to the engine
+            runtime_configuration: runtime configuration information
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
+        """
+        (
+            resolved_metrics,
+            metric_fn_calls,
+            metric_fn_bundle,
+            metric_cache_keys,
+        ) = self._prepare_metric_resolution(
+            metrics_to_resolve, metrics, runtime_configuration
+        )
+
+        max_workers = self._get_async_resolution_max_workers(runtime_configuration)
+        if max_workers > 1:
+            domain_bundles = self._split_metric_fn_bundle_by_domain(metric_fn_bundle)
+        elif len(metric_fn_bundle) > 0:
+            domain_bundles = [metric_fn_bundle]
+        else:
+            domain_bundles = []
+
+        loop = asyncio.get_event_loop()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            grouped_resolved_metrics = await loop.run_in_executor(
+                executor, self._resolve_metric_fn_call_group, metric_fn_calls
+            )
+            resolved_metrics.update(grouped_resolved_metrics)
+            metric_fn_calls = self._get_ungrouped_metric_fn_calls(
+                metric_fn_calls, grouped_resolved_metrics
+            )
+
+            metric_values = asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        executor, functools.partial(metric_fn, **metric_provider_kwargs)
+                    )
+                    for _, metric_fn, metric_provider_kwargs in metric_fn_calls
+                ]
+            )
+            bundle_values = asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        executor, self.resolve_metric_bundle, domain_bundle
+                    )
+                    for domain_bundle in domain_bundles
+                ]
+            )
+            metric_values, bundle_values = await asyncio.gather(
+                metric_values, bundle_values
+            )
+
+        for (metric_to_resolve, _, _), metric_value in zip(
+            metric_fn_calls, metric_values
+        ):
+            resolved_metrics[metric_to_resolve.id] = metric_value
+        for bundle_value in bundle_values:
+            resolved_metrics.update(bundle_value)
+
+        self._cache_resolved_metrics(resolved_metrics, metric_cache_keys)
+        return resolved_metrics
+
+    def _prepare_metric_resolution(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple, Any]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[dict, List[tuple], List[tuple], dict]:
+        """Sorts metrics_to_resolve into the metrics already in the metric cache, the VALUE metric functions to call and
+        the metric bundle, and returns them together with the metric cache keys of the metrics to compute."""
         if metrics is None:
             metrics = dict()
         resolved_metrics = dict()
 
         metric_fn_bundle = []
+        metric_fn_calls = []
+        metric_cache_keys = dict()
         for metric_to_resolve in metrics_to_resolve:
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
             )
+            # Partial function results (e.g. the full boolean Series of a pandas map metric) are only inputs of other
+            # metrics, and are too large to keep around, so only metric values are cached
+            metric_fn_type = getattr(
+                metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
+            )
+            if metric_fn_type == MetricFunctionTypes.VALUE:
+                metric_cache_key = self._get_metric_cache_key(metric_to_resolve)
+            else:
+                metric_cache_key = None
+            if metric_cache_key is not None:
+                cached_value = self._metric_cache.get(metric_cache_key, _CACHE_MISS)
+                if cached_value is not _CACHE_MISS:
+                    resolved_metrics[metric_to_resolve.id] = cached_value
+                    continue
+                metric_cache_keys[metric_to_resolve.id] = metric_cache_key
             try:
                 metric_dependencies = {
                     k: metrics[v.id]
@@ -211,10 +529,15 @@ class ExecutionEngine:
                     )
                 )
                 continue
-            metric_fn_type = getattr(
-                metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
+            bundled_metric_fn = self._get_bundled_metric_fn(
+                metric_fn, metric_provider_kwargs
             )
-            if metric_fn_type in [
+            if bundled_metric_fn is not None:
+                metric_fn_bundle.append(
+                    (metric_to_resolve, *bundled_metric_fn, metric_provider_kwargs)
+                )
+                continue
+            if metric_fn_type not in [
                 MetricPartialFunctionTypes.MAP_SERIES,
                 MetricPartialFunctionTypes.MAP_FN,
                 MetricPartialFunctionTypes.MAP_CONDITION_FN,
@@ -222,27 +545,113 @@ class ExecutionEngine:
                 MetricPartialFunctionTypes.WINDOW_FN,
                 MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
                 MetricPartialFunctionTypes.AGGREGATE_FN,
+                MetricFunctionTypes.VALUE,
             ]:
-                # NOTE: 20201026 - JPC - we could use the fact that these metric functions return functions rather
-                # than data to optimize compute in the future
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            elif metric_fn_type == MetricFunctionTypes.VALUE:
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            else:
                 logger.warning(
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
                 )
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-        if len(metric_fn_bundle) > 0:
-            resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
+            # NOTE: 20201026 - JPC - we could use the fact that partial metric functions return functions rather
+            # than data to optimize compute in the future
+            metric_fn_calls.append(
+                (metric_to_resolve, metric_fn, metric_provider_kwargs)
+            )
 
-        return resolved_metrics
+        return resolved_metrics, metric_fn_calls, metric_fn_bundle, metric_cache_keys
+
+    @staticmethod
+    def _get_ungrouped_metric_fn_calls(
+        metric_fn_calls: List[tuple], grouped_resolved_metrics: dict
+    ) -> List[tuple]:
+        if len(grouped_resolved_metrics) == 0:
+            return metric_fn_calls
+        return [
+            metric_fn_call
+            for metric_fn_call in metric_fn_calls
+            if metric_fn_call[0].id not in grouped_resolved_metrics
+        ]
+
+    def _cache_resolved_metrics(
+        self, resolved_metrics: dict, metric_cache_keys: dict
+    ) -> None:
+        for metric_id, metric_cache_key in metric_cache_keys.items():
+            if metric_id in resolved_metrics:
+                self._metric_cache[metric_cache_key] = resolved_metrics[metric_id]
+
+    def _get_metric_cache_key(self, metric: MetricConfiguration) -> Optional[Tuple]:
+        """Returns the metric cache key (batch_id, batch data token, metric id) for metric, or None if its batch cannot
+        be determined.
+
+        Since batch ids do not identify the data, the key includes the token of the object the batch data was loaded
+        from, so execution engines sharing a metric cache only share the metrics of the same data.
+        """
+        batch_id = (
+            metric.metric_domain_kwargs.get("batch_id") or self.active_batch_data_id
+        )
+        if batch_id is None or batch_id not in self._batch_data_tokens:
+            return None
+        return batch_id, self._batch_data_tokens[batch_id], metric.id
+
+    def _get_bundled_metric_fn(
+        self, metric_fn: Callable, metric_provider_kwargs: dict
+    ) -> Optional[Tuple[Any, dict, dict]]:
+        """Returns the (metric_fn, compute_domain_kwargs, accessor_domain_kwargs) partial used to resolve a value metric
+        as part of a metric bundle, or None if the engine resolves the metric on its own."""
+        return None
+
+    def _resolve_metric_fn_call_group(self, metric_fn_calls: List[tuple]) -> dict:
+        """Resolves together the value metrics of metric_fn_calls that the engine can compute in fewer trips to the
+        compute engine than one per metric, and returns their values by metric id. The other metrics are resolved one
+        by one by resolve_metrics."""
+        return dict()
+
+    def _get_concurrent_resolution_max_workers(
+        self, runtime_configuration: Optional[dict] = None
+    ) -> Optional[int]:
+        """Returns the number of threads to use for concurrent metric resolution, or None if metrics should be resolved
+        serially."""
+        if runtime_configuration is None:
+            return None
+        concurrency = runtime_configuration.get("concurrency") or {}
+        if not concurrency.get("enabled", False):
+            return None
+        if not self.supports_concurrent_metric_resolution:
+            logger.debug(
+                f"{self.__class__.__name__} does not support concurrent metric resolution; resolving metrics serially."
+            )
+            return None
+        # Default to the same number of workers as ThreadPoolExecutor would pick
+        max_workers = concurrency.get("max_workers") or min(
+            32, (os.cpu_count() or 1) + 4
+        )
+        if max_workers <= 1:
+            return None
+        return max_workers
+
+    def _get_async_resolution_max_workers(
+        self, runtime_configuration: Optional[dict] = None
+    ) -> int:
+        """Returns the number of threads to use in resolve_metrics_async; concurrency does not need to be enabled, but
+        engines which do not support concurrent metric resolution (e.g. while a batch is materialized in a
+        connection-scoped temporary table) always use a single thread."""
+        if not self.supports_concurrent_metric_resolution:
+            return 1
+        concurrency = (runtime_configuration or {}).get("concurrency") or {}
+        return max(
+            concurrency.get("max_workers") or min(32, (os.cpu_count() or 1) + 4), 1
+        )
+
+    @staticmethod
+    def _split_metric_fn_bundle_by_domain(metric_fn_bundle: List[tuple]) -> List[list]:
+        """Splits a metric_fn_bundle into one bundle per distinct compute domain, preserving order."""
+        domain_bundles: Dict[str, list] = dict()
+        for bundled_metric in metric_fn_bundle:
+            compute_domain_kwargs = bundled_metric[2]
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            domain_bundles.setdefault(compute_domain_kwargs.to_id(), []).append(
+                bundled_metric
+            )
+        return list(domain_bundles.values())
 
     def resolve_metric_bundle(self, metric_fn_bundle):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
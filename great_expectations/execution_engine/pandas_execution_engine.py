@@ -3,9 +3,11 @@ import datetime
 import hashlib
 import logging
 import random
+from collections import defaultdict
 from functools import partial
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from ruamel.yaml.compat import StringIO
 
@@ -27,15 +29,19 @@ except ImportError:
     boto3 = None
 
 from ..core.batch import BatchMarkers
-from ..core.id_dict import BatchSpec
+from ..core.id_dict import BatchSpec, IDDict
 from ..datasource.util import hash_pandas_dataframe
 from ..exceptions import BatchSpecError, GreatExpectationsError, ValidationError
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from ..validator.validation_graph import MetricConfiguration
+from .execution_engine import ExecutionEngine, MetricCache, MetricDomainTypes
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
 
+# Bound on the number of row_condition results and non-null masks kept by each PandasExecutionEngine
+ROW_CONDITION_CACHE_MAX_SIZE = 128
+
 
 class PandasBatchData(pd.DataFrame):
     # @property
@@ -43,6 +49,191 @@ class PandasBatchData(pd.DataFrame):
         return self.shape[0]
 
 
+class PandasChunkedBatchData:
+    """Batch data which is read from its source in chunks of rows, rather than held in memory as a single DataFrame.
+
+    Every pass over the data re-reads it from the source one chunk at a time, so memory use is bounded by the chunk
+    size. PandasExecutionEngine keeps table domains lazy, and merges aggregate metrics which support it from per-chunk
+    partial states. Column map metrics (unexpected counts, value counts and the first unexpected values, indices and
+    rows), value counts and histograms over given bins are merged from the chunks as well. Metrics which would need a
+    whole column (or table) in memory, such as exact medians, the COMPLETE lists of unexpected values or conditions
+    which compare values across rows, raise a ChunkedDataNotSupportedError.
+    """
+
+    def __init__(
+        self,
+        chunk_reader_fn: Callable[[], Iterable[pd.DataFrame]],
+        row_condition: Optional[str] = None,
+        condition_parser: Optional[str] = None,
+    ):
+        """
+        Args:
+            chunk_reader_fn: a function returning a new iterator over the chunks of the data each time it is called
+            row_condition: an optional pandas query that rows must satisfy
+            condition_parser: the parser to use to evaluate row_condition
+        """
+        self._chunk_reader_fn = chunk_reader_fn
+        self._row_condition = row_condition
+        self._condition_parser = condition_parser
+        self._first_chunk = None
+        self._row_count = None
+
+    def iter_chunks(
+        self, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Yields the rows satisfying the row_condition of the data, one chunk at a time.
+
+        Args:
+            columns: if given, only these columns are included in the chunks
+        """
+        reader = self._chunk_reader_fn()
+        try:
+            for chunk in reader:
+                if self._row_condition:
+                    chunk = chunk.query(
+                        self._row_condition, parser=self._condition_parser
+                    )
+                if columns is not None:
+                    chunk = chunk[columns]
+                yield chunk
+        finally:
+            if hasattr(reader, "close"):
+                reader.close()
+
+    def filter(
+        self, row_condition: str, condition_parser: str
+    ) -> "PandasChunkedBatchData":
+        """Returns a view of the data restricted to the rows satisfying row_condition; no data is read."""
+        if self._row_condition:
+            row_condition = f"({self._row_condition}) & ({row_condition})"
+        return PandasChunkedBatchData(
+            self._chunk_reader_fn,
+            row_condition=row_condition,
+            condition_parser=condition_parser,
+        )
+
+    def to_dataframe(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Reads the (selected columns of the) data into a single DataFrame."""
+        chunks = list(self.iter_chunks(columns=columns))
+        if len(chunks) == 0:
+            empty_data = self._get_first_chunk().iloc[0:0]
+            return empty_data if columns is None else empty_data[columns]
+        return pd.concat(chunks, ignore_index=True)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        rows = []
+        row_count = 0
+        for chunk in self.iter_chunks():
+            rows.append(chunk.head(n - row_count))
+            row_count += len(rows[-1])
+            if row_count >= n:
+                break
+        if len(rows) == 0:
+            return self._get_first_chunk().iloc[0:0]
+        return pd.concat(rows, ignore_index=True)
+
+    def row_count(self) -> int:
+        if self._row_count is None:
+            self._row_count = sum(len(chunk) for chunk in self.iter_chunks(columns=[]))
+        return self._row_count
+
+    @property
+    def columns(self) -> pd.Index:
+        return self._get_first_chunk().columns
+
+    @property
+    def dtypes(self) -> pd.Series:
+        """The column types inferred by the reader for the first chunk of the data."""
+        return self._get_first_chunk().dtypes
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.row_count(), len(self.columns)
+
+    def _get_first_chunk(self) -> pd.DataFrame:
+        if self._first_chunk is None:
+            reader = self._chunk_reader_fn()
+            try:
+                self._first_chunk = next(iter(reader))
+            except StopIteration:
+                self._first_chunk = pd.DataFrame()
+            finally:
+                if hasattr(reader, "close"):
+                    reader.close()
+        return self._first_chunk
+
+
+class _ColumnReductions:
+    """A column of a compute domain, with the reductions that column aggregate metrics share.
+
+    The non-null mask and the non-null values of the column are computed at most once. For integer and float columns,
+    the count, sum, min, max, mean and sum of squared deviations from the mean of the non-null values are computed
+    together from a single extraction of the values, the first time any of them is needed; as in pandas, the sum, mean
+    and deviations are computed over the values with nulls replaced by zeros.
+    """
+
+    SHARED_REDUCTION_DTYPE_KINDS = "iuf"
+
+    def __init__(self, column: pd.Series):
+        self.column = column
+        self._nonnull_mask = None
+        self._nonnull_column = None
+        self._reductions = None
+
+    @property
+    def nonnull_mask(self) -> pd.Series:
+        if self._nonnull_mask is None:
+            self._nonnull_mask = self.column.notnull()
+        return self._nonnull_mask
+
+    @property
+    def nonnull_column(self) -> pd.Series:
+        if self._nonnull_column is None:
+            self._nonnull_column = self.column[self.nonnull_mask]
+        return self._nonnull_column
+
+    @property
+    def reductions(self) -> Optional[dict]:
+        """The shared reductions of the non-null values, or None if the column is not an integer or float column."""
+        if self._reductions is None:
+            dtype = self.column.dtype
+            if (
+                not isinstance(dtype, np.dtype)
+                or dtype.kind not in self.SHARED_REDUCTION_DTYPE_KINDS
+            ):
+                return None
+            values = self.column.to_numpy()
+            mask = self.nonnull_mask.to_numpy()
+            count = int(mask.sum())
+            if count < len(values):
+                values = np.where(mask, values, 0)
+            if count == 0:
+                self._reductions = {
+                    "count": 0,
+                    "sum": values.sum(),
+                    "min": np.nan,
+                    "max": np.nan,
+                    "mean": np.nan,
+                    "squared_deviations": np.nan,
+                }
+                return self._reductions
+            nonnull_values = values if count == len(values) else values[mask]
+            float_values = values.astype(np.float64, copy=False)
+            mean = float_values.sum() / count
+            squared_deviations = (float_values - mean) ** 2
+            if count < len(values):
+                squared_deviations[~mask] = 0
+            self._reductions = {
+                "count": count,
+                "sum": values.sum(),
+                "min": nonnull_values.min(),
+                "max": nonnull_values.max(),
+                "mean": mean,
+                "squared_deviations": squared_deviations.sum(),
+            }
+        return self._reductions
+
+
 class PandasExecutionEngine(ExecutionEngine):
     """
 PandasExecutionEngine instantiates the great_expectations Expectations API as a subclass of a pandas.DataFrame.
@@ -94,6 +285,12 @@ Notes:
         except (TypeError, AttributeError):
             self._s3 = None
 
+        # Positions of the rows of each batch that satisfy a row_condition, keyed by batch_id and the id of the
+        # condition
+        self._row_condition_cache = MetricCache(max_size=ROW_CONDITION_CACHE_MAX_SIZE)
+        # Non-null masks of the columns of each batch, keyed by batch_id and the id of the column domain
+        self._nonnull_mask_cache = MetricCache(max_size=ROW_CONDITION_CACHE_MAX_SIZE)
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -130,6 +327,22 @@ Notes:
             path: str = batch_spec["path"]
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
 
+            if reader_options.get("chunksize"):
+                # Chunked mode: the file is re-read in chunks whenever metrics are computed, rather than loaded into
+                # memory at once
+                return (
+                    PandasChunkedBatchData(
+                        partial(
+                            self._read_chunks,
+                            batch_spec,
+                            reader_fn,
+                            path,
+                            reader_options,
+                        )
+                    ),
+                    batch_markers,
+                )
+
             batch_data = reader_fn(path, **reader_options)
 
         elif isinstance(batch_spec, S3BatchSpec):
@@ -142,6 +355,10 @@ Notes:
             s3_url = S3Url(batch_spec.get("s3"))
             reader_method: str = batch_spec.get("reader_method")
             reader_options: dict = batch_spec.get("reader_options") or {}
+            if reader_options.get("chunksize"):
+                raise BatchSpecError(
+                    "Reading data in chunks is only supported for a PathBatchSpec."
+                )
 
             s3_object = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
 
@@ -172,6 +389,21 @@ Notes:
 
         return typed_batch_data, batch_markers
 
+    def _read_chunks(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: Callable,
+        path: str,
+        reader_options: dict,
+    ) -> Iterator[pd.DataFrame]:
+        """Reads the data at path in chunks, applying the (row-wise) splitting and sampling methods to each chunk."""
+        reader = reader_fn(path, **reader_options)
+        try:
+            for chunk in reader:
+                yield self._apply_splitting_and_sampling_methods(batch_spec, chunk)
+        finally:
+            reader.close()
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         if batch_spec.get("splitter_method"):
             splitter_fn = getattr(self, batch_spec.get("splitter_method"))
@@ -185,9 +417,63 @@ Notes:
         return batch_data
 
     def _get_typed_batch_data(self, batch_data):
+        if isinstance(batch_data, PandasChunkedBatchData):
+            return batch_data
         typed_batch_data = PandasBatchData(batch_data)
         return typed_batch_data
 
+    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        self._invalidate_row_condition_cache(batch_id)
+
+    def is_chunked(self, domain_kwargs: dict) -> bool:
+        """Whether the batch of domain_kwargs (or the active batch) is read in chunks (see PandasChunkedBatchData)."""
+        batch_id = domain_kwargs.get("batch_id") or self.active_batch_data_id
+        return isinstance(
+            self.loaded_batch_data_dict.get(batch_id), PandasChunkedBatchData
+        )
+
+    def _invalidate_row_condition_cache(self, batch_id: str) -> None:
+        """Drops the row_condition results and the non-null masks cached for batch_id."""
+        self._row_condition_cache.invalidate_batch(batch_id)
+        self._nonnull_mask_cache.invalidate_batch(batch_id)
+
+    def get_chunked_column_domain(
+        self, domain_kwargs: dict
+    ) -> Tuple[PandasChunkedBatchData, dict, dict]:
+        """Returns the compute domain of the column domain domain_kwargs of data read in chunks, without reading it.
+
+        Returns:
+            the PandasChunkedBatchData restricted to the row_condition of the domain, the compute domain kwargs and the
+            accessor domain kwargs (the column)
+        """
+        if "column" not in domain_kwargs:
+            raise GreatExpectationsError("Column not provided in compute_domain_kwargs")
+        data, compute_domain_kwargs, _ = self.get_compute_domain(
+            {key: value for key, value in domain_kwargs.items() if key != "column"},
+            domain_type=MetricDomainTypes.TABLE,
+        )
+        self._check_domain_column(data, domain_kwargs["column"])
+        return data, compute_domain_kwargs, {"column": domain_kwargs["column"]}
+
+    def get_column_nonnull_mask(self, data: pd.DataFrame, domain_kwargs: dict):
+        """Returns a boolean array marking the rows of data, the compute domain of the column domain_kwargs, in which
+        the column is not null.
+
+        When caching is enabled, the mask is computed once per batch and column domain, and shared by all the map
+        metrics evaluated on the column until new data is loaded for the batch.
+        """
+        column = domain_kwargs["column"]
+        if not self._caching:
+            return data[column].notnull().to_numpy()
+        batch_id = domain_kwargs.get("batch_id") or self.active_batch_data_id
+        key = (batch_id, IDDict(domain_kwargs).to_id())
+        nonnull_mask = self._nonnull_mask_cache.get(key)
+        if nonnull_mask is None or len(nonnull_mask) != len(data):
+            nonnull_mask = data[column].notnull().to_numpy()
+            self._nonnull_mask_cache[key] = nonnull_mask
+        return nonnull_mask
+
     @property
     def dataframe(self):
         """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
@@ -301,6 +587,7 @@ Notes:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data
             else:
                 raise ValidationError(
@@ -312,7 +599,8 @@ Notes:
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
-        compute_domain_kwargs = copy.deepcopy(domain_kwargs)
+        # Domain kwargs are only ever added or removed, so a shallow copy suffices
+        compute_domain_kwargs = copy.copy(domain_kwargs)
         accessor_domain_kwargs = dict()
         table = domain_kwargs.get("table", None)
         if table:
@@ -333,8 +621,8 @@ Notes:
                 )
             else:
                 # Querying row condition
-                data = data.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
+                data = self._filter_by_row_condition(
+                    batch_id, data, row_condition, condition_parser
                 )
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
@@ -367,8 +655,17 @@ Notes:
                         )
             return data, compute_domain_kwargs, accessor_domain_kwargs
 
+        if isinstance(data, PandasChunkedBatchData):
+            # Reading the domain into memory would defeat the bounded memory use of chunked data
+            raise ge_exceptions.ChunkedDataNotSupportedError(
+                f"PandasExecutionEngine cannot compute a metric on the {domain_type.value} domain "
+                f"{IDDict(domain_kwargs).to_id()} of data read in chunks, since it needs the whole domain in memory. "
+                "Only metrics merged from the chunks of the data are supported (see PandasChunkedBatchData); load "
+                "the data without a chunksize reader option to compute other metrics."
+            )
+
         # If user has stated they want a column, checking if one is provided, and
-        elif domain_type == MetricDomainTypes.COLUMN:
+        if domain_type == MetricDomainTypes.COLUMN:
             if "column" in compute_domain_kwargs:
                 accessor_domain_kwargs["column"] = compute_domain_kwargs.pop("column")
             else:
@@ -428,6 +725,167 @@ Notes:
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    def _filter_by_row_condition(
+        self,
+        batch_id: str,
+        data: pd.DataFrame,
+        row_condition: str,
+        condition_parser: str,
+    ) -> pd.DataFrame:
+        """Returns the rows of the batch data that satisfy row_condition.
+
+        When caching is enabled, each row_condition is only evaluated once per batch: the positions of the rows that
+        satisfy it are reused by every compute domain sharing it until new data is loaded for the batch. Every call
+        returns a new DataFrame, so callers may modify it without affecting the others.
+        """
+        if isinstance(data, PandasChunkedBatchData):
+            return data.filter(row_condition, condition_parser)
+        if not self._caching:
+            return data.query(row_condition, parser=condition_parser).reset_index(
+                drop=True
+            )
+        key = (
+            batch_id,
+            IDDict(
+                {"row_condition": row_condition, "condition_parser": condition_parser}
+            ).to_id(),
+        )
+        positions = self._row_condition_cache.get(key)
+        if positions is None:
+            positions = np.flatnonzero(
+                data.eval(row_condition, parser=condition_parser).to_numpy()
+            )
+            self._row_condition_cache[key] = positions
+        return data.take(positions).reset_index(drop=True)
+
+    def _get_bundled_metric_fn(
+        self, metric_fn: Callable, metric_provider_kwargs: dict
+    ) -> Optional[Tuple[Any, dict, dict]]:
+        # Column aggregate metrics are computed from a single evaluation of their compute domain
+        aggregate_partial_fn = getattr(metric_fn, "aggregate_partial_fn", None)
+        if aggregate_partial_fn is None:
+            return None
+        return aggregate_partial_fn(**metric_provider_kwargs)
+
+    def resolve_metric_bundle(
+        self, metric_fn_bundle: Iterable[Tuple[MetricConfiguration, Any, dict, dict]],
+    ) -> dict:
+        """For every metric in a set of metrics to resolve, computes the metric value from a single evaluation of its
+        compute domain, so that a row_condition is only applied once per domain and each column is only accessed once,
+        no matter how many aggregate metrics are computed on it.
+
+            Args:
+                metric_fn_bundle (Iterable[Tuple[MetricConfiguration, Callable, dict, dict]): \
+                    A list of MetricConfigurations together with their aggregate functions (each taking the column
+                    Series as its only argument), their compute domain kwargs, and their accessor domain kwargs.
+
+            Returns:
+                A dictionary of metric ids and their corresponding computed values.
+        """
+        resolved_metrics = dict()
+        for domain_bundle in self._split_metric_fn_bundle_by_domain(metric_fn_bundle):
+            data, compute_domain_kwargs, _ = self.get_compute_domain(
+                domain_bundle[0][2], domain_type="table"
+            )
+            if isinstance(data, PandasChunkedBatchData):
+                resolved_metrics.update(
+                    self._resolve_metric_bundle_in_chunks(data, domain_bundle)
+                )
+                continue
+            columns = dict()
+            for (
+                metric_to_resolve,
+                aggregate_fn,
+                _,
+                accessor_domain_kwargs,
+                _,
+            ) in domain_bundle:
+                column_name = accessor_domain_kwargs["column"]
+                if column_name not in columns:
+                    self._check_domain_column(data, column_name)
+                    columns[column_name] = _ColumnReductions(data[column_name])
+                resolved_metrics[metric_to_resolve.id] = self._resolve_column_aggregate(
+                    aggregate_fn, columns[column_name]
+                )
+            logger.debug(
+                f"PandasExecutionEngine computed {len(domain_bundle)} metrics on {len(columns)} columns of domain_id "
+                f"{IDDict(compute_domain_kwargs).to_id()}"
+            )
+        return resolved_metrics
+
+    @staticmethod
+    def _check_domain_column(data: Any, column_name: str) -> None:
+        # Raises the KeyError that selecting the missing column from a DataFrame would raise
+        if column_name not in data.columns:
+            raise KeyError(column_name)
+
+    @staticmethod
+    def _resolve_column_aggregate(
+        aggregate_fn: Callable, column: _ColumnReductions
+    ) -> Any:
+        """Computes an aggregate metric from the reductions shared by the metrics of its column if it provides a
+        reduction_fn, and from the non-null values of the column if it filters nulls."""
+        reduction_fn = getattr(aggregate_fn, "reduction_fn", None)
+        if reduction_fn is not None:
+            reductions = column.reductions
+            if reductions is not None:
+                return reduction_fn(reductions)
+        if getattr(aggregate_fn, "filter_column_isnull", False):
+            return aggregate_fn.column_fn(column.nonnull_column)
+        return aggregate_fn(column.column)
+
+    @classmethod
+    def _resolve_metric_bundle_in_chunks(
+        cls, data: PandasChunkedBatchData, domain_bundle: List[tuple]
+    ) -> dict:
+        """Resolves the metrics of a single compute domain in one pass over the chunks of the data.
+
+        Aggregates providing a chunk_state_fn and a chunk_merge_fn are merged from the partial states of the chunks (a
+        chunk_state_fn returns None for chunks without any rows to aggregate); the others would need their whole column
+        in memory, and raise a ChunkedDataNotSupportedError.
+        """
+        for metric_to_resolve, aggregate_fn, _, _, _ in domain_bundle:
+            if getattr(aggregate_fn, "chunk_state_fn", None) is None:
+                raise ge_exceptions.ChunkedDataNotSupportedError(
+                    f"The {metric_to_resolve.metric_name} metric cannot be merged from the chunks of the data, and "
+                    "would need its whole column in memory; load the data without a chunksize reader option to "
+                    "compute it."
+                )
+        column_names = list(
+            dict.fromkeys(
+                accessor_domain_kwargs["column"]
+                for _, _, _, accessor_domain_kwargs, _ in domain_bundle
+            )
+        )
+        for column_name in column_names:
+            cls._check_domain_column(data, column_name)
+        chunk_states = defaultdict(list)
+        for chunk in data.iter_chunks(columns=column_names):
+            for (
+                metric_to_resolve,
+                aggregate_fn,
+                _,
+                accessor_domain_kwargs,
+                _,
+            ) in domain_bundle:
+                column = chunk[accessor_domain_kwargs["column"]]
+                chunk_state = aggregate_fn.chunk_state_fn(column)
+                if chunk_state is not None:
+                    chunk_states[metric_to_resolve.id].append(chunk_state)
+
+        resolved_metrics = dict()
+        for (
+            metric_to_resolve,
+            aggregate_fn,
+            _,
+            accessor_domain_kwargs,
+            _,
+        ) in domain_bundle:
+            resolved_metrics[metric_to_resolve.id] = aggregate_fn.chunk_merge_fn(
+                chunk_states[metric_to_resolve.id]
+            )
+        return resolved_metrics
+
     ### Splitter methods for partitioning dataframes ###
     @staticmethod
     def _split_on_whole_table(df,) -> pd.DataFrame:
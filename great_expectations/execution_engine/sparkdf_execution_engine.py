@@ -3,7 +3,9 @@ import datetime
 import hashlib
 import logging
 import uuid
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from collections import defaultdict
+from functools import reduce
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.id_dict import IDDict
@@ -27,10 +29,13 @@ from ..exceptions import (
 )
 from ..expectations.row_conditions import parse_condition_to_spark
 from ..validator.validation_graph import MetricConfiguration
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from .execution_engine import ExecutionEngine, MetricCache, MetricDomainTypes
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of filtered DataFrames (one per batch and row_condition) kept for reuse
+ROW_CONDITION_CACHE_MAX_SIZE = 128
+
 try:
     import pyspark
     import pyspark.sql.functions as F
@@ -44,6 +49,7 @@ try:
         StructField,
         StructType,
     )
+    from pyspark.sql.utils import AnalysisException
 
     class SparkDFBatchData(DataFrame):
         def __init__(self, df):
@@ -57,6 +63,7 @@ except ImportError:
     pyspark = None
     SparkSession = None
     DataFrame = None
+    AnalysisException = None
     F = None
     StructType = (None,)
     StructField = (None,)
@@ -171,6 +178,14 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             )
             self.spark = None
 
+        # Filtered DataFrames of each batch, keyed by batch_id and the id of the row_condition; DataFrames are lazy
+        # plans, which are shared rather than copied
+        self._row_condition_cache = MetricCache(
+            max_size=ROW_CONDITION_CACHE_MAX_SIZE, copy_values=False
+        )
+        # Batch DataFrames persisted by load_batch_data, keyed by batch_id
+        self._persisted_batch_data = dict()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -187,6 +202,37 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
         return self.active_batch_data
 
+    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        self._invalidate_row_condition_cache(batch_id)
+        batch_data = self.loaded_batch_data_dict[batch_id]
+        previous_batch_data = self._persisted_batch_data.get(batch_id)
+        if previous_batch_data is not None and previous_batch_data is not batch_data:
+            self.release_materializations(batch_id=batch_id)
+        if self._persist and previous_batch_data is not batch_data:
+            # Every metric bundle and unexpected values query of a validation scans the batch, so it is kept in
+            # memory instead of being read again from its source each time
+            batch_data.persist()
+            self._persisted_batch_data[batch_id] = batch_data
+
+    def release_materializations(self, batch_id: Optional[str] = None):
+        """Unpersists the DataFrame persisted for batch_id, or for every loaded batch if batch_id is None.
+
+        The batches stay loaded; Spark reads them again from their source if they are used afterwards.
+        """
+        if batch_id is None:
+            batch_ids = list(self._persisted_batch_data.keys())
+        else:
+            batch_ids = [batch_id]
+        for batch_id in batch_ids:
+            batch_data = self._persisted_batch_data.pop(batch_id, None)
+            if batch_data is not None:
+                batch_data.unpersist()
+
+    def _invalidate_row_condition_cache(self, batch_id: str) -> None:
+        """Drops the filtered DataFrames cached for batch_id."""
+        self._row_condition_cache.invalidate_batch(batch_id)
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -351,15 +397,12 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
-                )
+            data = self._filter_by_row_condition(
+                batch_id or self.active_batch_data_id,
+                data,
+                row_condition,
+                condition_parser,
+            )
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -445,6 +488,41 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    def _filter_by_row_condition(
+        self, batch_id: str, data, row_condition: str, condition_parser: str,
+    ):
+        """Returns the rows of the batch data that satisfy row_condition.
+
+        When caching is enabled, the filtered DataFrame of each row_condition is built once per batch, so that the
+        metrics computed on it share a single DataFrame until new data is loaded for the batch. The
+        ROW_CONDITION_CACHE_MAX_SIZE most recently used filtered DataFrames are kept.
+        """
+        key = (
+            batch_id,
+            IDDict(
+                {"row_condition": row_condition, "condition_parser": condition_parser}
+            ).to_id(),
+        )
+        filtered_data = self._row_condition_cache.get(key) if self._caching else None
+        if filtered_data is None:
+            filtered_data = data.filter(
+                self._get_row_condition_column(row_condition, condition_parser)
+            )
+            if self._caching:
+                self._row_condition_cache[key] = filtered_data
+        return filtered_data
+
+    @staticmethod
+    def _get_row_condition_column(row_condition: str, condition_parser: str):
+        """Returns row_condition as a boolean Spark Column."""
+        if condition_parser == "spark":
+            return F.expr(row_condition)
+        elif condition_parser == "great_expectations__experimental__":
+            return parse_condition_to_spark(row_condition)
+        raise GreatExpectationsError(
+            f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
+        )
+
     def add_column_row_condition(
         self, domain_kwargs, column_name=None, filter_null=True, filter_nan=False
     ):
@@ -490,6 +568,11 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         """For each metric name in the given metric_fn_bundle, finds the domain of the metric and calculates it using a
         metric function from the given provider class.
 
+        The aggregates of all the compute domains of a batch (which only differ in their row_condition) are fused into
+        a single Spark job, which scans the batch once: each row is tagged with the indices of the domains whose
+        row_condition it satisfies, and the aggregates of all the domains are computed for every domain in one grouped
+        aggregation.
+
                 Args:
                     metric_fn_bundle - A batch containing MetricEdgeKeys and their corresponding functions
                     metrics (dict) - A dictionary containing metrics and corresponding parameters
@@ -518,32 +601,219 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
                 }
             aggregates[domain_id]["column_aggregates"].append(engine_fn)
             aggregates[domain_id]["ids"].append(metric_to_resolve.id)
+
+        batch_aggregates = defaultdict(list)
         for aggregate in aggregates.values():
-            compute_domain_kwargs = aggregate["domain_kwargs"]
-            df, _, _ = self.get_compute_domain(
-                compute_domain_kwargs, domain_type="identity"
+            batch_id = (
+                aggregate["domain_kwargs"].get("batch_id") or self.active_batch_data_id
+            )
+            batch_aggregates[batch_id].append(aggregate)
+        for domain_aggregates in batch_aggregates.values():
+            if len(domain_aggregates) > 1:
+                resolved_metrics.update(
+                    self._resolve_fused_domain_aggregates(domain_aggregates)
+                )
+            else:
+                resolved_metrics.update(
+                    self._resolve_domain_aggregates(domain_aggregates[0])
+                )
+
+        return resolved_metrics
+
+    def _resolve_domain_aggregates(self, aggregate: dict) -> dict:
+        """Computes the aggregates of a single compute domain in one Spark job."""
+        compute_domain_kwargs = aggregate["domain_kwargs"]
+        df, _, _ = self.get_compute_domain(
+            compute_domain_kwargs, domain_type="identity"
+        )
+        assert len(aggregate["column_aggregates"]) == len(aggregate["ids"])
+        res = df.agg(*aggregate["column_aggregates"]).collect()
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(aggregate["ids"]) == len(
+            res[0]
+        ), "unexpected number of metrics returned"
+        logger.debug(
+            f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
+        )
+        return {id: res[0][idx] for idx, id in enumerate(aggregate["ids"])}
+
+    def _resolve_fused_domain_aggregates(self, domain_aggregates: List[dict]) -> dict:
+        """Computes the aggregates of several compute domains of the same batch in one Spark job.
+
+        Rather than filtering the batch once per domain, the rows of the batch are tagged with the indices of all the
+        domains whose row_condition they satisfy (a row of several domains is repeated once per domain), so that the
+        batch is scanned once. The aggregates themselves are opaque Spark Columns, which cannot be rewritten into
+        aggregates conditional on the row_condition of their domain.
+
+        Domains whose DataFrames do not share the columns of the others, or which have no rows, are computed on their
+        own; so are all the domains if Spark cannot analyze the fused aggregation.
+        """
+        domain_dfs = []
+        domain_conditions = []
+        for aggregate in domain_aggregates:
+            domain_kwargs = aggregate["domain_kwargs"]
+            domain_dfs.append(
+                self.get_compute_domain(
+                    {
+                        key: value
+                        for key, value in domain_kwargs.items()
+                        if key not in ["row_condition", "condition_parser"]
+                    },
+                    domain_type="identity",
+                )[0]
             )
-            assert len(aggregate["column_aggregates"]) == len(aggregate["ids"])
-            condition_ids = []
-            aggregate_cols = []
-            for idx in range(len(aggregate["column_aggregates"])):
-                column_aggregate = aggregate["column_aggregates"][idx]
-                aggregate_id = str(uuid.uuid4())
-                condition_ids.append(aggregate_id)
-                aggregate_cols.append(column_aggregate)
-            res = df.agg(*aggregate_cols).collect()
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(aggregate["ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-            logger.debug(
-                f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
+            if domain_kwargs.get("row_condition"):
+                domain_conditions.append(
+                    self._get_row_condition_column(
+                        domain_kwargs["row_condition"],
+                        domain_kwargs.get("condition_parser"),
+                    )
+                )
+            else:
+                domain_conditions.append(None)
+        fused_indices = [
+            domain_index
+            for domain_index, df in enumerate(domain_dfs)
+            if df.columns == domain_dfs[0].columns
+        ]
+
+        resolved_metrics = dict()
+        fused_rows = dict()
+        aggregate_names = dict()
+        if len(fused_indices) > 1:
+            domain_index_column = f"__domain_index_{uuid.uuid4().hex}"
+            aggregate_columns = []
+            for domain_index in fused_indices:
+                aggregate_names[domain_index] = []
+                for column_aggregate in domain_aggregates[domain_index][
+                    "column_aggregates"
+                ]:
+                    aggregate_name = f"__aggregate_{len(aggregate_columns)}"
+                    aggregate_columns.append(column_aggregate.alias(aggregate_name))
+                    aggregate_names[domain_index].append(aggregate_name)
+            domain_indices = [
+                F.lit(domain_index)
+                if domain_conditions[domain_index] is None
+                else F.when(domain_conditions[domain_index], F.lit(domain_index))
+                for domain_index in fused_indices
+            ]
+            try:
+                fused_df = (
+                    domain_dfs[fused_indices[0]]
+                    .withColumn(
+                        domain_index_column, F.explode(F.array(*domain_indices))
+                    )
+                    .filter(F.col(domain_index_column).isNotNull())
+                )
+                fused_rows = {
+                    row[domain_index_column]: row
+                    for row in fused_df.groupBy(domain_index_column)
+                    .agg(*aggregate_columns)
+                    .collect()
+                }
+            except AnalysisException as e:
+                logger.debug(
+                    f"Unable to fuse the metric bundles of {len(fused_indices)} domains, computing them one by one: {e}"
+                )
+            else:
+                logger.debug(
+                    f"SparkDFExecutionEngine computed {len(aggregate_columns)} metrics on {len(fused_indices)} domains"
+                    f" in a single job"
+                )
+
+        for domain_index, aggregate in enumerate(domain_aggregates):
+            row = fused_rows.get(domain_index)
+            if row is None:
+                # Grouping drops domains without any rows, whose aggregates still need a value (e.g. a count of 0)
+                resolved_metrics.update(self._resolve_domain_aggregates(aggregate))
+                continue
+            for id, aggregate_name in zip(
+                aggregate["ids"], aggregate_names[domain_index]
+            ):
+                resolved_metrics[id] = row[aggregate_name]
+        return resolved_metrics
+
+    def _resolve_metric_fn_call_group(self, metric_fn_calls: List[tuple]) -> dict:
+        """Collects the partial unexpected values of all the unexpected_values metrics of a column in a single Spark
+        job with one limit, instead of one job per metric.
+
+        The sample of a metric is complete if it holds partial_unexpected_count values, or if the job returned fewer
+        rows than its limit; metrics whose sample is not complete are resolved on their own.
+        """
+        column_requests = defaultdict(list)
+        for metric_to_resolve, metric_fn, metric_provider_kwargs in metric_fn_calls:
+            result_format = (metric_provider_kwargs["metric_value_kwargs"] or {}).get(
+                "result_format"
+            )
+            unexpected_condition = metric_provider_kwargs["metrics"].get(
+                "unexpected_condition"
+            )
+            if (
+                not metric_to_resolve.metric_name.endswith(".unexpected_values")
+                or unexpected_condition is None
+                or not isinstance(result_format, dict)
+                or result_format.get("result_format") == "COMPLETE"
+            ):
+                continue
+            (
+                condition,
+                compute_domain_kwargs,
+                accessor_domain_kwargs,
+            ) = unexpected_condition
+            if "column" not in accessor_domain_kwargs:
+                continue
+            column_key = (
+                IDDict(compute_domain_kwargs).to_id(),
+                accessor_domain_kwargs["column"],
+            )
+            column_requests[column_key].append(
+                (
+                    metric_to_resolve.id,
+                    condition,
+                    result_format["partial_unexpected_count"],
+                    compute_domain_kwargs,
+                )
             )
-            for idx, id in enumerate(aggregate["ids"]):
-                resolved_metrics[id] = res[0][idx]
 
+        resolved_metrics = dict()
+        for (_, column_name), requests in column_requests.items():
+            if len(requests) < 2:
+                continue
+            df, _, _ = self.get_compute_domain(requests[0][3], domain_type="identity")
+            flag_columns = [f"__unexpected_{idx}" for idx in range(len(requests))]
+            limit = sum(
+                partial_unexpected_count
+                for _, _, partial_unexpected_count, _ in requests
+            )
+            rows = (
+                df.select(
+                    F.col(column_name).alias("__value"),
+                    *[
+                        F.coalesce(condition, F.lit(False)).alias(flag_column)
+                        for (_, condition, _, _), flag_column in zip(
+                            requests, flag_columns
+                        )
+                    ],
+                )
+                .filter(
+                    reduce(
+                        lambda left, right: left | right,
+                        [F.col(flag_column) for flag_column in flag_columns],
+                    )
+                )
+                .limit(limit)
+                .collect()
+            )
+            for (metric_id, _, partial_unexpected_count, _), flag_column in zip(
+                requests, flag_columns
+            ):
+                values = [row["__value"] for row in rows if row[flag_column]][
+                    :partial_unexpected_count
+                ]
+                if len(values) == partial_unexpected_count or len(rows) < limit:
+                    resolved_metrics[metric_id] = values
         return resolved_metrics
 
     def head(self, n=5):
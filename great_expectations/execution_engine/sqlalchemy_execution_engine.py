@@ -1,7 +1,9 @@
 import copy
 import datetime
 import logging
+import threading
 import uuid
+import weakref
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
@@ -22,6 +24,7 @@ from great_expectations.expectations.row_conditions import parse_condition_to_sq
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
+    get_sqlalchemy_engine,
     import_library_module,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -37,13 +40,24 @@ try:
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.sql import Select
-    from sqlalchemy.sql.elements import TextClause, quoted_name
+    from sqlalchemy.sql.elements import (
+        ColumnClause,
+        TextClause,
+        UnaryExpression,
+        quoted_name,
+    )
+    from sqlalchemy.sql.functions import FunctionElement
+    from sqlalchemy.sql.operators import distinct_op
 except ImportError:
     reflection = None
     DefaultDialect = None
     Select = None
+    ColumnClause = None
     TextClause = None
+    UnaryExpression = None
     quoted_name = None
+    FunctionElement = None
+    distinct_op = None
 
 
 try:
@@ -192,6 +206,7 @@ class SqlAlchemyBatchData(object):
 
         self._schema_name = schema_name
         self._use_quoted_name = use_quoted_name
+        self._has_temp_table = False
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -245,6 +260,7 @@ class SqlAlchemyBatchData(object):
                 query,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            self._has_temp_table = True
             self._selectable = sa.Table(
                 generated_table_name, sa.MetaData(), schema_name=temp_table_schema_name,
             )
@@ -271,6 +287,14 @@ class SqlAlchemyBatchData(object):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def has_connection_scoped_temp_table(self) -> bool:
+        """Whether the batch is materialized in a temporary table which is only visible to the connection that created
+        it. BigQuery "temporary" tables are regular tables, visible to every connection."""
+        return (
+            self._has_temp_table and self.sql_engine_dialect.name.lower() != "bigquery"
+        )
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ):
@@ -344,6 +368,123 @@ class SqlAlchemyBatchData(object):
         return rows[0][0]
 
 
+class SqlAlchemyMaterializationManager(object):
+    """Decides how the record set described by a BatchSpec is materialized on the server, and keeps track of the
+    materializations it has made so that they can be reused and dropped deterministically.
+
+    Three materialization policies are available:
+
+        1. "table": the batch covers a whole table, which is validated in place.
+        2. "subselect": the split and sampling clauses are applied in a subselect by every metric query.
+        3. "temp_table": the record set is written once to a temporary table, against which every metric query runs.
+
+    Unless a BatchSpec requests a policy using its "materialization" key, whole tables are validated in place and
+    every other record set is written to a temporary table; the estimated cost of the record set is not taken into
+    account. Materializations are keyed by ``BatchSpec.to_id()``, so validating several suites against the same
+    BatchSpec reuses the temporary table created for the first of them until ``release`` is called (which
+    ActionListValidationOperator.run does at the end of a run if it is configured to release materializations).
+    """
+
+    TABLE = "table"
+    SUBSELECT = "subselect"
+    TEMP_TABLE = "temp_table"
+    MATERIALIZATIONS = (TABLE, SUBSELECT, TEMP_TABLE)
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._batch_data: Dict[str, SqlAlchemyBatchData] = {}
+        self._temp_tables: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def materialized_batch_spec_ids(self) -> List[str]:
+        return list(self._batch_data.keys())
+
+    def choose_materialization(self, batch_spec) -> str:
+        """Returns the materialization policy that will be used for the record set described by batch_spec"""
+        materialization = batch_spec.get("materialization")
+        if materialization is not None:
+            if materialization not in self.MATERIALIZATIONS:
+                raise ValueError(
+                    f"materialization must be one of {', '.join(self.MATERIALIZATIONS)}, not {materialization}"
+                )
+            if materialization == self.TABLE and not self._is_whole_table(batch_spec):
+                raise ValueError(
+                    'materialization "table" can only be used with a batch_spec which covers a whole table'
+                )
+            return materialization
+        if self._is_whole_table(batch_spec):
+            return self.TABLE
+        return self.TEMP_TABLE
+
+    @staticmethod
+    def _is_whole_table(batch_spec) -> bool:
+        return "sampling_method" not in batch_spec and batch_spec.get(
+            "splitter_method", "_split_on_whole_table"
+        ) in (None, "_split_on_whole_table")
+
+    def get_batch_data(
+        self, batch_spec, selectable, temp_table_name: Optional[str] = None
+    ) -> SqlAlchemyBatchData:
+        """Returns the SqlAlchemyBatchData for batch_spec, reusing an existing materialization of the same BatchSpec
+        if there is one."""
+        batch_spec_id = batch_spec.to_id()
+        with self._lock:
+            batch_data = self._batch_data.get(batch_spec_id)
+            if batch_data is not None:
+                logger.debug(
+                    f"Reusing the materialization of batch_spec {batch_spec_id}"
+                )
+                return batch_data
+
+            materialization = self.choose_materialization(batch_spec)
+            if materialization == self.TABLE:
+                selectable = sa.select("*").select_from(
+                    sa.text(batch_spec["table_name"])
+                )
+            batch_data = SqlAlchemyBatchData(
+                engine=self._engine,
+                selectable=selectable,
+                create_temp_table=materialization == self.TEMP_TABLE,
+                temp_table_name=temp_table_name,
+            )
+            if materialization == self.TEMP_TABLE:
+                self._temp_tables[batch_spec_id] = (
+                    batch_data.selectable.name,
+                    batch_data.selectable.schema,
+                )
+            self._batch_data[batch_spec_id] = batch_data
+            return batch_data
+
+    def release(self, batch_spec_id: Optional[str] = None):
+        """Drops the temporary tables created for batch_spec_id, or for every BatchSpec if batch_spec_id is None, and
+        forgets their materializations."""
+        with self._lock:
+            if batch_spec_id is None:
+                batch_spec_ids = list(self._batch_data.keys())
+            else:
+                batch_spec_ids = [batch_spec_id]
+            for batch_spec_id in batch_spec_ids:
+                self._batch_data.pop(batch_spec_id, None)
+                temp_table = self._temp_tables.pop(batch_spec_id, None)
+                if temp_table is not None:
+                    self._drop_temp_table(*temp_table)
+
+    def _drop_temp_table(self, table_name: str, schema_name: Optional[str] = None):
+        preparer = self._engine.dialect.identifier_preparer
+        qualified_table_name = preparer.quote(table_name)
+        if schema_name is not None:
+            qualified_table_name = (
+                preparer.quote_schema(schema_name) + "." + qualified_table_name
+            )
+        try:
+            self._engine.execute(f"DROP TABLE IF EXISTS {qualified_table_name}")
+        except sa.exc.SQLAlchemyError as e:
+            logger.warning(
+                f"Unable to drop temporary table {qualified_table_name}: {e}"
+            )
+
+
 class SqlAlchemyExecutionEngine(ExecutionEngine):
     def __init__(
         self,
@@ -354,6 +495,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string=None,
         url=None,
         batch_data_dict=None,
+        pool_options=None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -380,6 +522,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                pool_options (dict): \
+                    Connection pool options (pool_size, max_overflow, pool_timeout, pool_pre_ping, pool_recycle) of
+                    the engine built from the credentials, connection_string or url, overriding those configured on
+                    great_expectations.util.sqlalchemy_engine_registry. Engines with the same url and options are
+                    shared by every datasource, execution engine and store.
         """
         super().__init__(name=name, batch_data_dict=batch_data_dict)  # , **kwargs)
         self._name = name
@@ -396,12 +543,18 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         elif credentials is not None:
-            self.engine = self._build_engine(credentials=credentials, **kwargs)
+            self.engine = self._build_engine(
+                credentials=credentials, pool_options=pool_options, **kwargs
+            )
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = get_sqlalchemy_engine(
+                connection_string, pool_options=pool_options, **kwargs
+            )
         elif url is not None:
             self.drivername = urlparse(url).scheme
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = get_sqlalchemy_engine(
+                url, pool_options=pool_options, **kwargs
+            )
         else:
             raise InvalidConfigError(
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -444,6 +597,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             # sqlite/mssql temp tables only persist within a connection so override the engine
             self.engine = self.engine.connect()
 
+        # Temporary tables are dropped once the engine is garbage collected or the interpreter exits, unless
+        # release_materializations has been called before
+        self._materialization_manager = SqlAlchemyMaterializationManager(self.engine)
+        weakref.finalize(self, self._materialization_manager.release)
+
         # Send a connect event to provide dialect type
         if data_context is not None and getattr(
             data_context, "_usage_statistics_handler", None
@@ -483,7 +641,31 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self):
         return self._url
 
-    def _build_engine(self, credentials, **kwargs) -> "sa.engine.Engine":
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Queries can only run concurrently when they check out their own connections from an engine's pool; a single
+        shared connection (used for dialects whose temp tables are connection-scoped) is not thread-safe. A batch
+        materialized in a connection-scoped temporary table (e.g. on postgresql, mysql or redshift) is only visible to
+        the connection which created it, so its metrics are resolved serially as well."""
+        if isinstance(self.engine, sa.engine.Connection):
+            return False
+        return not any(
+            getattr(batch_data, "has_connection_scoped_temp_table", False)
+            for batch_data in self.loaded_batch_data_dict.values()
+        )
+
+    @property
+    def materialization_manager(self) -> SqlAlchemyMaterializationManager:
+        return self._materialization_manager
+
+    def release_materializations(self, batch_spec_id: Optional[str] = None):
+        """Drops the temporary tables materialized for batch_spec_id, or for every loaded BatchSpec if batch_spec_id is
+        None. BatchSpecs loaded afterwards are materialized again."""
+        self._materialization_manager.release(batch_spec_id=batch_spec_id)
+
+    def _build_engine(
+        self, credentials, pool_options: Optional[dict] = None, **kwargs
+    ) -> "sa.engine.Engine":
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
         private key path.
@@ -510,7 +692,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             options = sa.engine.url.URL(drivername, **credentials)
 
         self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = get_sqlalchemy_engine(
+            options, pool_options=pool_options, **create_engine_kwargs
+        )
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
@@ -563,6 +747,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             create_engine_kwargs,
         )
 
+    @staticmethod
+    def _get_row_condition_clause(
+        domain_kwargs: Dict,
+    ) -> Optional["sa.sql.expression.ColumnElement"]:
+        """Parses the row_condition of domain_kwargs into a where clause, or returns None if there is none."""
+        if domain_kwargs.get("row_condition") is None:
+            return None
+        if domain_kwargs["condition_parser"] != "great_expectations__experimental__":
+            raise GreatExpectationsError(
+                "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
+            )
+        return parse_condition_to_sqlalchemy(domain_kwargs["row_condition"])
+
     def get_compute_domain(
         self,
         domain_kwargs: Dict,
@@ -616,23 +813,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             selectable = data_object.selectable
 
-        if (
-            "row_condition" in domain_kwargs
-            and domain_kwargs["row_condition"] is not None
-        ):
-            condition_parser = domain_kwargs["condition_parser"]
-            if condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_sqlalchemy(
-                    domain_kwargs["row_condition"]
-                )
-                selectable = sa.select(
-                    "*", from_obj=selectable, whereclause=parsed_condition
-                )
-
-            else:
-                raise GreatExpectationsError(
-                    "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
-                )
+        parsed_condition = self._get_row_condition_clause(domain_kwargs)
+        if parsed_condition is not None:
+            selectable = sa.select(
+                "*", from_obj=selectable, whereclause=parsed_condition
+            )
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -770,6 +955,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         bundles the metrics into one large query dictionary so that they are all executed simultaneously. Will fail if
         bundling the metrics together is not possible.
 
+        Compute domains that differ only in their row_condition are computed in a single query over their common
+        selectable, by restricting each aggregate to the rows of its domain with a FILTER clause or a CASE expression.
+
             Args:
                 metric_fn_bundle (Iterable[Tuple[MetricConfiguration, Callable, dict]): \
                     A Dictionary containing a MetricProvider's MetricConfiguration (its unique identifier), its metric provider function
@@ -804,29 +992,197 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 engine_fn.label(metric_to_resolve.metric_name)
             )
             queries[domain_id]["ids"].append(metric_to_resolve.id)
+
+        base_domain_queries: Dict[str, List[dict]] = dict()
         for query in queries.values():
-            selectable, compute_domain_kwargs, _ = self.get_compute_domain(
-                query["domain_kwargs"], domain_type="identity"
-            )
-            assert len(query["select"]) == len(query["ids"])
-            res = self.engine.execute(
-                sa.select(query["select"]).select_from(selectable)
-            ).fetchall()
-            logger.debug(
-                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
-            )
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-            for idx, id in enumerate(query["ids"]):
-                resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+            base_domain_queries.setdefault(
+                self._get_base_domain_id(query["domain_kwargs"]), []
+            ).append(query)
+        for domain_queries in base_domain_queries.values():
+            if len(domain_queries) > 1:
+                resolved_metrics.update(
+                    self._resolve_conditional_aggregate_queries(domain_queries)
+                )
+            else:
+                resolved_metrics.update(self._resolve_domain_query(domain_queries[0]))
 
         # Convert metrics to be serializable
         return resolved_metrics
 
+    def _resolve_domain_query(self, query: dict) -> dict:
+        """Computes the aggregates of a single compute domain in one query."""
+        selectable, compute_domain_kwargs, _ = self.get_compute_domain(
+            query["domain_kwargs"], domain_type="identity"
+        )
+        assert len(query["select"]) == len(query["ids"])
+        res = self.engine.execute(
+            sa.select(query["select"]).select_from(selectable)
+        ).fetchall()
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
+        )
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(query["ids"]) == len(res[0]), "unexpected number of metrics returned"
+        return {
+            id: convert_to_json_serializable(res[0][idx])
+            for idx, id in enumerate(query["ids"])
+        }
+
+    def _resolve_conditional_aggregate_queries(self, queries: List[dict]) -> dict:
+        """Computes the aggregates of several compute domains which differ only in their row_condition in one query
+        over their common selectable.
+
+        Domains with an aggregate that cannot be restricted to the rows matching its row_condition are computed on
+        their own.
+        """
+        resolved_metrics = dict()
+        base_domain_kwargs = {
+            key: value
+            for key, value in queries[0]["domain_kwargs"].items()
+            if key not in ["row_condition", "condition_parser"]
+        }
+        selectable, _, _ = self.get_compute_domain(
+            base_domain_kwargs, domain_type="identity"
+        )
+
+        select = []
+        ids = []
+        fused_domain_count = 0
+        for query in queries:
+            condition = self._get_row_condition_clause(query["domain_kwargs"])
+            conditional_aggregates = [
+                self._get_conditional_aggregate(label.element, condition)
+                for label in query["select"]
+            ]
+            if any(aggregate is None for aggregate in conditional_aggregates):
+                resolved_metrics.update(self._resolve_domain_query(query))
+                continue
+            for aggregate in conditional_aggregates:
+                select.append(aggregate.label(f"__aggregate_{len(select)}"))
+            ids.extend(query["ids"])
+            fused_domain_count += 1
+
+        if len(ids) == 0:
+            return resolved_metrics
+        res = self.engine.execute(sa.select(select).select_from(selectable)).fetchall()
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on {fused_domain_count} domains in a single query"
+        )
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(ids) == len(res[0]), "unexpected number of metrics returned"
+        for idx, id in enumerate(ids):
+            resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+        return resolved_metrics
+
+    def _get_conditional_aggregate(
+        self, aggregate: Any, condition: Optional["sa.sql.expression.ColumnElement"]
+    ) -> Optional[Any]:
+        """Restricts an aggregate function to the rows matching condition, or returns None if it cannot be rewritten.
+
+        Only the aggregates in ``_null_ignoring_aggregates`` are rewritten; any other expression (including a scalar
+        function of an aggregate, such as ABS(MAX(x))) is left to be computed over its own domain. Dialects supporting
+        it use a FILTER (WHERE ...) clause; otherwise each argument of the aggregate is replaced by
+        CASE WHEN condition THEN argument END, relying on aggregates ignoring NULLs. COUNT(*) and COUNT() become
+        COUNT(CASE WHEN condition THEN 1 END), so that every aggregate has the same value as over the row_condition's
+        where clause.
+        """
+        if condition is None:
+            return aggregate
+        if not isinstance(aggregate, FunctionElement):
+            return None
+        aggregate_name = getattr(aggregate, "name", None)
+        if (
+            not isinstance(aggregate_name, str)
+            or aggregate_name.lower() not in self._null_ignoring_aggregates
+        ):
+            return None
+        if self._supports_aggregate_filter:
+            return aggregate.filter(condition)
+
+        arguments = list(aggregate.clauses)
+        if len(arguments) == 0:
+            if aggregate_name.lower() != "count":
+                return None
+            return sa.func.count(sa.case([(condition, 1)]))
+        conditional_arguments = []
+        for argument in arguments:
+            if isinstance(argument, ColumnClause) and argument.name == "*":
+                conditional_arguments.append(sa.case([(condition, 1)]))
+            elif (
+                isinstance(argument, UnaryExpression)
+                and argument.operator is distinct_op
+            ):
+                conditional_arguments.append(
+                    sa.distinct(sa.case([(condition, argument.element)]))
+                )
+            else:
+                conditional_arguments.append(sa.case([(condition, argument)]))
+        return getattr(sa.func, aggregate_name)(*conditional_arguments)
+
+    _null_ignoring_aggregates = {
+        "avg",
+        "count",
+        "max",
+        "min",
+        "stddev",
+        "stddev_pop",
+        "stddev_samp",
+        "stdev",
+        "sum",
+        "var_pop",
+        "var_samp",
+        "variance",
+    }
+
+    @property
+    def _supports_aggregate_filter(self) -> bool:
+        """Whether the dialect supports the FILTER (WHERE ...) clause of aggregate functions."""
+        dialect_name = self.engine.dialect.name.lower()
+        if dialect_name == "postgresql":
+            return True
+        if dialect_name == "sqlite":
+            return getattr(self.engine.dialect.dbapi, "sqlite_version_info", (0,)) >= (
+                3,
+                30,
+            )
+        return False
+
+    @staticmethod
+    def _get_base_domain_id(compute_domain_kwargs: dict) -> str:
+        """Identifies the selectable of a compute domain before its row_condition is applied.
+
+        Domains which also select columns keep their row_condition in the id, since the condition may refer to columns
+        that are not selected.
+        """
+        if not set(compute_domain_kwargs.keys()).issubset(
+            {"batch_id", "table", "row_condition", "condition_parser"}
+        ):
+            return IDDict(compute_domain_kwargs).to_id()
+        return IDDict(
+            {
+                key: value
+                for key, value in compute_domain_kwargs.items()
+                if key not in ["row_condition", "condition_parser"]
+            }
+        ).to_id()
+
+    @classmethod
+    def _split_metric_fn_bundle_by_domain(
+        cls, metric_fn_bundle: List[tuple]
+    ) -> List[list]:
+        """Splits a metric_fn_bundle into one bundle per distinct selectable, so that domains differing only in their
+        row_condition are still computed in a single query."""
+        domain_bundles: Dict[str, list] = dict()
+        for bundled_metric in metric_fn_bundle:
+            domain_bundles.setdefault(
+                cls._get_base_domain_id(bundled_metric[2]), []
+            ).append(bundled_metric)
+        return list(domain_bundles.values())
+
     ### Splitter methods for partitioning tables ###
 
     def _split_on_whole_table(
@@ -998,8 +1354,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             temp_table_name = batch_spec.get("bigquery_temp_table")
         else:
             temp_table_name = None
-        batch_data = SqlAlchemyBatchData(
-            engine=self.engine, selectable=selectable, temp_table_name=temp_table_name
+        batch_data = self._materialization_manager.get_batch_data(
+            batch_spec=batch_spec,
+            selectable=selectable,
+            temp_table_name=temp_table_name,
         )
 
         batch_markers = BatchMarkers(
@@ -76,8 +76,10 @@ class ExpectColumnQuantileValuesToBeBetween(TableExpectation):
                    The column name.
                quantile_ranges (dictionary): \
                    Quantiles and associated value ranges for the column. See above for details.
-               allow_relative_error (boolean): \
-                   Whether to allow relative error in quantile communications on backends that support or require it.
+               allow_relative_error (boolean or float): \
+                   Whether to allow relative error in quantile communications on backends that support or require it. \
+                   With pandas, a float between 0 and 1 computes the quantiles from a mergeable sketch with about that \
+                   relative error in rank.
 
            Other Parameters:
                result_format (str or None): \
@@ -172,9 +174,11 @@ class ExpectColumnQuantileValuesToBeBetween(TableExpectation):
         else:
             allow_relative_error = False
 
-        if allow_relative_error is not False:
+        if not isinstance(allow_relative_error, bool) and not (
+            isinstance(allow_relative_error, float) and 0 <= allow_relative_error < 1
+        ):
             raise ValueError(
-                "PandasExecutionEngine does not support relative error in column quantiles."
+                "allow_relative_error must be a boolean or a float between 0 and 1."
             )
 
         if len(quantiles) != len(quantile_value_ranges):
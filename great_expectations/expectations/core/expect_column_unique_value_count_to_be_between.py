@@ -6,6 +6,7 @@ import pandas as pd
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from ...render.renderer.renderer import renderer
 from ...render.types import RenderedStringTemplateContent
@@ -40,6 +41,10 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
                     The minimum number of unique values allowed.
                 max_value (int or None): \
                     The maximum number of unique values allowed.
+                allow_relative_error (boolean or float): \
+                    Whether to allow relative error in the number of unique values, which is then estimated from a \
+                    mergeable sketch with about that relative error (or with the default size of the sketch if \
+                    True) on backends that support it, instead of counting the unique values exactly.
 
             Other Parameters:
                 result_format (str or None): \
@@ -85,6 +90,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "allow_relative_error",
     )
 
     # Default values
@@ -93,6 +99,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "condition_parser": None,
         "min_value": None,
         "max_value": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -114,6 +121,38 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         super().validate_configuration(configuration)
         self.validate_metric_value_between_configuration(configuration=configuration)
 
+        allow_relative_error = configuration.kwargs.get("allow_relative_error", False)
+        if not isinstance(allow_relative_error, bool) and not (
+            isinstance(allow_relative_error, float) and 0 <= allow_relative_error < 1
+        ):
+            raise InvalidExpectationConfigurationError(
+                "allow_relative_error must be a boolean or a float between 0 and 1."
+            )
+
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        allow_relative_error = self.get_success_kwargs(configuration).get(
+            "allow_relative_error"
+        )
+        if allow_relative_error:
+            metric = dependencies["metrics"].pop("column.distinct_values.count")
+            dependencies["metrics"][
+                "column.distinct_values.approx_count"
+            ] = MetricConfiguration(
+                metric_name="column.distinct_values.approx_count",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"allow_relative_error": allow_relative_error},
+            )
+
+        return dependencies
+
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
     def _prescriptive_renderer(
@@ -229,8 +268,12 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
+        if self.get_success_kwargs(configuration).get("allow_relative_error"):
+            metric_name = "column.distinct_values.approx_count"
+        else:
+            metric_name = "column.distinct_values.count"
         return self._validate_metric_value_between(
-            metric_name="column.distinct_values.count",
+            metric_name=metric_name,
             configuration=configuration,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
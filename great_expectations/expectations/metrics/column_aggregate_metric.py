@@ -2,6 +2,7 @@ import logging
 from functools import wraps
 from typing import Any, Callable, Dict, Tuple, Type
 
+from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
     MetricDomainTypes,
@@ -71,6 +72,11 @@ def column_aggregate_value(
                     _metrics=metrics,
                 )
 
+            if MetricDomainTypes(domain_type) == MetricDomainTypes.COLUMN:
+                # Allows PandasExecutionEngine to compute the metric as part of a metric bundle
+                inner_func.aggregate_partial_fn = column_aggregate_partial(
+                    engine=PandasExecutionEngine, **kwargs
+                )(metric_fn)
             return inner_func
 
         return wrapper
@@ -83,16 +89,103 @@ def column_aggregate_value(
 def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
     """Return the column aggregate metric decorator for the specified engine.
 
+    For PandasExecutionEngine, the aggregate may also be computed on data read in chunks (see PandasChunkedBatchData)
+    if a chunk_merge_fn is provided: each chunk of the column is reduced to a partial state, by chunk_state_fn or by the
+    metric function itself, and chunk_merge_fn computes the metric value from the list of partial states. If
+    chunk_merge_with_metrics is True, chunk_merge_fn is also passed the metric value kwargs and the _metrics the metric
+    depends on. If a reduction_fn is provided, PandasExecutionEngine.resolve_metric_bundle computes the metric of
+    integer and float columns from the reductions it shares between the metrics of the column (a dict with the count,
+    sum, min, max, mean and squared_deviations of the non-null values) rather than from the column itself.
+
     Args:
         engine:
-        **kwargs:
+        **kwargs: filter_column_isnull, and chunk_state_fn, chunk_merge_fn, chunk_merge_with_metrics and reduction_fn
+            for PandasExecutionEngine
 
     Returns:
 
     """
     partial_fn_type = MetricPartialFunctionTypes.AGGREGATE_FN
     domain_type = MetricDomainTypes.COLUMN
-    if issubclass(engine, SqlAlchemyExecutionEngine):
+    if issubclass(engine, PandasExecutionEngine):
+
+        def wrapper(metric_fn: Callable):
+            @metric_partial(
+                engine=PandasExecutionEngine,
+                partial_fn_type=partial_fn_type,
+                domain_type=domain_type,
+            )
+            @wraps(metric_fn)
+            def inner_func(
+                cls,
+                execution_engine: "PandasExecutionEngine",
+                metric_domain_kwargs: Dict,
+                metric_value_kwargs: Dict,
+                metrics: Dict[Tuple, Any],
+                runtime_configuration: Dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+                # The compute domain is not evaluated here, so that PandasExecutionEngine.resolve_metric_bundle can
+                # evaluate it once for all the aggregates computed on it
+                compute_domain_kwargs = dict(metric_domain_kwargs)
+                if "column" not in compute_domain_kwargs:
+                    raise GreatExpectationsError(
+                        "Column not provided in compute_domain_kwargs"
+                    )
+                accessor_domain_kwargs = {"column": compute_domain_kwargs.pop("column")}
+
+                def column_aggregate(column):
+                    return metric_fn(
+                        cls, column=column, **metric_value_kwargs, _metrics=metrics,
+                    )
+
+                def metric_aggregate(column):
+                    if filter_column_isnull:
+                        column = column[column.notnull()]
+                    return column_aggregate(column)
+
+                # Lets resolve_metric_bundle share the non-null values of a column between its aggregates
+                metric_aggregate.filter_column_isnull = filter_column_isnull
+                metric_aggregate.column_fn = column_aggregate
+                reduction_fn = kwargs.get("reduction_fn")
+                if reduction_fn is not None:
+                    metric_aggregate.reduction_fn = reduction_fn
+
+                chunk_merge_fn = kwargs.get("chunk_merge_fn")
+                if chunk_merge_fn is not None:
+                    chunk_state_fn = kwargs.get("chunk_state_fn")
+
+                    def metric_aggregate_chunk_state(column):
+                        if filter_column_isnull:
+                            column = column[column.notnull()]
+                        if len(column) == 0:
+                            return None
+                        if chunk_state_fn is None:
+                            return metric_fn(
+                                cls,
+                                column=column,
+                                **metric_value_kwargs,
+                                _metrics=metrics,
+                            )
+                        return chunk_state_fn(column)
+
+                    metric_aggregate.chunk_state_fn = metric_aggregate_chunk_state
+                    if kwargs.get("chunk_merge_with_metrics", False):
+                        metric_aggregate.chunk_merge_fn = lambda states: chunk_merge_fn(
+                            states, **metric_value_kwargs, _metrics=metrics
+                        )
+                    else:
+                        metric_aggregate.chunk_merge_fn = chunk_merge_fn
+
+                return metric_aggregate, compute_domain_kwargs, accessor_domain_kwargs
+
+            return inner_func
+
+        return wrapper
+
+    elif issubclass(engine, SqlAlchemyExecutionEngine):
 
         def wrapper(metric_fn: Callable):
             @metric_partial(
@@ -1,6 +1,11 @@
 from typing import Any, Dict, Optional, Tuple
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import (
+    HyperLogLogSketch,
+    build_sketch,
+    merge_sketches,
+)
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -11,11 +16,16 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.validation_graph import MetricConfiguration
 
+# Dialects with an APPROX_COUNT_DISTINCT aggregate function; the others count distinct values exactly
+APPROX_COUNT_DISTINCT_DIALECTS = ("bigquery", "snowflake")
+
 
 class ColumnDistinctValues(ColumnMetricProvider):
     metric_name = "column.distinct_values"
@@ -88,17 +98,9 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
     def _pandas(cls, column, **kwargs):
         return column.nunique()
 
-    @metric_value(engine=SqlAlchemyExecutionEngine)
-    def _sqlalchemy(
-        cls,
-        execution_engine: "SqlAlchemyExecutionEngine",
-        metric_domain_kwargs: Dict,
-        metric_value_kwargs: Dict,
-        metrics: Dict[Tuple, Any],
-        runtime_configuration: Dict,
-    ):
-        observed_value_counts = metrics["column.value_counts"]
-        return len(observed_value_counts)
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, **kwargs):
+        return sa.func.count(sa.distinct(column))
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -129,9 +131,7 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        if isinstance(
-            execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)
-        ):
+        if isinstance(execution_engine, SparkDFExecutionEngine):
             dependencies.update(
                 {
                     "column.value_counts": MetricConfiguration(
@@ -143,3 +143,86 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
             )
 
         return dependencies
+
+
+class ColumnDistinctValuesSketch(ColumnMetricProvider):
+    """MetricProvider Class for a mergeable sketch of the distinct values of a column (see HyperLogLogSketch)"""
+
+    metric_name = "column.distinct_values.sketch"
+    value_keys = ("allow_relative_error",)
+
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, chunk_merge_fn=merge_sketches,
+    )
+    def _pandas(cls, column, allow_relative_error=True, **kwargs):
+        return build_sketch(HyperLogLogSketch, allow_relative_error).update(column)
+
+
+class ColumnDistinctValuesApproxCount(ColumnMetricProvider):
+    """MetricProvider Class for the number of distinct values of a column, estimated with a relative error of about
+    allow_relative_error"""
+
+    metric_name = "column.distinct_values.approx_count"
+    value_keys = ("allow_relative_error",)
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: "PandasExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        sketch = metrics["column.distinct_values.sketch"]
+        return 0 if sketch is None else sketch.count()
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, _dialect, **kwargs):
+        if _dialect.name.lower() in APPROX_COUNT_DISTINCT_DIALECTS:
+            return sa.func.approx_count_distinct(column)
+        return sa.func.count(sa.distinct(column))
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return metrics["column.distinct_values.count"]
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if isinstance(execution_engine, PandasExecutionEngine):
+            dependencies["column.distinct_values.sketch"] = MetricConfiguration(
+                metric_name="column.distinct_values.sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs=metric.metric_value_kwargs,
+            )
+        elif isinstance(execution_engine, SparkDFExecutionEngine):
+            # The exact count is used where no sketch is available
+            dependencies["column.distinct_values.count"] = MetricConfiguration(
+                metric_name="column.distinct_values.count",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs=dict(),
+            )
+
+        return dependencies
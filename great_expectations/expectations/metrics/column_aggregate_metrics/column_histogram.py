@@ -5,6 +5,7 @@ from typing import Any, Dict, Tuple
 import numpy as np
 
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.exceptions import ChunkedDataNotSupportedError
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -36,11 +37,29 @@ class ColumnHistogram(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
+        bins = metric_value_kwargs["bins"]
+        if execution_engine.is_chunked(metric_domain_kwargs):
+            if np.ndim(bins) == 0:
+                raise ChunkedDataNotSupportedError(
+                    "A histogram over a number of bins depends on the range of the whole column, and cannot be "
+                    "merged from the chunks of the data; pass the bin edges instead."
+                )
+            (
+                data,
+                _,
+                accessor_domain_kwargs,
+            ) = execution_engine.get_chunked_column_domain(metric_domain_kwargs)
+            column = accessor_domain_kwargs["column"]
+            hist = np.zeros(len(bins) - 1, dtype=np.int64)
+            for chunk in data.iter_chunks(columns=[column]):
+                chunk_hist, _ = np.histogram(chunk[column], bins, density=False)
+                hist += chunk_hist
+            return list(hist)
+
         df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
         )
         column = accessor_domain_kwargs["column"]
-        bins = metric_value_kwargs["bins"]
         hist, bin_edges = np.histogram(df[column], bins, density=False)
         return list(hist)
 
@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -13,10 +16,24 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
 from great_expectations.expectations.metrics.import_manager import F, sa
 
 
+def _merge_chunk_maximums(chunk_maximums):
+    if len(chunk_maximums) == 0:
+        return np.nan
+    return pd.Series(chunk_maximums).max()
+
+
+def _maximum_from_reductions(reductions):
+    return reductions["max"]
+
+
 class ColumnMax(ColumnMetricProvider):
     metric_name = "column.max"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        chunk_merge_fn=_merge_chunk_maximums,
+        reduction_fn=_maximum_from_reductions,
+    )
     def _pandas(cls, column, **kwargs):
         return column.max()
 
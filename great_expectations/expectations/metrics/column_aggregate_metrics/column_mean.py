@@ -1,3 +1,5 @@
+import numpy as np
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -13,12 +15,32 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
 from great_expectations.expectations.metrics.import_manager import F, sa
 
 
+def _chunk_count_and_sum(column):
+    return column.count(), column.sum()
+
+
+def _merge_chunk_counts_and_sums(chunk_counts_and_sums):
+    count = sum(chunk_count for chunk_count, _ in chunk_counts_and_sums)
+    if count == 0:
+        return np.nan
+    return sum(chunk_sum for _, chunk_sum in chunk_counts_and_sums) / count
+
+
+def _mean_from_reductions(reductions):
+    return reductions["mean"]
+
+
 class ColumnMean(ColumnMetricProvider):
     """MetricProvider Class for Aggregate Mean MetricProvider"""
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        chunk_state_fn=_chunk_count_and_sum,
+        chunk_merge_fn=_merge_chunk_counts_and_sums,
+        reduction_fn=_mean_from_reductions,
+    )
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
         return column.mean()
@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -14,10 +17,24 @@ from great_expectations.expectations.metrics.column_aggregate_metric import sa a
 from great_expectations.expectations.metrics.import_manager import F
 
 
+def _merge_chunk_minimums(chunk_minimums):
+    if len(chunk_minimums) == 0:
+        return np.nan
+    return pd.Series(chunk_minimums).min()
+
+
+def _minimum_from_reductions(reductions):
+    return reductions["min"]
+
+
 class ColumnMin(ColumnMetricProvider):
     metric_name = "column.min"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        chunk_merge_fn=_merge_chunk_minimums,
+        reduction_fn=_minimum_from_reductions,
+    )
     def _pandas(cls, column, **kwargs):
         return column.min()
 
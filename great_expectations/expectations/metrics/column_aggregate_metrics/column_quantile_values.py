@@ -1,7 +1,7 @@
 import logging
 import traceback
 from collections import Iterable
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -22,7 +22,15 @@ except ImportError:
     WithinGroup = None
     CTE = None
 
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import (
+    KLLQuantileSketch,
+    build_sketch,
+    merge_sketches,
+)
+from great_expectations.exceptions import ChunkedDataNotSupportedError
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
@@ -38,17 +46,43 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
 from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
 
+def _no_chunk_state(column):
+    return None
+
+
+def _merge_chunk_quantiles(
+    chunk_states, quantiles, allow_relative_error=False, **kwargs
+):
+    # The quantiles of data read in chunks are only available from the sketch merged from the chunks
+    sketch = kwargs["_metrics"].get("column.quantile_values.sketch")
+    if not allow_relative_error or sketch is None:
+        raise ChunkedDataNotSupportedError(
+            "Exact quantiles need the whole column in memory; set allow_relative_error to compute approximate "
+            "quantiles of data read in chunks."
+        )
+    return sketch.quantiles(quantiles)
+
+
 class ColumnQuantileValues(ColumnMetricProvider):
     metric_name = "column.quantile_values"
     value_keys = ("quantiles", "allow_relative_error")
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, **kwargs):
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        chunk_state_fn=_no_chunk_state,
+        chunk_merge_fn=_merge_chunk_quantiles,
+        chunk_merge_with_metrics=True,
+    )
+    def _pandas(cls, column, quantiles, allow_relative_error=False, **kwargs):
         """Quantile Function"""
+        sketch = kwargs["_metrics"].get("column.quantile_values.sketch")
+        if allow_relative_error and sketch is not None:
+            return sketch.quantiles(quantiles)
 
         return column.quantile(quantiles, interpolation="nearest").tolist()
 
@@ -136,6 +170,52 @@ class ColumnQuantileValues(ColumnMetricProvider):
             )
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        allow_relative_error = metric.metric_value_kwargs.get("allow_relative_error")
+        if (
+            isinstance(execution_engine, PandasExecutionEngine)
+            and allow_relative_error
+            and execution_engine.is_chunked(metric.metric_domain_kwargs)
+        ):
+            # Approximate quantiles of data read in chunks are merged from the sketches of the chunks, rather than
+            # computed from the whole column; in-memory columns are faster (and exactly) sorted by pandas
+            dependencies["column.quantile_values.sketch"] = MetricConfiguration(
+                metric_name="column.quantile_values.sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"allow_relative_error": allow_relative_error},
+            )
+
+        return dependencies
+
+
+class ColumnQuantileValuesSketch(ColumnMetricProvider):
+    """MetricProvider Class for a mergeable sketch of the quantiles of a column (see KLLQuantileSketch)"""
+
+    metric_name = "column.quantile_values.sketch"
+    value_keys = ("allow_relative_error",)
+
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, chunk_merge_fn=merge_sketches,
+    )
+    def _pandas(cls, column, allow_relative_error=True, **kwargs):
+        return build_sketch(KLLQuantileSketch, allow_relative_error).update(column)
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -26,12 +28,50 @@ except ImportError as e:
 from great_expectations.expectations.metrics.import_manager import F, sa
 
 
+def _chunk_count_mean_and_squared_deviations(column):
+    count = column.count()
+    if count == 0:
+        return 0, 0.0, 0.0
+    mean = column.mean()
+    return count, mean, ((column - mean) ** 2).sum()
+
+
+def _merge_chunk_counts_means_and_squared_deviations(chunk_states):
+    """Merges the partial states of the chunks with the parallel algorithm of Chan et al., and returns the sample
+    standard deviation"""
+    count, mean, squared_deviations = 0, 0.0, 0.0
+    for chunk_count, chunk_mean, chunk_squared_deviations in chunk_states:
+        if chunk_count == 0:
+            continue
+        delta = chunk_mean - mean
+        merged_count = count + chunk_count
+        mean += delta * chunk_count / merged_count
+        squared_deviations += (
+            chunk_squared_deviations + delta ** 2 * count * chunk_count / merged_count
+        )
+        count = merged_count
+    if count < 2:
+        return np.nan
+    return np.sqrt(squared_deviations / (count - 1))
+
+
+def _standard_deviation_from_reductions(reductions):
+    if reductions["count"] < 2:
+        return np.nan
+    return np.sqrt(reductions["squared_deviations"] / (reductions["count"] - 1))
+
+
 class ColumnStandardDeviation(ColumnMetricProvider):
     """MetricProvider Class for Aggregate Standard Deviation metric"""
 
     metric_name = "column.standard_deviation"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        chunk_state_fn=_chunk_count_mean_and_squared_deviations,
+        chunk_merge_fn=_merge_chunk_counts_means_and_squared_deviations,
+        reduction_fn=_standard_deviation_from_reductions,
+    )
     def _pandas(cls, column, **kwargs):
         """Pandas Standard Deviation implementation"""
         return column.std()
@@ -13,10 +13,22 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
 from great_expectations.expectations.metrics.import_manager import F, sa
 
 
+def _merge_chunk_sums(chunk_sums):
+    return sum(chunk_sums)
+
+
+def _sum_from_reductions(reductions):
+    return reductions["sum"]
+
+
 class ColumnSum(ColumnMetricProvider):
     metric_name = "column.sum"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        chunk_merge_fn=_merge_chunk_sums,
+        reduction_fn=_sum_from_reductions,
+    )
     def _pandas(cls, column, **kwargs):
         return column.sum()
 
@@ -10,6 +10,7 @@ from great_expectations.execution_engine import (
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
+    column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
@@ -40,19 +41,43 @@ class ColumnValueCounts(ColumnMetricProvider):
         if collate is not None:
             raise ValueError("collate parameter is not supported in PandasDataset")
 
-        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
-            metric_domain_kwargs, MetricDomainTypes.COLUMN
-        )
-        column = accessor_domain_kwargs["column"]
+        if execution_engine.is_chunked(metric_domain_kwargs):
+            # The value counts of the chunks are summed, so memory is bounded by the number of distinct values
+            (
+                data,
+                _,
+                accessor_domain_kwargs,
+            ) = execution_engine.get_chunked_column_domain(metric_domain_kwargs)
+            column = accessor_domain_kwargs["column"]
+            column_dtype = data.dtypes[column]
+            chunk_counts = [
+                chunk[column].value_counts()
+                for chunk in data.iter_chunks(columns=[column])
+            ]
+            if len(chunk_counts) == 0:
+                counts = pd.Series([], dtype="int64")
+            else:
+                counts = (
+                    pd.concat(chunk_counts)
+                    .groupby(level=0, sort=False)
+                    .sum()
+                    .sort_values(ascending=False, kind="mergesort")
+                )
+        else:
+            df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                metric_domain_kwargs, MetricDomainTypes.COLUMN
+            )
+            column = accessor_domain_kwargs["column"]
+            column_dtype = df[column].dtype
+            counts = df[column].value_counts()
 
-        counts = df[column].value_counts()
         if sort == "value":
             try:
                 counts.sort_index(inplace=True)
             except TypeError:
                 # Having values of multiple types in a object dtype column (e.g., strings and floats)
                 # raises a TypeError when the sorting method performs comparisons.
-                if df[column].dtype == object:
+                if column_dtype == object:
                     counts.index = counts.index.astype(str)
                     counts.sort_index(inplace=True)
         elif sort == "counts":
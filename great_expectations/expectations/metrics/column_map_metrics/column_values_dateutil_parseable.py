@@ -13,7 +13,7 @@ from great_expectations.expectations.metrics.map_metric import (
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.dateutil_parseable"
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, elementwise=True)
     def _pandas(cls, column, **kwargs):
         def is_parseable(val):
             try:
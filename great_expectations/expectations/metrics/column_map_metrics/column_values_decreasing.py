@@ -27,7 +27,7 @@ class ColumnValuesDecreasing(ColumnMapMetricProvider):
     condition_value_keys = ("strictly",)
     default_kwarg_values = {"strictly": False}
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, across_rows=True)
     def _pandas(cls, column, strictly, **kwargs):
         series_diff = column.diff()
         # The first element is null, so it gets a bye and is always treated as True
@@ -4,36 +4,27 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
-from great_expectations.expectations.metrics.import_manager import F, sparktypes
 from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
 
 
+def _is_json(val):
+    try:
+        json.loads(val)
+        return True
+    except:
+        return False
+
+
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.json_parseable"
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, elementwise=True)
     def _pandas(cls, column, **kwargs):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except:
-                return False
-
-        return column.map(is_json)
-
-    @column_condition_partial(engine=SparkDFExecutionEngine)
-    def _spark(cls, column, json_schema, **kwargs):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except:
-                return False
-
-        is_json_udf = F.udf(is_json, sparktypes.BooleanType())
+        return column.map(_is_json)
 
-        return is_json_udf(column)
+    @column_condition_partial(engine=SparkDFExecutionEngine, pandas_udf=True)
+    def _spark(cls, column, **kwargs):
+        return column.map(_is_json)
@@ -1,16 +1,27 @@
 import json
 
-import jsonschema
-
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
-from great_expectations.expectations.metrics.import_manager import F, sparktypes
 from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    evaluate_on_distinct_values,
+    get_json_schema_validator,
+)
+
+
+def _matches_json_schema(column, json_schema):
+    # The validator is compiled once per schema, and each distinct value is only parsed and validated once.
+    # jsonschema.SchemaError is raised for an invalid schema, and values which are not JSON raise as well.
+    validator = get_json_schema_validator(json_schema)
+    return evaluate_on_distinct_values(
+        column,
+        lambda values: values.map(lambda val: validator.is_valid(json.loads(val))),
+    )
 
 
 class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
@@ -19,40 +30,8 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
-        def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
+        return _matches_json_schema(column, json_schema)
 
-        return column.map(matches_json_schema)
-
-    @column_condition_partial(engine=SparkDFExecutionEngine)
+    @column_condition_partial(engine=SparkDFExecutionEngine, pandas_udf=True)
     def _spark(cls, column, json_schema, **kwargs):
-        def matches_json_schema(val):
-            if val is None:
-                return False
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
-
-        matches_json_schema_udf = F.udf(matches_json_schema, sparktypes.BooleanType())
-
-        return matches_json_schema_udf(column)
+        return _matches_json_schema(column, json_schema)
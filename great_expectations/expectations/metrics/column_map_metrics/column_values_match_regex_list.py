@@ -14,7 +14,10 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    evaluate_on_distinct_values,
+    get_dialect_regex_expression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +32,20 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, match_on, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        if len(regex_list) == 0:
+            raise ValueError("At least one regex must be supplied in the regex_list.")
 
-        if match_on == "any":
-            result = regex_match_df.any(axis="columns")
-        elif match_on == "all":
-            result = regex_match_df.all(axis="columns")
-        else:
+        if match_on not in ["any", "all"]:
             raise ValueError("match_on must be either 'any' or 'all'")
 
-        return result
+        def matches_regex_list(values):
+            regex_matches = [values.str.contains(regex) for regex in regex_list]
+            regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+            if match_on == "any":
+                return regex_match_df.any(axis="columns")
+            return regex_match_df.all(axis="columns")
+
+        return evaluate_on_distinct_values(column.astype(str), matches_regex_list)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex_list, match_on, _dialect, **kwargs):
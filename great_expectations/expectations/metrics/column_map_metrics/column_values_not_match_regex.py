@@ -11,7 +11,10 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    evaluate_on_distinct_values,
+    get_dialect_regex_expression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +25,9 @@ class ColumnValuesNotMatchRegex(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex, **kwargs):
-        return ~column.astype(str).str.contains(regex)
+        return evaluate_on_distinct_values(
+            column.astype(str), lambda values: ~values.str.contains(regex)
+        )
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex, _dialect, **kwargs):
@@ -14,7 +14,10 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    evaluate_on_distinct_values,
+    get_dialect_regex_expression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +28,15 @@ class ColumnValuesNotMatchRegexList(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        if len(regex_list) == 0:
+            raise ValueError("At least one regex must be supplied in the regex_list.")
+
+        def not_matches_regex_list(values):
+            regex_matches = [values.str.contains(regex) for regex in regex_list]
+            regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+            return ~regex_match_df.any(axis="columns")
 
-        return ~regex_match_df.any(axis="columns")
+        return evaluate_on_distinct_values(column.astype(str), not_matches_regex_list)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex_list, _dialect, **kwargs):
@@ -8,6 +8,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
 )
 from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
     MetricPartialFunctionTypes,
 )
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
@@ -16,6 +17,8 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 from great_expectations.expectations.metrics.import_manager import F, Window
 from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
+    _sqlalchemy_limit_to_result_format,
+    _sqlalchemy_map_condition_rows,
     column_condition_partial,
     column_function_partial,
 )
@@ -24,10 +27,128 @@ from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
+def _sqlalchemy_column_is_unique(metrics: Dict[str, Any]) -> bool:
+    """Whether the non-null values of the column are known to be all distinct, because COUNT(DISTINCT column) equals
+    COUNT(column). Both are aggregated with the other column metrics, without sorting the table."""
+    distinct_count = metrics.get("column.distinct_values.count")
+    nonnull_count = metrics.get("column_values.nonnull.count")
+    return distinct_count is not None and distinct_count == nonnull_count
+
+
+def _sqlalchemy_duplicate_value_counts_query(
+    execution_engine: "SqlAlchemyExecutionEngine",
+    metric_domain_kwargs: Dict,
+    limit: Optional[int] = None,
+):
+    """Returns a query of the non-null values of the column which appear more than once, with their counts"""
+    selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+    )
+    column = sa.column(accessor_domain_kwargs["column"])
+    query = (
+        sa.select([column.label("value"), sa.func.count().label("value_count")])
+        .select_from(selectable)
+        .where(column != None)
+        .group_by(column)
+        .having(sa.func.count() > 1)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def _sqlalchemy_unique_unexpected_count(
+    cls,
+    execution_engine: "SqlAlchemyExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    if _sqlalchemy_column_is_unique(metrics):
+        return 0
+    duplicates = _sqlalchemy_duplicate_value_counts_query(
+        execution_engine, metric_domain_kwargs
+    ).alias("duplicates")
+    unexpected_count = execution_engine.engine.execute(
+        sa.select([sa.func.sum(duplicates.c.value_count)])
+    ).scalar()
+    return int(unexpected_count or 0)
+
+
+def _sqlalchemy_unique_unexpected_values(
+    cls,
+    execution_engine: "SqlAlchemyExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    if _sqlalchemy_column_is_unique(metrics):
+        return []
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        limit = None
+    else:
+        # every duplicated value accounts for at least two unexpected values
+        limit = result_format["partial_unexpected_count"]
+    unexpected_values = []
+    for row in execution_engine.engine.execute(
+        _sqlalchemy_duplicate_value_counts_query(
+            execution_engine, metric_domain_kwargs, limit=limit
+        )
+    ).fetchall():
+        unexpected_values.extend([row.value] * row.value_count)
+    if limit is not None:
+        unexpected_values = unexpected_values[:limit]
+    return unexpected_values
+
+
+def _sqlalchemy_unique_unexpected_value_counts(
+    cls,
+    execution_engine: "SqlAlchemyExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    if _sqlalchemy_column_is_unique(metrics):
+        return []
+    query = _sqlalchemy_duplicate_value_counts_query(
+        execution_engine, metric_domain_kwargs
+    )
+    result_format = metric_value_kwargs.get("result_format")
+    if result_format is not None and result_format["result_format"] != "COMPLETE":
+        query = _sqlalchemy_limit_to_result_format(
+            query.order_by(sa.desc("value_count")), result_format
+        )
+    return execution_engine.engine.execute(query).fetchall()
+
+
+def _sqlalchemy_unique_unexpected_rows(
+    cls,
+    execution_engine: "SqlAlchemyExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    if _sqlalchemy_column_is_unique(metrics):
+        return []
+    return _sqlalchemy_map_condition_rows(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
+
+
 class ColumnValuesUnique(ColumnMapMetricProvider):
     condition_metric_name = "column_values.unique"
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, across_rows=True)
     def _pandas(cls, column, **kwargs):
         return ~column.duplicated(keep=False)
 
@@ -45,9 +166,17 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
     #
     #     return column.notin_(dup_query)
 
+    # The value metrics first check whether COUNT(DISTINCT column) equals COUNT(column), and only look for duplicates,
+    # with a GROUP BY ... HAVING COUNT(*) > 1 query, when it does not
     @column_condition_partial(
         engine=SqlAlchemyExecutionEngine,
         partial_fn_type=MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
+        value_metric_providers={
+            ".unexpected_count": _sqlalchemy_unique_unexpected_count,
+            ".unexpected_values": _sqlalchemy_unique_unexpected_values,
+            ".unexpected_value_counts": _sqlalchemy_unique_unexpected_value_counts,
+            ".unexpected_rows": _sqlalchemy_unique_unexpected_rows,
+        },
     )
     def _sqlalchemy_window(cls, column, _table, **kwargs):
         dup_query = (
@@ -65,3 +194,36 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
     )
     def _spark(cls, column, **kwargs):
         return F.count(F.lit(1)).over(Window.partitionBy(column)) <= 1
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine) and any(
+            metric.metric_name == cls.condition_metric_name + metric_suffix
+            for metric_suffix in [
+                ".unexpected_count",
+                ".unexpected_values",
+                ".unexpected_value_counts",
+                ".unexpected_rows",
+            ]
+        ):
+            for metric_name in [
+                "column.distinct_values.count",
+                "column_values.nonnull.count",
+            ]:
+                dependencies[metric_name] = MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=metric.metric_domain_kwargs,
+                )
+        return dependencies
@@ -1,11 +1,14 @@
+import logging
 import uuid
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
+import pandas as pd
 
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.exceptions import ChunkedDataNotSupportedError
 from great_expectations.exceptions.metric_exceptions import (
     MetricError,
     MetricProviderError,
@@ -24,16 +27,20 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
     sa,
 )
+from great_expectations.expectations.metrics.import_manager import sparktypes
 from great_expectations.expectations.metrics.metric_provider import (
     MetricProvider,
     metric_partial,
 )
+from great_expectations.expectations.metrics.util import evaluate_on_distinct_values
 from great_expectations.expectations.registry import (
     get_metric_provider,
     register_metric,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
 
+logger = logging.getLogger(__name__)
+
 
 def column_function_partial(
     engine: Type[ExecutionEngine], partial_fn_type: str = None, **kwargs
@@ -88,13 +95,15 @@ def column_function_partial(
                 ) = execution_engine.get_compute_domain(
                     domain_kwargs=metric_domain_kwargs, domain_type=domain_type
                 )
+                column = df[accessor_domain_kwargs["column"]]
                 if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
+                    column = column[
+                        execution_engine.get_column_nonnull_mask(
+                            df, {**compute_domain_kwargs, **accessor_domain_kwargs}
+                        )
+                    ]
                 values = metric_fn(
-                    cls,
-                    df[accessor_domain_kwargs["column"]],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
+                    cls, column, **metric_value_kwargs, _metrics=metrics,
                 )
                 return values, compute_domain_kwargs, accessor_domain_kwargs
 
@@ -237,7 +246,15 @@ def column_condition_partial(
     A metric function that is decorated as a column_condition_partial will be called with the engine-specific column type
     and any value_kwargs associated with the Metric for which the provider function is being declared.
 
+    For PandasExecutionEngine, passing elementwise=True declares that the condition of each value depends on that value
+    alone: columns with few distinct values are then factorized, and the condition is evaluated once per distinct value.
+    On data read in chunks, the condition is evaluated one chunk at a time; passing across_rows=True declares that the
+    condition of a value depends on other rows of the column (e.g. duplicates or ordering), so that it is not evaluated
+    on chunked data.
 
+    For SparkDFExecutionEngine, passing pandas_udf=True declares a metric_fn written against pandas Series instead: it is
+    evaluated in a vectorized UDF on Arrow batches of non-null values, so that Pandas implementations can be reused
+    without pickling one row at a time.
 
     Args:
         engine:
@@ -277,6 +294,43 @@ def column_condition_partial(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
                 )
 
+                def unexpected_condition(column):
+                    if kwargs.get("elementwise", False):
+                        meets_expectation_series = evaluate_on_distinct_values(
+                            column,
+                            lambda values: metric_fn(
+                                cls, values, **metric_value_kwargs, _metrics=metrics,
+                            ),
+                        )
+                    else:
+                        meets_expectation_series = metric_fn(
+                            cls, column, **metric_value_kwargs, _metrics=metrics,
+                        )
+                    return ~meets_expectation_series
+
+                if execution_engine.is_chunked(metric_domain_kwargs):
+                    if kwargs.get("across_rows", False):
+                        raise ChunkedDataNotSupportedError(
+                            f"The {cls.condition_metric_name} condition compares values across rows, and cannot be "
+                            "evaluated one chunk at a time; load the data without a chunksize reader option to "
+                            "compute it."
+                        )
+                    (
+                        data,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    ) = execution_engine.get_chunked_column_domain(metric_domain_kwargs)
+                    return (
+                        _PandasChunkedUnexpectedCondition(
+                            data,
+                            accessor_domain_kwargs["column"],
+                            unexpected_condition,
+                            filter_column_isnull,
+                        ),
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    )
+
                 (
                     df,
                     compute_domain_kwargs,
@@ -284,17 +338,15 @@ def column_condition_partial(
                 ) = execution_engine.get_compute_domain(
                     domain_kwargs=metric_domain_kwargs, domain_type=domain_type
                 )
+                column = df[accessor_domain_kwargs["column"]]
                 if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
-
-                meets_expectation_series = metric_fn(
-                    cls,
-                    df[accessor_domain_kwargs["column"]],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
-                )
+                    column = column[
+                        execution_engine.get_column_nonnull_mask(
+                            df, {**compute_domain_kwargs, **accessor_domain_kwargs}
+                        )
+                    ]
                 return (
-                    ~meets_expectation_series,
+                    unexpected_condition(column),
                     compute_domain_kwargs,
                     accessor_domain_kwargs,
                 )
@@ -413,15 +465,20 @@ def column_condition_partial(
                 )
                 column_name = accessor_domain_kwargs["column"]
                 column = data[column_name]
-                expected_condition = metric_fn(
-                    cls,
-                    column,
-                    **metric_value_kwargs,
-                    _table=data,
-                    _metrics=metrics,
-                    _compute_domain_kwargs=compute_domain_kwargs,
-                    _accessor_domain_kwargs=accessor_domain_kwargs,
-                )
+                if kwargs.get("pandas_udf", False):
+                    expected_condition = _get_spark_pandas_condition_udf(
+                        cls, metric_fn, metric_value_kwargs
+                    )(column)
+                else:
+                    expected_condition = metric_fn(
+                        cls,
+                        column,
+                        **metric_value_kwargs,
+                        _table=data,
+                        _metrics=metrics,
+                        _compute_domain_kwargs=compute_domain_kwargs,
+                        _accessor_domain_kwargs=accessor_domain_kwargs,
+                    )
                 if partial_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN:
                     if filter_column_isnull:
                         compute_domain_kwargs = execution_engine.add_column_row_condition(
@@ -446,6 +503,114 @@ def column_condition_partial(
         raise ValueError("Unsupported engine for column_condition_partial")
 
 
+def _get_spark_pandas_condition_udf(
+    cls, metric_fn: Callable, metric_value_kwargs: Dict
+) -> Callable:
+    """Builds a Spark UDF evaluating a metric_fn written against pandas Series.
+
+    The UDF is vectorized (a pandas_udf), exchanging Arrow batches of rows with the Python workers; if pyarrow is not
+    available, it falls back to a row-wise UDF. Null values are not passed to metric_fn and do not meet the condition.
+    metric_fn is first called on an empty Series, so that invalid value kwargs are reported before any Spark job runs.
+    """
+    metric_fn(cls, pd.Series([], dtype=object), **metric_value_kwargs)
+
+    def evaluate_condition(column: pd.Series) -> pd.Series:
+        expected_condition = pd.Series(False, index=column.index)
+        nonnull_mask = column.notnull()
+        if nonnull_mask.any():
+            expected_condition[nonnull_mask] = metric_fn(
+                cls, column[nonnull_mask], **metric_value_kwargs
+            ).astype(bool)
+        return expected_condition
+
+    try:
+        return F.pandas_udf(evaluate_condition, sparktypes.BooleanType())
+    except ImportError as e:
+        logger.debug(f"Unable to build a vectorized UDF, using a row-wise UDF: {e}")
+        return F.udf(
+            lambda value: bool(
+                evaluate_condition(pd.Series([value], dtype=object)).iloc[0]
+            ),
+            sparktypes.BooleanType(),
+        )
+
+
+class _PandasChunkedUnexpectedCondition:
+    """The unexpected condition of a pandas column map metric on data read in chunks (see PandasChunkedBatchData).
+
+    Rather than holding a boolean Series for the whole column, the condition is evaluated one chunk at a time whenever a
+    metric built on it iterates over it, so that the unexpected count and value counts are summed over the chunks, and
+    the first unexpected values, indices and rows are collected until partial_unexpected_count of them are found.
+    """
+
+    def __init__(
+        self,
+        data,
+        column_name: str,
+        unexpected_condition_fn: Callable,
+        filter_column_isnull: bool,
+    ):
+        self._data = data
+        self._column_name = column_name
+        self._unexpected_condition_fn = unexpected_condition_fn
+        self._filter_column_isnull = filter_column_isnull
+
+    def iter_chunks(self, all_columns: bool = False):
+        """Yields a (rows, column values, unexpected positions) tuple for each chunk of the data, in which the positions
+        locate the unexpected values in the column values and in the rows. Only the column is read, unless all_columns
+        is True."""
+        columns = None if all_columns else [self._column_name]
+        for chunk in self._data.iter_chunks(columns=columns):
+            column = chunk[self._column_name]
+            if self._filter_column_isnull:
+                nonnull_mask = column.notnull().to_numpy()
+                chunk = chunk[nonnull_mask]
+                column = column[nonnull_mask]
+            if len(column) == 0:
+                continue
+            unexpected_positions = _get_pandas_unexpected_positions(
+                self._unexpected_condition_fn(column),
+                column.index,
+                {"result_format": "COMPLETE"},
+            )
+            yield chunk, column, unexpected_positions
+
+    def get_empty_rows(self) -> pd.DataFrame:
+        return self._data.head(0)
+
+
+def _get_pandas_chunked_unexpected_items(
+    condition: _PandasChunkedUnexpectedCondition,
+    result_format: dict,
+    get_items: Callable,
+    all_columns: bool = False,
+) -> list:
+    """Returns the items (e.g. values) that get_items(rows, column values, positions) extracts for the first
+    partial_unexpected_count unexpected values of a chunked condition, one list per chunk; the chunks after them are not
+    read."""
+    if result_format["result_format"] == "COMPLETE":
+        raise ChunkedDataNotSupportedError(
+            "The COMPLETE result format lists every unexpected value, which cannot be done in bounded memory on data "
+            "read in chunks; use the SUMMARY result format, or load the data without a chunksize reader option."
+        )
+    unexpected_count = result_format["partial_unexpected_count"]
+    items = []
+    found_count = 0
+    if unexpected_count <= 0:
+        return items
+    for chunk, column, unexpected_positions in condition.iter_chunks(
+        all_columns=all_columns
+    ):
+        unexpected_positions = unexpected_positions[: unexpected_count - found_count]
+        if len(unexpected_positions) == 0:
+            continue
+        items.append(get_items(chunk, column, unexpected_positions))
+        found_count += len(unexpected_positions)
+        if found_count >= unexpected_count:
+            break
+    return items
+
+
 def _pandas_map_condition_unexpected_count(
     cls,
     execution_engine: "PandasExecutionEngine",
@@ -455,7 +620,77 @@ def _pandas_map_condition_unexpected_count(
     **kwargs,
 ):
     """Returns unexpected count for MapExpectations"""
-    return np.count_nonzero(metrics["unexpected_condition"][0])
+    unexpected_condition = metrics["unexpected_condition"][0]
+    if isinstance(unexpected_condition, _PandasChunkedUnexpectedCondition):
+        return sum(
+            len(unexpected_positions)
+            for _, _, unexpected_positions in unexpected_condition.iter_chunks()
+        )
+    return np.count_nonzero(unexpected_condition)
+
+
+# Size of the blocks of an unexpected condition scanned for the first unexpected values
+_UNEXPECTED_CONDITION_BLOCK_SIZE = 65536
+
+
+def _get_pandas_unexpected_positions(
+    boolean_mapped_unexpected_values, index: pd.Index, result_format: dict
+) -> np.ndarray:
+    """Returns the positions in index of the unexpected values marked by a boolean unexpected condition.
+
+    All the positions are returned for the COMPLETE result format. Otherwise, the condition is scanned block by block,
+    stopping as soon as partial_unexpected_count positions have been found.
+    """
+    if isinstance(boolean_mapped_unexpected_values, pd.Series):
+        if not boolean_mapped_unexpected_values.index.equals(index):
+            boolean_mapped_unexpected_values = boolean_mapped_unexpected_values.reindex(
+                index, fill_value=False
+            )
+        boolean_mapped_unexpected_values = boolean_mapped_unexpected_values.to_numpy()
+    if boolean_mapped_unexpected_values.dtype != bool:
+        # Conditions of object dtype may hold None for rows that were not evaluated
+        boolean_mapped_unexpected_values = boolean_mapped_unexpected_values == True
+
+    if result_format["result_format"] == "COMPLETE":
+        return np.flatnonzero(boolean_mapped_unexpected_values)
+
+    unexpected_count = result_format["partial_unexpected_count"]
+    positions = []
+    found_count = 0
+    for start in range(
+        0, len(boolean_mapped_unexpected_values), _UNEXPECTED_CONDITION_BLOCK_SIZE
+    ):
+        if found_count >= unexpected_count:
+            break
+        block_positions = np.flatnonzero(
+            boolean_mapped_unexpected_values[
+                start : start + _UNEXPECTED_CONDITION_BLOCK_SIZE
+            ]
+        )[: unexpected_count - found_count]
+        positions.append(block_positions + start)
+        found_count += len(block_positions)
+    if len(positions) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(positions)
+
+
+def _get_pandas_domain_values(
+    cls, execution_engine: "PandasExecutionEngine", df, domain_kwargs, **kwargs
+):
+    ###
+    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
+    # currently handle filter_column_isnull differently than other map_fn / map_condition
+    # cases.
+    ###
+    domain_values = df[domain_kwargs["column"]]
+    filter_column_isnull = kwargs.get(
+        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    )
+    if filter_column_isnull:
+        domain_values = domain_values[
+            execution_engine.get_column_nonnull_mask(df, domain_kwargs)
+        ]
+    return domain_values
 
 
 def _pandas_column_map_condition_values(
@@ -472,36 +707,34 @@ def _pandas_column_map_condition_values(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics["unexpected_condition"]
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-    )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
+    if "column" not in accessor_domain_kwargs:
         raise ValueError(
             "_pandas_column_map_condition_values requires a column in accessor_domain_kwargs"
         )
+    if isinstance(boolean_map_unexpected_values, _PandasChunkedUnexpectedCondition):
+        return [
+            value
+            for chunk_values in _get_pandas_chunked_unexpected_items(
+                boolean_map_unexpected_values,
+                metric_value_kwargs["result_format"],
+                lambda rows, column, positions: list(column.iloc[positions]),
+            )
+            for value in chunk_values
+        ]
+    domain_kwargs = {**compute_domain_kwargs, **accessor_domain_kwargs}
+    df, _, _ = execution_engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.COLUMN,
+    )
+    domain_values = _get_pandas_domain_values(
+        cls, execution_engine, df, domain_kwargs, **kwargs
+    )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(domain_values[boolean_map_unexpected_values == True])
-    else:
-        return list(
-            domain_values[boolean_map_unexpected_values == True][
-                : result_format["partial_unexpected_count"]
-            ]
-        )
+    unexpected_positions = _get_pandas_unexpected_positions(
+        boolean_map_unexpected_values,
+        domain_values.index,
+        metric_value_kwargs["result_format"],
+    )
+    return list(domain_values.iloc[unexpected_positions])
 
 
 def _pandas_column_map_series_and_domain_values(
@@ -527,46 +760,28 @@ def _pandas_column_map_series_and_domain_values(
     assert (
         accessor_domain_kwargs == accessor_domain_kwargs_2
     ), "map_series and condition must have the same accessor kwargs"
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-    )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
+    if "column" not in accessor_domain_kwargs:
         raise ValueError(
             "_pandas_column_map_series_and_domain_values requires a column in accessor_domain_kwargs"
         )
+    domain_kwargs = {**compute_domain_kwargs, **accessor_domain_kwargs}
+    df, _, _ = execution_engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.COLUMN,
+    )
+    domain_values = _get_pandas_domain_values(
+        cls, execution_engine, df, domain_kwargs, **kwargs
+    )
 
     result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return (
-            list(domain_values[boolean_map_unexpected_values == True]),
-            list(map_series[boolean_map_unexpected_values == True]),
-        )
-    else:
-        return (
-            list(
-                domain_values[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-            list(
-                map_series[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-        )
+    unexpected_positions = _get_pandas_unexpected_positions(
+        boolean_map_unexpected_values, domain_values.index, result_format
+    )
+    if not map_series.index.equals(domain_values.index):
+        map_series = map_series.reindex(domain_values.index)
+    return (
+        list(domain_values.iloc[unexpected_positions]),
+        list(map_series.iloc[unexpected_positions]),
+    )
 
 
 def _pandas_map_condition_index(
@@ -582,31 +797,30 @@ def _pandas_map_condition_index(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics.get("unexpected_condition")
-
+    if isinstance(boolean_mapped_unexpected_values, _PandasChunkedUnexpectedCondition):
+        return [
+            index
+            for chunk_indices in _get_pandas_chunked_unexpected_items(
+                boolean_mapped_unexpected_values,
+                metric_value_kwargs["result_format"],
+                lambda rows, column, positions: list(column.index[positions]),
+            )
+            for index in chunk_indices
+        ]
+    domain_kwargs = {**compute_domain_kwargs, **accessor_domain_kwargs}
     df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
+        domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.COLUMN,
     )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    domain_values = _get_pandas_domain_values(
+        cls, execution_engine, df, domain_kwargs, **kwargs
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(df[boolean_mapped_unexpected_values == True].index)
-    else:
-        return list(
-            df[boolean_mapped_unexpected_values == True].index[
-                : result_format["partial_unexpected_count"]
-            ]
-        )
+    unexpected_positions = _get_pandas_unexpected_positions(
+        boolean_mapped_unexpected_values,
+        domain_values.index,
+        metric_value_kwargs["result_format"],
+    )
+    return list(domain_values.index[unexpected_positions])
 
 
 def _pandas_column_map_condition_value_counts(
@@ -623,51 +837,65 @@ def _pandas_column_map_condition_value_counts(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics.get("unexpected_condition")
-
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-    )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
+    if "column" not in accessor_domain_kwargs:
         raise ValueError(
             "_pandas_column_map_condition_value_counts requires a column in accessor_domain_kwargs"
         )
-
     result_format = metric_value_kwargs["result_format"]
+    if isinstance(boolean_mapped_unexpected_values, _PandasChunkedUnexpectedCondition):
+        # The value counts of the chunks are summed, so memory is bounded by the number of distinct unexpected values
+        chunk_value_counts = [
+            _get_pandas_value_counts(column.iloc[unexpected_positions])
+            for _, column, unexpected_positions in boolean_mapped_unexpected_values.iter_chunks()
+            if len(unexpected_positions) > 0
+        ]
+        if len(chunk_value_counts) == 0:
+            value_counts = pd.Series([], dtype=np.int64)
+        else:
+            value_counts = (
+                pd.concat(chunk_value_counts)
+                .groupby(level=0, sort=False)
+                .sum()
+                .sort_values(ascending=False, kind="mergesort")
+            )
+    else:
+        domain_kwargs = {**compute_domain_kwargs, **accessor_domain_kwargs}
+        df, _, _ = execution_engine.get_compute_domain(
+            domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.COLUMN,
+        )
+        domain_values = _get_pandas_domain_values(
+            cls, execution_engine, df, domain_kwargs, **kwargs
+        )
+
+        # Value counts are computed over all the unexpected values, whatever the result format
+        unexpected_values = domain_values.iloc[
+            _get_pandas_unexpected_positions(
+                boolean_mapped_unexpected_values,
+                domain_values.index,
+                {"result_format": "COMPLETE"},
+            )
+        ]
+        value_counts = _get_pandas_value_counts(unexpected_values)
+
+    if result_format["result_format"] == "COMPLETE":
+        return value_counts
+    else:
+        return value_counts.iloc[: result_format["partial_unexpected_count"]]
+
+
+def _get_pandas_value_counts(values: pd.Series) -> pd.Series:
     value_counts = None
     try:
-        value_counts = domain_values[
-            boolean_mapped_unexpected_values == True
-        ].value_counts()
+        value_counts = values.value_counts()
     except ValueError:
         try:
-            value_counts = (
-                domain_values[boolean_mapped_unexpected_values == True]
-                .apply(tuple)
-                .value_counts()
-            )
+            value_counts = values.apply(tuple).value_counts()
         except ValueError:
             pass
 
-    if not value_counts:
+    if value_counts is None:
         raise MetricError("Unable to compute value counts")
-
-    if result_format["result_format"] == "COMPLETE":
-        return value_counts
-    else:
-        return value_counts[result_format["partial_unexpected_count"]]
+    return value_counts
 
 
 def _pandas_map_condition_rows(
@@ -684,6 +912,16 @@ def _pandas_map_condition_rows(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics.get("unexpected_condition")
+    if isinstance(boolean_mapped_unexpected_values, _PandasChunkedUnexpectedCondition):
+        unexpected_rows = _get_pandas_chunked_unexpected_items(
+            boolean_mapped_unexpected_values,
+            metric_value_kwargs["result_format"],
+            lambda rows, column, positions: rows.iloc[positions],
+            all_columns=True,
+        )
+        if len(unexpected_rows) == 0:
+            return boolean_mapped_unexpected_values.get_empty_rows()
+        return pd.concat(unexpected_rows)
 
     df, _, _ = execution_engine.get_compute_domain(
         domain_kwargs=compute_domain_kwargs, domain_type="identity"
@@ -697,17 +935,19 @@ def _pandas_map_condition_rows(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
     if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return df[boolean_mapped_unexpected_values == True]
-    else:
-        return df[boolean_mapped_unexpected_values == True][
-            result_format["partial_unexpected_count"]
+        df = df[
+            execution_engine.get_column_nonnull_mask(
+                df, {**compute_domain_kwargs, **accessor_domain_kwargs}
+            )
         ]
 
+    unexpected_positions = _get_pandas_unexpected_positions(
+        boolean_mapped_unexpected_values,
+        df.index,
+        metric_value_kwargs["result_format"],
+    )
+    return df.iloc[unexpected_positions]
+
 
 def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
     cls,
@@ -779,6 +1019,20 @@ def _sqlalchemy_map_condition_unexpected_count_value(
     return convert_to_json_serializable(unexpected_count)
 
 
+def _sqlalchemy_has_no_unexpected_values(metrics: Dict[str, Any]) -> bool:
+    """Whether the unexpected_count metric, when it is a dependency, shows there are no unexpected values to fetch"""
+    unexpected_count = metrics.get("unexpected_count")
+    return unexpected_count is not None and unexpected_count == 0
+
+
+def _sqlalchemy_limit_to_result_format(query, result_format: Dict):
+    """Limits query to the partial_unexpected_count rows needed by result formats other than COMPLETE. SqlAlchemy
+    renders the limit with the syntax of the dialect, e.g. LIMIT, TOP or FETCH FIRST."""
+    if result_format["result_format"] == "COMPLETE":
+        return query
+    return query.limit(result_format["partial_unexpected_count"])
+
+
 def _sqlalchemy_column_map_condition_values(
     cls,
     execution_engine: "SqlAlchemyExecutionEngine",
@@ -791,6 +1045,8 @@ def _sqlalchemy_column_map_condition_values(
     Particularly for the purpose of finding unexpected values, returns all the metric values which do not meet an
     expected Expectation condition for ColumnMapExpectation Expectations.
     """
+    if _sqlalchemy_has_no_unexpected_values(metrics):
+        return []
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
         "unexpected_condition"
     )
@@ -811,8 +1067,7 @@ def _sqlalchemy_column_map_condition_values(
         .select_from(selectable)
         .where(unexpected_condition)
     )
-    if result_format["result_format"] != "COMPLETE":
-        query = query.limit(result_format["partial_unexpected_count"])
+    query = _sqlalchemy_limit_to_result_format(query, result_format)
     return [
         val.unexpected_values
         for val in execution_engine.engine.execute(query).fetchall()
@@ -829,8 +1084,11 @@ def _sqlalchemy_column_map_condition_value_counts(
 ):
     """
     Returns value counts for all the metric values which do not meet an expected Expectation condition for instances
-    of ColumnMapExpectation.
+    of ColumnMapExpectation. Result formats other than COMPLETE only need the partial_unexpected_count most common
+    values.
     """
+    if _sqlalchemy_has_no_unexpected_values(metrics):
+        return []
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
         "unexpected_condition"
     )
@@ -842,12 +1100,18 @@ def _sqlalchemy_column_map_condition_value_counts(
             "_sqlalchemy_column_map_condition_value_counts requires a column in accessor_domain_kwargs"
         )
     column = sa.column(accessor_domain_kwargs["column"])
-    return execution_engine.engine.execute(
+    query = (
         sa.select([column, sa.func.count(column)])
         .select_from(selectable)
         .where(unexpected_condition)
         .group_by(column)
-    ).fetchall()
+    )
+    result_format = metric_value_kwargs.get("result_format")
+    if result_format is not None and result_format["result_format"] != "COMPLETE":
+        query = _sqlalchemy_limit_to_result_format(
+            query.order_by(sa.func.count(column).desc()), result_format
+        )
+    return execution_engine.engine.execute(query).fetchall()
 
 
 def _sqlalchemy_map_condition_rows(
@@ -862,6 +1126,8 @@ def _sqlalchemy_map_condition_rows(
     Returns all rows of the metric values which do not meet an expected Expectation condition for instances
     of ColumnMapExpectation.
     """
+    if _sqlalchemy_has_no_unexpected_values(metrics):
+        return []
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
         "unexpected_condition"
     )
@@ -873,8 +1139,7 @@ def _sqlalchemy_map_condition_rows(
     query = (
         sa.select([sa.text("*")]).select_from(selectable).where(unexpected_condition)
     )
-    if result_format["result_format"] != "COMPLETE":
-        query = query.limit(result_format["partial_unexpected_count"])
+    query = _sqlalchemy_limit_to_result_format(query, result_format)
     return execution_engine.engine.execute(query).fetchall()
 
 
@@ -1126,6 +1391,10 @@ class MapMetricProvider(MetricProvider):
                         )
 
                 elif issubclass(engine, SqlAlchemyExecutionEngine):
+                    # A condition may provide its own implementation of the value metrics built on it
+                    value_metric_providers = metric_definition_kwargs.get(
+                        "value_metric_providers", dict()
+                    )
                     register_metric(
                         metric_name=metric_name + ".condition",
                         metric_domain_keys=metric_domain_keys,
@@ -1163,7 +1432,10 @@ class MapMetricProvider(MetricProvider):
                             metric_value_keys=metric_value_keys,
                             execution_engine=engine,
                             metric_class=cls,
-                            metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
+                            metric_provider=value_metric_providers.get(
+                                ".unexpected_count",
+                                _sqlalchemy_map_condition_unexpected_count_value,
+                            ),
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     register_metric(
@@ -1172,7 +1444,9 @@ class MapMetricProvider(MetricProvider):
                         metric_value_keys=(*metric_value_keys, "result_format"),
                         execution_engine=engine,
                         metric_class=cls,
-                        metric_provider=_sqlalchemy_map_condition_rows,
+                        metric_provider=value_metric_providers.get(
+                            ".unexpected_rows", _sqlalchemy_map_condition_rows
+                        ),
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
                     if domain_type == MetricDomainTypes.COLUMN:
@@ -1182,7 +1456,10 @@ class MapMetricProvider(MetricProvider):
                             metric_value_keys=(*metric_value_keys, "result_format"),
                             execution_engine=engine,
                             metric_class=cls,
-                            metric_provider=_sqlalchemy_column_map_condition_values,
+                            metric_provider=value_metric_providers.get(
+                                ".unexpected_values",
+                                _sqlalchemy_column_map_condition_values,
+                            ),
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                         register_metric(
@@ -1191,7 +1468,10 @@ class MapMetricProvider(MetricProvider):
                             metric_value_keys=(*metric_value_keys, "result_format"),
                             execution_engine=engine,
                             metric_class=cls,
-                            metric_provider=_sqlalchemy_column_map_condition_value_counts,
+                            metric_provider=value_metric_providers.get(
+                                ".unexpected_value_counts",
+                                _sqlalchemy_column_map_condition_value_counts,
+                            ),
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                 elif issubclass(engine, SparkDFExecutionEngine):
@@ -1342,6 +1622,19 @@ class MapMetricProvider(MetricProvider):
                     metric.metric_domain_kwargs,
                     base_metric_value_kwargs,
                 )
+                # Queries for unexpected values are skipped when there are none
+                if isinstance(
+                    execution_engine, SqlAlchemyExecutionEngine
+                ) and metric_suffix in [
+                    ".unexpected_values",
+                    ".unexpected_value_counts",
+                    ".unexpected_rows",
+                ]:
+                    dependencies["unexpected_count"] = MetricConfiguration(
+                        metric_name[: -len(metric_suffix)] + ".unexpected_count",
+                        metric.metric_domain_kwargs,
+                        base_metric_value_kwargs,
+                    )
 
         return dependencies
 
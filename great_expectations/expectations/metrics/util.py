@@ -1,7 +1,11 @@
+import json
 import logging
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import jsonschema
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 
 try:
@@ -69,6 +73,12 @@ SCHEMAS = {
     "mssql": {"NegativeInfinity": -1.79e308, "PositiveInfinity": 1.79e308,},
 }
 
+# Bound on the number of compiled JSON schema validators kept by each process
+COMPILED_CACHE_MAXSIZE = 256
+
+# Elementwise functions are evaluated once per distinct value when at most this fraction of the values is distinct
+ELEMENTWISE_DISTINCT_RATIO_THRESHOLD = 0.5
+
 
 def get_sql_dialect_floating_point_infinity_value(
     schema: str, negative: bool = False
@@ -507,3 +517,51 @@ def is_valid_continuous_partition_object(partition_object):
         and np.all(np.diff(partition_object["bins"]) > 0)
         and np.allclose(np.sum(comb_weights), 1.0)
     )
+
+
+def get_json_schema_validator(json_schema: dict) -> Any:
+    """Builds a validator for json_schema, caching it in the process by the canonical JSON of the schema so that the
+    schema is only checked and compiled once.
+
+    Raises:
+        jsonschema.SchemaError: if json_schema is not a valid schema
+    """
+    return _get_json_schema_validator(json.dumps(json_schema, sort_keys=True))
+
+
+@lru_cache(maxsize=COMPILED_CACHE_MAXSIZE)
+def _get_json_schema_validator(json_schema_key: str) -> Any:
+    json_schema = json.loads(json_schema_key)
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(json_schema)
+
+
+def evaluate_on_distinct_values(
+    column: pd.Series, series_fn: Callable[[pd.Series], Any]
+) -> pd.Series:
+    """Evaluates series_fn, an elementwise function of a Series, once per distinct value of column and broadcasts the
+    results back to the rows through the codes of the factorized column.
+
+    Factorizing only pays off when values repeat, so empty columns, columns of unhashable values and columns in which
+    more than ELEMENTWISE_DISTINCT_RATIO_THRESHOLD of the values are distinct are evaluated as a whole. Missing values
+    are evaluated on their own rows, so that None and NaN keep their own results.
+    """
+    if len(column) == 0:
+        return series_fn(column)
+    try:
+        codes, uniques = pd.factorize(column)
+    except TypeError:
+        return series_fn(column)
+    if len(uniques) == 0 or (
+        len(uniques) > ELEMENTWISE_DISTINCT_RATIO_THRESHOLD * len(column)
+    ):
+        return series_fn(column)
+
+    distinct_values = np.asarray(series_fn(pd.Series(uniques)))
+    missing_mask = codes == -1
+    # Missing values have the code -1, which takes the last distinct value until they are overwritten below
+    result = pd.Series(distinct_values.take(codes), index=column.index)
+    if missing_mask.any():
+        result[missing_mask] = np.asarray(series_fn(column[missing_mask]))
+    return result
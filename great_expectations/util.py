@@ -3,6 +3,7 @@ import importlib
 import json
 import logging
 import os
+import threading
 import time
 from collections import OrderedDict
 from functools import wraps
@@ -19,13 +20,14 @@ from inspect import (
 )
 from pathlib import Path
 from types import CodeType, FrameType, ModuleType
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import black
 from pkg_resources import Distribution
 
 from great_expectations.core.expectation_suite import expectationSuiteSchema
 from great_expectations.exceptions import (
+    InvalidConfigError,
     PluginClassNotFoundError,
     PluginModuleNotFoundError,
 )
@@ -37,6 +39,10 @@ except ModuleNotFoundError:
     # Fallback for python < 3.8
     import importlib_metadata
 
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
 
 logger = logging.getLogger(__name__)
 
@@ -839,3 +845,160 @@ def get_context():
     from great_expectations.data_context.data_context_v3 import DataContextV3
 
     return DataContextV3()
+
+
+class SqlAlchemyEngineRegistry(object):
+    """A process-wide registry of SqlAlchemy engines, so that every datasource, execution engine and store which
+    targets the same database shares a single connection pool.
+
+    Engines are keyed by the normalized connection url together with the keyword arguments passed to
+    ``create_engine`` (including connect_args). Pool settings configured on the registry are applied to every engine
+    it creates, unless they are overridden by the ``pool_options`` of a datasource, execution engine or store (or
+    passed to ``create_engine`` explicitly). In-memory sqlite databases are private to the engine that creates them,
+    so they are never shared.
+    """
+
+    QUEUE_POOL_OPTIONS = ("pool_size", "max_overflow", "pool_timeout")
+    POOL_OPTIONS = QUEUE_POOL_OPTIONS + ("pool_pre_ping", "pool_recycle")
+
+    def __init__(self):
+        self._engines: Dict[Tuple[str, str], "sa.engine.Engine"] = {}
+        self._pool_options: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pool_options(self) -> Dict[str, Any]:
+        return dict(self._pool_options)
+
+    def configure(
+        self,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_timeout: Optional[float] = None,
+        pool_pre_ping: Optional[bool] = None,
+        pool_recycle: Optional[int] = None,
+    ) -> None:
+        """Sets the pool options used for engines created from now on. Options left as None are reset to the
+        SqlAlchemy defaults. pool_size, max_overflow and pool_timeout only apply to dialects using a QueuePool."""
+        self._pool_options = {
+            option: value
+            for option, value in (
+                ("pool_size", pool_size),
+                ("max_overflow", max_overflow),
+                ("pool_timeout", pool_timeout),
+                ("pool_pre_ping", pool_pre_ping),
+                ("pool_recycle", pool_recycle),
+            )
+            if value is not None
+        }
+
+    def get_engine(
+        self, url, pool_options: Optional[dict] = None, **create_engine_kwargs
+    ) -> "sa.engine.Engine":
+        """Returns the engine registered for url and create_engine_kwargs, creating it on first use.
+
+        Args:
+            url (str or sqlalchemy.engine.url.URL): the url of the database
+            pool_options (dict): pool options (see configure) for this engine, overriding those of the registry
+            **create_engine_kwargs: passed to sqlalchemy.create_engine
+
+        Returns:
+            A SqlAlchemy Engine
+
+        Raises:
+            InvalidConfigError: if pool_options contains an unknown option
+        """
+        url = sa.engine.url.make_url(url)
+        create_engine_kwargs = self._with_pool_options(
+            url, pool_options, create_engine_kwargs
+        )
+        if url.drivername.startswith("sqlite") and url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            return sa.create_engine(url, **create_engine_kwargs)
+
+        key = self._get_engine_key(url, create_engine_kwargs)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = sa.create_engine(url, **create_engine_kwargs)
+                self._engines[key] = engine
+            return engine
+
+    def dispose(self) -> None:
+        """Closes the connection pools of all registered engines and forgets them."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines = {}
+
+    def __len__(self):
+        return len(self._engines)
+
+    def _with_pool_options(
+        self, url, pool_options: Optional[dict], create_engine_kwargs: dict
+    ) -> dict:
+        unknown_options = set(pool_options or {}) - set(self.POOL_OPTIONS)
+        if unknown_options:
+            raise InvalidConfigError(
+                f"Unknown SqlAlchemy pool options {sorted(unknown_options)}; the supported options are "
+                f"{list(self.POOL_OPTIONS)}"
+            )
+        pool_options = {
+            **self._pool_options,
+            **{
+                option: value
+                for option, value in (pool_options or {}).items()
+                if value is not None
+            },
+        }
+        if not pool_options:
+            return create_engine_kwargs
+
+        poolclass = create_engine_kwargs.get("poolclass")
+        if poolclass is None and "pool" not in create_engine_kwargs:
+            try:
+                poolclass = url.get_dialect().get_pool_class(url)
+            except Exception:
+                # the dialect cannot be loaded; create_engine will report it
+                poolclass = None
+        if not (
+            isinstance(poolclass, type) and issubclass(poolclass, sa.pool.QueuePool)
+        ):
+            pool_options = {
+                option: value
+                for option, value in pool_options.items()
+                if option not in self.QUEUE_POOL_OPTIONS
+            }
+        return {**pool_options, **create_engine_kwargs}
+
+    @staticmethod
+    def _get_engine_key(url, create_engine_kwargs: dict) -> Tuple[str, str]:
+        normalized_url = sa.engine.url.URL(
+            drivername=url.drivername,
+            username=url.username,
+            password=url.password,
+            host=url.host.lower() if url.host else url.host,
+            port=url.port,
+            database=url.database,
+            query=dict(sorted(url.query.items())),
+        )
+        return (
+            str(normalized_url),
+            json.dumps(create_engine_kwargs, sort_keys=True, default=repr),
+        )
+
+
+sqlalchemy_engine_registry = SqlAlchemyEngineRegistry()
+
+
+def get_sqlalchemy_engine(
+    url, pool_options: Optional[dict] = None, **create_engine_kwargs
+) -> "sa.engine.Engine":
+    """Returns the shared SqlAlchemy engine for url, pool_options and create_engine_kwargs (see
+    SqlAlchemyEngineRegistry)."""
+    return sqlalchemy_engine_registry.get_engine(
+        url, pool_options=pool_options, **create_engine_kwargs
+    )
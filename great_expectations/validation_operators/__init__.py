@@ -1,5 +1,6 @@
 from great_expectations.util import verify_dynamic_loading_support
 
+from .action_dispatcher import ActionDispatcher
 from .actions import (
     NoOpAction,
     OpsgenieAlertAction,
@@ -19,6 +20,7 @@ from .validation_operators import (
 )
 
 for module_name, package_name in [
+    (".action_dispatcher", "great_expectations.validation_operators"),
     (".actions", "great_expectations.validation_operators"),
     (".validation_operators", "great_expectations.validation_operators"),
     (".util", "great_expectations.validation_operators"),
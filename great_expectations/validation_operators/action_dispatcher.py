@@ -0,0 +1,121 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+class ActionDispatcher:
+    """
+    ActionDispatcher runs validation actions on a pool of background worker threads, so that validation does not wait
+    for the side effects of the actions (storing results, building data docs, sending notifications).
+
+    Work is queued with ``submit``, which returns a ``concurrent.futures.Future``. The queue is bounded: once
+    ``max_queue_size`` tasks are waiting, ``submit`` blocks until a worker takes one, so that validation cannot run
+    arbitrarily far ahead of its actions. ``flush`` waits until every submitted task is done, and ``shutdown`` also
+    stops the workers.
+
+    Actions that fail are retried by ``call_with_retries`` up to ``max_retries`` times, waiting ``retry_delay``
+    seconds before the first retry and twice as long before each following one.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self, max_workers=1, max_queue_size=64, max_retries=0, retry_delay=1.0,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self._max_workers = max_workers
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._workers = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        """Queues fn(*args, **kwargs) to run on a worker thread, blocking while the queue is full.
+
+        Returns:
+            a Future holding the result of the call
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    "Cannot submit actions to a shut down ActionDispatcher"
+                )
+            if len(self._workers) < self._max_workers:
+                self._start_worker()
+            future = Future()
+            self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def call_with_retries(self, fn, *args, **kwargs):
+        """Calls fn(*args, **kwargs), retrying it when it raises an exception; the last exception is re-raised."""
+        delay = self._retry_delay
+        for attempt in range(self._max_retries + 1):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt == self._max_retries:
+                    raise
+                logger.warning(
+                    "Attempt {} of {} failed ({}); retrying in {} seconds.".format(
+                        attempt + 1, self._max_retries + 1, e, delay
+                    )
+                )
+                time.sleep(delay)
+                delay *= 2
+
+    def flush(self):
+        """Waits until every task submitted so far is done."""
+        self._queue.join()
+
+    def shutdown(self):
+        """Waits until every submitted task is done and stops the worker threads."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            workers = self._workers
+        for _ in workers:
+            self._queue.put(self._STOP)
+        for worker in workers:
+            worker.join()
+
+    def _start_worker(self):
+        worker = threading.Thread(
+            target=self._work,
+            name="ge-action-dispatcher-{}".format(len(self._workers)),
+            daemon=True,
+        )
+        worker.start()
+        self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is self._STOP:
+                    return
+                future, fn, args, kwargs = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
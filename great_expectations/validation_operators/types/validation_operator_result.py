@@ -32,6 +32,11 @@ class ValidationOperatorResult(DictDot):
             "actions_results": {}
         }
     }
+
+    Operators which keep running the other assets when one of them fails record the failures in the exceptions
+    property: a list of dictionaries with the "asset_index" of the failing item of assets_to_validate, its
+    "validation_result_identifier" (None if it could not be validated) and the "exception" raised. A result with
+    exceptions is not successful.
     """
 
     def __init__(
@@ -44,17 +49,22 @@ class ValidationOperatorResult(DictDot):
         validation_operator_config,
         evaluation_parameters: dict = None,
         success: bool = None,
+        exceptions: List[dict] = None,
     ) -> None:
         self._run_id = run_id
         self._run_results = run_results
         self._evaluation_parameters = evaluation_parameters
         self._validation_operator_config = validation_operator_config
-        self._success = success or all(
-            [
-                run_result["validation_result"].success
-                for run_result in run_results.values()
-            ]
-        )
+        self._exceptions = exceptions or []
+        self._success = (
+            success
+            or all(
+                [
+                    run_result["validation_result"].success
+                    for run_result in run_results.values()
+                ]
+            )
+        ) and len(self._exceptions) == 0
 
         self._validation_results = None
         self._data_assets_validated = None
@@ -94,6 +104,10 @@ class ValidationOperatorResult(DictDot):
     def success(self) -> bool:
         return self._success
 
+    @property
+    def exceptions(self) -> List[dict]:
+        return self._exceptions
+
     def list_batch_identifiers(self) -> List[str]:
         if self._batch_identifiers is None:
             self._batch_identifiers = list(
@@ -1,6 +1,9 @@
 import logging
+import os
+import threading
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from dateutil.parser import parse
 
@@ -18,6 +21,7 @@ from great_expectations.validation_operators.types.validation_operator_result im
 from great_expectations.validator.validator import Validator
 
 from ..core.run_identifier import RunIdentifier
+from .action_dispatcher import ActionDispatcher
 from .util import send_slack_notification
 
 logger = logging.getLogger(__name__)
@@ -186,19 +190,93 @@ The ``run`` method returns a ValidationOperatorResult object:
             }
         },
     }
+
+**Concurrency**
+
+By default assets are validated one at a time. Setting ``concurrency`` in the operator's configuration validates up to
+``max_workers`` assets at once, using either a thread pool (the default) or a process pool:
+
+.. code-block:: yaml
+
+  perform_action_list_operator:
+    class_name: ActionListValidationOperator
+    concurrency:
+      enabled: true
+      max_workers: 8
+      executor: thread  # or "process"
+    action_list:
+      ...
+
+The ``run_results`` of the returned ValidationOperatorResult are in the same order as ``assets_to_validate``. An
+exception raised while validating one asset, or while running its actions, does not stop the other assets: every asset
+is run to completion, and the run results of the assets that succeeded are returned. The failures are listed in the
+``exceptions`` of the ValidationOperatorResult (see ValidationOperatorResult.exceptions), whose ``success`` is then
+False.
+
+The process executor needs each asset to be a (batch_kwargs, expectation_suite_name) tuple and the data context to have
+a root directory: every worker process builds its own data context and operator from their configurations, and only
+the validation and action results are sent back.
+
+**Action dispatch**
+
+By default the actions of each validation result run inline, before the next asset is validated. Setting
+``action_dispatch`` hands them to an :py:class:`ActionDispatcher<great_expectations.validation_operators.action_dispatcher.ActionDispatcher>`
+instead, which runs them on background worker threads while validation continues:
+
+.. code-block:: yaml
+
+  perform_action_list_operator:
+    class_name: ActionListValidationOperator
+    action_dispatch:
+      enabled: true
+      max_workers: 1  # threads running actions; the actions of one validation result always run in order
+      max_queue_size: 64  # validation waits while this many validation results are waiting for their actions
+      max_retries: 2  # a failed action is retried, after retry_delay seconds and twice as long each following time
+      retry_delay: 1.0
+    action_list:
+      ...
+
+``run`` waits for all dispatched actions before returning, so the returned ValidationOperatorResult is the same as with
+inline actions. As with concurrent validation, an exception raised by the actions of one validation result does not
+stop the others: the run result keeps its validation result, its ``actions_results`` is None, and the failure is listed
+in the ``exceptions`` of the ValidationOperatorResult.
+
+**Releasing materializations**
+
+Setting ``release_materializations: true`` drops the server-side materializations (e.g. temporary tables or persisted
+Spark DataFrames) made by the execution engines of the Validators in ``assets_to_validate`` when the run ends, so that
+they are reused by the suites of one run but not by later runs. It is off by default, because the Validators belong to
+the caller: once their materializations are dropped, they cannot be used to validate or compute metrics again.
     """
 
+    CONCURRENCY_EXECUTORS = ("thread", "process")
+
     def __init__(
         self,
         data_context,
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        concurrency=None,
+        action_dispatch=None,
+        release_materializations=False,
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
 
+        concurrency = concurrency or {}
+        executor = concurrency.get("executor", "thread")
+        if executor not in self.CONCURRENCY_EXECUTORS:
+            raise ValueError(
+                "concurrency executor must be one of {}; instead got {}".format(
+                    self.CONCURRENCY_EXECUTORS, executor
+                )
+            )
+        self.concurrency = concurrency
+        self.action_dispatch = action_dispatch or {}
+        self.release_materializations = release_materializations
+
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
             "BOOLEAN_ONLY",
@@ -247,6 +325,18 @@ The ``run`` method returns a ValidationOperatorResult object:
                     "result_format": self.result_format,
                 },
             }
+            if self.concurrency:
+                self._validation_operator_config["kwargs"][
+                    "concurrency"
+                ] = self.concurrency
+            if self.action_dispatch:
+                self._validation_operator_config["kwargs"][
+                    "action_dispatch"
+                ] = self.action_dispatch
+            if self.release_materializations:
+                self._validation_operator_config["kwargs"][
+                    "release_materializations"
+                ] = True
         return self._validation_operator_config
 
     def _build_batch_from_item(self, item):
@@ -309,41 +399,318 @@ The ``run`` method returns a ValidationOperatorResult object:
             run_id = RunIdentifier(run_name=run_name, run_time=run_time)
 
         run_results = {}
-
-        for item in assets_to_validate:
-            run_result_obj = {}
-            batch = self._build_batch_from_item(item)
-            expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=batch._expectation_suite.expectation_suite_name
-            )
-            validation_result_id = ValidationResultIdentifier(
-                batch_identifier=batch.batch_id,
-                expectation_suite_identifier=expectation_suite_identifier,
-                run_id=run_id,
-            )
-            batch_validation_result = batch.validate(
-                run_id=run_id,
-                result_format=result_format if result_format else self.result_format,
-                evaluation_parameters=evaluation_parameters,
+        asset_indices = {}
+        exceptions = []
+        result_format = result_format if result_format else self.result_format
+        assets_to_validate = list(assets_to_validate)
+        max_workers = self._get_max_workers(assets_to_validate)
+        action_dispatcher = self._build_action_dispatcher()
+        try:
+            if max_workers is None:
+                # Validators share a single metric cache for the duration of the run, so that metrics needed by
+                # several expectation suites validated against the same batch are only computed once.
+                metric_cache_holder = {}
+                metric_cache_lock = threading.Lock()
+                for asset_index, item in enumerate(assets_to_validate):
+                    validation_result_id, run_result_obj = self._validate_item(
+                        item,
+                        run_id,
+                        evaluation_parameters,
+                        result_format,
+                        metric_cache_holder,
+                        metric_cache_lock,
+                        action_dispatcher,
+                    )
+                    run_results[validation_result_id] = run_result_obj
+                    asset_indices[validation_result_id] = asset_index
+            else:
+                results, exceptions = self._validate_items_concurrently(
+                    assets_to_validate,
+                    run_id,
+                    evaluation_parameters,
+                    result_format,
+                    max_workers,
+                    action_dispatcher,
+                )
+                for asset_index, validation_result_id, run_result_obj in results:
+                    run_results[validation_result_id] = run_result_obj
+                    asset_indices[validation_result_id] = asset_index
+        finally:
+            if action_dispatcher is not None:
+                action_dispatcher.shutdown()
+            if self.release_materializations:
+                self._release_materializations(assets_to_validate)
+        if action_dispatcher is not None:
+            exceptions = sorted(
+                exceptions
+                + self._collect_dispatched_actions_results(run_results, asset_indices),
+                key=lambda exception: exception["asset_index"],
             )
-            run_result_obj["validation_result"] = batch_validation_result
+
+        return ValidationOperatorResult(
+            run_id=run_id,
+            run_results=run_results,
+            validation_operator_config=self.validation_operator_config,
+            evaluation_parameters=evaluation_parameters,
+            exceptions=exceptions,
+        )
+
+    def _get_max_workers(self, assets_to_validate):
+        """Returns the number of workers to validate assets_to_validate with, or None to validate them serially."""
+        if not self.concurrency.get("enabled", False):
+            return None
+        max_workers = self.concurrency.get("max_workers") or min(
+            32, (os.cpu_count() or 1) + 4
+        )
+        max_workers = min(max_workers, len(assets_to_validate))
+        if max_workers <= 1:
+            return None
+        return max_workers
+
+    def _build_action_dispatcher(self):
+        """Returns an ActionDispatcher for a run if action dispatch is enabled, or None to run actions inline."""
+        if not self.action_dispatch.get("enabled", False):
+            return None
+        return ActionDispatcher(
+            **{
+                key: value
+                for key, value in self.action_dispatch.items()
+                if key != "enabled"
+            }
+        )
+
+    @staticmethod
+    def _collect_dispatched_actions_results(run_results, asset_indices):
+        """Replaces the futures of dispatched actions with their results once the dispatcher has been shut down.
+
+        The "actions_results" of a run result whose actions raised an exception is set to None.
+
+        Args:
+            run_results: the run results of the run, by ValidationResultIdentifier
+            asset_indices: the index in assets_to_validate of the asset of each run result
+
+        Returns:
+            the list of the failures of the actions (see ValidationOperatorResult.exceptions)
+        """
+        exceptions = []
+        for validation_result_id, run_result_obj in run_results.items():
+            exception = run_result_obj["actions_results"].exception()
+            if exception is not None:
+                logger.error(
+                    "Error running actions for {}: {}".format(
+                        validation_result_id, exception
+                    )
+                )
+                run_result_obj["actions_results"] = None
+                exceptions.append(
+                    {
+                        "asset_index": asset_indices[validation_result_id],
+                        "validation_result_identifier": validation_result_id,
+                        "exception": exception,
+                    }
+                )
+                continue
+            run_result_obj["actions_results"] = run_result_obj[
+                "actions_results"
+            ].result()
+        return exceptions
+
+    def _validate_item(
+        self,
+        item,
+        run_id,
+        evaluation_parameters,
+        result_format,
+        metric_cache_holder=None,
+        metric_cache_lock=None,
+        action_dispatcher=None,
+    ):
+        """Validates one item of assets_to_validate and runs the configured actions on its validation result.
+
+        Args:
+            item: an item of assets_to_validate (see _build_batch_from_item)
+            run_id: the RunIdentifier of the run
+            evaluation_parameters: evaluation parameters to validate the batch with
+            result_format: the result_format to validate the batch with
+            metric_cache_holder: a dictionary holding the "metric_cache" shared by the Validators of the run, if any
+            metric_cache_lock: a lock guarding metric_cache_holder
+            action_dispatcher: if given, the actions are submitted to this ActionDispatcher, and the "actions_results"
+                of the run result is a Future
+
+        Returns:
+            a (ValidationResultIdentifier, run result) tuple
+        """
+        batch = self._build_batch_from_item(item)
+        if isinstance(batch, Validator):
+            if metric_cache_holder is not None:
+                self._share_metric_cache(batch, metric_cache_holder, metric_cache_lock)
+            batch_identifier = batch.active_batch_id
+        else:
+            batch_identifier = batch.batch_id
+        expectation_suite_identifier = ExpectationSuiteIdentifier(
+            expectation_suite_name=batch._expectation_suite.expectation_suite_name
+        )
+        validation_result_id = ValidationResultIdentifier(
+            batch_identifier=batch_identifier,
+            expectation_suite_identifier=expectation_suite_identifier,
+            run_id=run_id,
+        )
+        batch_validation_result = batch.validate(
+            run_id=run_id,
+            result_format=result_format,
+            evaluation_parameters=evaluation_parameters,
+        )
+        if action_dispatcher is None:
             batch_actions_results = self._run_actions(
                 batch,
                 expectation_suite_identifier,
                 batch._expectation_suite,
                 batch_validation_result,
                 run_id,
+                batch_identifier=batch_identifier,
+            )
+        else:
+            batch_actions_results = action_dispatcher.submit(
+                self._run_actions,
+                batch,
+                expectation_suite_identifier,
+                batch._expectation_suite,
+                batch_validation_result,
+                run_id,
+                action_dispatcher=action_dispatcher,
+                batch_identifier=batch_identifier,
+            )
+        run_result_obj = {
+            "validation_result": batch_validation_result,
+            "actions_results": batch_actions_results,
+        }
+        return validation_result_id, run_result_obj
+
+    @staticmethod
+    def _release_materializations(assets_to_validate):
+        """Drops the server-side materializations (e.g. temporary tables or persisted Spark DataFrames) made by the
+        execution engines of the Validators of a run, so that later runs do not reuse snapshots of their data."""
+        execution_engines = {
+            id(item.execution_engine): item.execution_engine
+            for item in assets_to_validate
+            if isinstance(item, Validator)
+        }
+        for execution_engine in execution_engines.values():
+            release_materializations = getattr(
+                execution_engine, "release_materializations", None
             )
+            if release_materializations is not None:
+                release_materializations()
+
+    @staticmethod
+    def _share_metric_cache(validator, metric_cache_holder, metric_cache_lock):
+        """Makes every Validator of a run use the metric cache of the first one."""
+        with metric_cache_lock:
+            metric_cache = metric_cache_holder.get("metric_cache")
+            if metric_cache is None:
+                metric_cache_holder[
+                    "metric_cache"
+                ] = validator.execution_engine.metric_cache
+            else:
+                validator.execution_engine.metric_cache = metric_cache
+
+    def _validate_items_concurrently(
+        self,
+        assets_to_validate,
+        run_id,
+        evaluation_parameters,
+        result_format,
+        max_workers,
+        action_dispatcher=None,
+    ):
+        """Validates assets_to_validate with a pool of max_workers workers.
 
-            run_result_obj["actions_results"] = batch_actions_results
-            run_results[validation_result_id] = run_result_obj
+        Every item is run to completion even if others fail.
 
-        return ValidationOperatorResult(
-            run_id=run_id,
-            run_results=run_results,
-            validation_operator_config=self.validation_operator_config,
-            evaluation_parameters=evaluation_parameters,
-        )
+        Returns:
+            a tuple of the (asset index, ValidationResultIdentifier, run result) tuples of the items that succeeded, in
+            the order of assets_to_validate, and of the list of failures (see ValidationOperatorResult.exceptions)
+        """
+        executor_type = self.concurrency.get("executor", "thread")
+        if executor_type == "process":
+            self._check_process_executor_items(assets_to_validate)
+            operator_config = dict(
+                self.validation_operator_config["kwargs"],
+                class_name=self.validation_operator_config["class_name"],
+                module_name=self.validation_operator_config["module_name"],
+                name=self.name,
+            )
+            # The actions of a worker process run in that process
+            operator_config.pop("action_dispatch", None)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _validate_item_in_subprocess,
+                        self.data_context.get_config(),
+                        self.data_context.root_directory,
+                        operator_config,
+                        item,
+                        run_id,
+                        evaluation_parameters,
+                        result_format,
+                    )
+                    for item in assets_to_validate
+                ]
+        else:
+            metric_cache_holder = {}
+            metric_cache_lock = threading.Lock()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._validate_item,
+                        item,
+                        run_id,
+                        evaluation_parameters,
+                        result_format,
+                        metric_cache_holder,
+                        metric_cache_lock,
+                        action_dispatcher,
+                    )
+                    for item in assets_to_validate
+                ]
+
+        results = []
+        exceptions = []
+        for index, future in enumerate(futures):
+            exception = future.exception()
+            if exception is not None:
+                logger.error(
+                    "Error validating item {} of assets_to_validate: {}".format(
+                        index, exception
+                    )
+                )
+                exceptions.append(
+                    {
+                        "asset_index": index,
+                        "validation_result_identifier": None,
+                        "exception": exception,
+                    }
+                )
+                continue
+            results.append((index, *future.result()))
+        return results, exceptions
+
+    def _check_process_executor_items(self, assets_to_validate):
+        if self.data_context.root_directory is None:
+            raise ValueError(
+                "The process concurrency executor requires a data context with a root directory."
+            )
+        for item in assets_to_validate:
+            if not (
+                isinstance(item, tuple)
+                and len(item) == 2
+                and isinstance(item[0], dict)
+                and isinstance(item[1], str)
+            ):
+                raise ValueError(
+                    "The process concurrency executor can only validate (batch_kwargs, expectation_suite_name) "
+                    "tuples."
+                )
 
     def _run_actions(
         self,
@@ -352,6 +719,8 @@ The ``run`` method returns a ValidationOperatorResult object:
         expectation_suite,
         batch_validation_result,
         run_id,
+        action_dispatcher=None,
+        batch_identifier=None,
     ):
         """
         Runs all actions configured for this operator on the result of validating one
@@ -363,8 +732,13 @@ The ``run`` method returns a ValidationOperatorResult object:
         :param expectation_suite:
         :param batch_validation_result:
         :param run_id:
+        :param action_dispatcher: if given, failed actions are retried with its retry policy
+        :param batch_identifier: the batch identifier of the validation result (defaults to batch.batch_id; Validators
+            are identified by their active_batch_id)
         :return: a dictionary: {action name -> result returned by the action}
         """
+        if batch_identifier is None:
+            batch_identifier = batch.batch_id
         batch_actions_results = {}
         for action in self.action_list:
             # NOTE: Eugene: 2019-09-23: log the info about the batch and the expectation suite
@@ -375,15 +749,21 @@ The ``run`` method returns a ValidationOperatorResult object:
             validation_result_id = ValidationResultIdentifier(
                 expectation_suite_identifier=expectation_suite_identifier,
                 run_id=run_id,
-                batch_identifier=batch.batch_id,
+                batch_identifier=batch_identifier,
             )
             try:
-                action_result = self.actions[action["name"]].run(
-                    validation_result_suite_identifier=validation_result_id,
-                    validation_result_suite=batch_validation_result,
-                    data_asset=batch,
-                    payload=batch_actions_results,
-                )
+                action_kwargs = {
+                    "validation_result_suite_identifier": validation_result_id,
+                    "validation_result_suite": batch_validation_result,
+                    "data_asset": batch,
+                    "payload": batch_actions_results,
+                }
+                if action_dispatcher is None:
+                    action_result = self.actions[action["name"]].run(**action_kwargs)
+                else:
+                    action_result = action_dispatcher.call_with_retries(
+                        self.actions[action["name"]].run, **action_kwargs
+                    )
 
                 # add action_result
                 batch_actions_results[action["name"]] = (
@@ -402,6 +782,30 @@ The ``run`` method returns a ValidationOperatorResult object:
         return batch_actions_results
 
 
+def _validate_item_in_subprocess(
+    project_config,
+    context_root_dir,
+    operator_config,
+    item,
+    run_id,
+    evaluation_parameters,
+    result_format,
+):
+    """Validates one item in a worker process of the process concurrency executor, with a data context and operator
+    rebuilt from their configurations."""
+    from great_expectations.data_context import BaseDataContext
+
+    data_context = BaseDataContext(
+        project_config=project_config, context_root_dir=context_root_dir
+    )
+    operator = instantiate_class_from_config(
+        config=operator_config,
+        runtime_environment={"data_context": data_context},
+        config_defaults={"module_name": "great_expectations.validation_operators"},
+    )
+    return operator._validate_item(item, run_id, evaluation_parameters, result_format)
+
+
 class WarningAndFailureExpectationSuitesValidationOperator(
     ActionListValidationOperator
 ):
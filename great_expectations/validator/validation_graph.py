@@ -1,7 +1,8 @@
 import copy
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from great_expectations.core.id_dict import IDDict
+from great_expectations.exceptions import GreatExpectationsError
 
 
 class MetricConfiguration:
@@ -93,3 +94,69 @@ class ValidationGraph:
     @property
     def edges(self):
         return copy.deepcopy(self._edges)
+
+    def get_resolution_waves(
+        self, metrics: Optional[Dict[Tuple, Any]] = None
+    ) -> List[List[MetricConfiguration]]:
+        """Plans the resolution of the graph as a sequence of topologically sorted waves.
+
+        The adjacency and in-degree indexes are built in a single pass over the edges, after which Kahn's algorithm
+        peels off successive waves of metrics whose dependencies are all satisfied, either by an earlier wave or by
+        the already-computed metrics. All metrics within a wave are independent of one another.
+
+        Args:
+            metrics: already-computed metrics, keyed by metric id; these are never scheduled again
+
+        Returns:
+            A list of waves, each one a list of MetricConfigurations that can be resolved together
+        """
+        if metrics is None:
+            metrics = dict()
+
+        nodes: Dict[Tuple, MetricConfiguration] = dict()
+        dependencies: Dict[Tuple, Set[Tuple]] = dict()
+        dependents: Dict[Tuple, List[Tuple]] = dict()
+        for edge in self._edges:
+            if edge.left.id in metrics:
+                continue
+            if edge.left.id not in nodes:
+                nodes[edge.left.id] = edge.left
+                dependencies[edge.left.id] = set()
+                dependents[edge.left.id] = []
+            if edge.right is None or edge.right.id in metrics:
+                continue
+            if edge.right.id not in nodes:
+                nodes[edge.right.id] = edge.right
+                dependencies[edge.right.id] = set()
+                dependents[edge.right.id] = []
+            if edge.right.id not in dependencies[edge.left.id]:
+                dependencies[edge.left.id].add(edge.right.id)
+                dependents[edge.right.id].append(edge.left.id)
+
+        in_degree: Dict[Tuple, int] = {
+            metric_id: len(metric_dependencies)
+            for metric_id, metric_dependencies in dependencies.items()
+        }
+        waves: List[List[MetricConfiguration]] = []
+        ready: List[Tuple] = [
+            metric_id for metric_id, degree in in_degree.items() if degree == 0
+        ]
+        while ready:
+            waves.append([nodes[metric_id] for metric_id in ready])
+            next_ready = []
+            for metric_id in ready:
+                for dependent_id in dependents[metric_id]:
+                    in_degree[dependent_id] -= 1
+                    if in_degree[dependent_id] == 0:
+                        next_ready.append(dependent_id)
+            ready = next_ready
+
+        unresolvable = [
+            metric_id for metric_id, degree in in_degree.items() if degree > 0
+        ]
+        if len(unresolvable) > 0:
+            raise GreatExpectationsError(
+                f"Unable to resolve validation graph; circular dependencies found among metrics: {str(unresolvable)}"
+            )
+
+        return waves
@@ -3,18 +3,22 @@ import datetime
 import inspect
 import json
 import logging
+import time
 import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 from dateutil.parser import parse
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.batch import Batch
-from great_expectations.core.evaluation_parameters import build_evaluation_parameters
+from great_expectations.core.evaluation_parameters import (
+    build_evaluation_parameters,
+    fetch_store_evaluation_parameters,
+)
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import (
     ExpectationSuite,
@@ -92,6 +96,7 @@ class Validator:
             self._batches[batch.id] = batch
 
         self.interactive_evaluation = interactive_evaluation
+        self._graph_resolution_timing = None
         self._initialize_expectations(
             expectation_suite=expectation_suite,
             expectation_suite_name=expectation_suite_name,
@@ -327,14 +332,77 @@ class Validator:
                     from the registry.
                     metrics (dict): A list of currently registered metrics in the registry
                     runtime_configuration (dict): A dictionary of runtime keyword arguments, controlling semantics
-                    such as the result_format.
+                    such as the result_format. Independent metrics can be resolved concurrently by including
+                    {"concurrency": {"enabled": True, "max_workers": n}}.
 
                 Returns:
                     A list of Validations, validating that all necessary metrics are available.
         """
-        graph = ValidationGraph()
         if runtime_configuration is None:
             runtime_configuration = dict()
+        graph, processed_configurations, evrs = self._build_validation_graph(
+            configurations, runtime_configuration
+        )
+
+        if metrics is None:
+            metrics = dict()
+
+        metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
+        evrs.extend(
+            self._validate_configurations(
+                processed_configurations, metrics, runtime_configuration
+            )
+        )
+        return evrs
+
+    async def graph_validate_async(
+        self,
+        configurations: List[ExpectationConfiguration],
+        metrics: dict = None,
+        runtime_configuration: dict = None,
+    ) -> List[ExpectationValidationResult]:
+        """An awaitable counterpart of graph_validate: the independent metrics of each wave of the validation graph are
+        submitted to the execution engine together (see ExecutionEngine.resolve_metrics_async), so that the wall time of
+        a wave is that of its slowest query rather than the sum of all of them.
+
+                Args:
+                    configurations(List[ExpectationConfiguration]): A list of needed Expectation Configurations that will
+                    be used to supply domain and values for metrics.
+                    metrics (dict): A list of currently registered metrics in the registry
+                    runtime_configuration (dict): A dictionary of runtime keyword arguments, controlling semantics
+                    such as the result_format. The number of concurrent queries can be limited by including
+                    {"concurrency": {"max_workers": n}}.
+
+                Returns:
+                    A list of Validations, validating that all necessary metrics are available.
+        """
+        if runtime_configuration is None:
+            runtime_configuration = dict()
+        graph, processed_configurations, evrs = self._build_validation_graph(
+            configurations, runtime_configuration
+        )
+
+        if metrics is None:
+            metrics = dict()
+
+        metrics = await self.resolve_validation_graph_async(
+            graph, metrics, runtime_configuration
+        )
+        evrs.extend(
+            self._validate_configurations(
+                processed_configurations, metrics, runtime_configuration
+            )
+        )
+        return evrs
+
+    def _build_validation_graph(
+        self,
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: dict,
+    ) -> Tuple[ValidationGraph, list, list]:
+        """Adds the metric dependencies of every configuration to a new ValidationGraph, and returns it together with the
+        configurations whose dependencies were added and the failed results of those whose dependencies could not be."""
+        graph = ValidationGraph()
 
         if runtime_configuration.get("catch_exceptions", True):
             catch_exceptions = True
@@ -383,11 +451,19 @@ class Validator:
                 else:
                     raise err
 
-        if metrics is None:
-            metrics = dict()
+        return graph, processed_configurations, evrs
 
-        metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
-        for configuration in processed_configurations:
+    def _validate_configurations(
+        self,
+        configurations: List[ExpectationConfiguration],
+        metrics: dict,
+        runtime_configuration: dict,
+    ) -> List[ExpectationValidationResult]:
+        """Validates every configuration against the resolved metrics."""
+        catch_exceptions = bool(runtime_configuration.get("catch_exceptions", True))
+
+        evrs = []
+        for configuration in configurations:
             try:
                 result = configuration.metrics_validate(
                     metrics,
@@ -414,22 +490,86 @@ class Validator:
         return evrs
 
     def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(graph, metrics)
+        """Resolves every metric in the validation graph, feeding the execution engine one topological wave at a time.
+
+        Timing for the planning step and for each wave is recorded in graph_resolution_timing.
+        """
+        planning_start = time.perf_counter()
+        waves = graph.get_resolution_waves(metrics)
+        planning_time = time.perf_counter() - planning_start
+
+        wave_timings = []
+        for wave_index, wave in enumerate(waves):
+            wave_start = time.perf_counter()
             metrics.update(
                 self._resolve_metrics(
                     execution_engine=self._execution_engine,
-                    metrics_to_resolve=ready_metrics,
+                    metrics_to_resolve=wave,
                     metrics=metrics,
                     runtime_configuration=runtime_configuration,
                 )
             )
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
+            wave_timing = ResolutionWaveTiming(
+                wave_index=wave_index,
+                metric_count=len(wave),
+                resolution_time=time.perf_counter() - wave_start,
+            )
+            logger.debug(
+                f"Resolved wave {wave_index} of {len(waves)} ({wave_timing.metric_count} metrics) in "
+                f"{wave_timing.resolution_time:.6f}s"
+            )
+            wave_timings.append(wave_timing)
 
+        self._set_graph_resolution_timing(planning_time, wave_timings)
         return metrics
 
+    async def resolve_validation_graph_async(
+        self, graph, metrics, runtime_configuration=None
+    ):
+        """An awaitable counterpart of resolve_validation_graph, which resolves the metrics of each wave together with
+        ExecutionEngine.resolve_metrics_async."""
+        planning_start = time.perf_counter()
+        waves = graph.get_resolution_waves(metrics)
+        planning_time = time.perf_counter() - planning_start
+
+        wave_timings = []
+        for wave_index, wave in enumerate(waves):
+            wave_start = time.perf_counter()
+            metrics.update(
+                await self._execution_engine.resolve_metrics_async(
+                    wave, metrics, runtime_configuration
+                )
+            )
+            wave_timing = ResolutionWaveTiming(
+                wave_index=wave_index,
+                metric_count=len(wave),
+                resolution_time=time.perf_counter() - wave_start,
+            )
+            logger.debug(
+                f"Resolved wave {wave_index} of {len(waves)} ({wave_timing.metric_count} metrics) in "
+                f"{wave_timing.resolution_time:.6f}s"
+            )
+            wave_timings.append(wave_timing)
+
+        self._set_graph_resolution_timing(planning_time, wave_timings)
+        return metrics
+
+    def _set_graph_resolution_timing(
+        self, planning_time: float, wave_timings: List["ResolutionWaveTiming"]
+    ) -> None:
+        self._graph_resolution_timing = GraphResolutionTiming(
+            planning_time=planning_time,
+            resolution_time=sum(
+                wave_timing.resolution_time for wave_timing in wave_timings
+            ),
+            waves=wave_timings,
+        )
+
+    @property
+    def graph_resolution_timing(self) -> Optional["GraphResolutionTiming"]:
+        """Timing of the most recent call to resolve_validation_graph, split into planning and per-wave compute."""
+        return self._graph_resolution_timing
+
     def _parse_validation_graph(self, validation_graph, metrics):
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
@@ -1057,12 +1197,24 @@ class Validator:
                     "WARNING: No great_expectations version found in configuration object."
                 )
 
+            # Fetch the store-backed evaluation parameters of all expectations up front, in one batch per store
+            expectation_evaluation_parameters = runtime_evaluation_parameters
+            if self.interactive_evaluation:
+                expectation_evaluation_parameters = {
+                    **fetch_store_evaluation_parameters(
+                        expectation_suite.expectations,
+                        evaluation_parameters=runtime_evaluation_parameters,
+                        data_context=self._data_context,
+                    ),
+                    **runtime_evaluation_parameters,
+                }
+
             # Group expectations by column
             columns = {}
 
             for expectation in expectation_suite.expectations:
                 expectation.build_evaluation_parameters(
-                    evaluation_parameters=runtime_evaluation_parameters,
+                    evaluation_parameters=expectation_evaluation_parameters,
                     interactive_evaluation=self.interactive_evaluation,
                     data_context=self._data_context,
                 )
@@ -1240,6 +1392,16 @@ ValidationStatistics = namedtuple(
 )
 
 
+ResolutionWaveTiming = namedtuple(
+    "ResolutionWaveTiming", ["wave_index", "metric_count", "resolution_time",],
+)
+
+
+GraphResolutionTiming = namedtuple(
+    "GraphResolutionTiming", ["planning_time", "resolution_time", "waves",],
+)
+
+
 def _calc_validation_statistics(validation_results):
     """
     Calculate summary statistics for the validation results and
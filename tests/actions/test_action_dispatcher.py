@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from great_expectations.validation_operators.action_dispatcher import ActionDispatcher
+
+
+def test_action_dispatcher_runs_submitted_actions():
+    calls = []
+    with ActionDispatcher(max_workers=2) as dispatcher:
+        futures = [dispatcher.submit(calls.append, index) for index in range(5)]
+        dispatcher.flush()
+        assert sorted(calls) == [0, 1, 2, 3, 4]
+    assert all(future.done() for future in futures)
+
+    with pytest.raises(RuntimeError, match="shut down"):
+        dispatcher.submit(calls.append, 5)
+
+
+def test_action_dispatcher_futures_hold_exceptions():
+    def fail():
+        raise ValueError("action failed")
+
+    with ActionDispatcher() as dispatcher:
+        future = dispatcher.submit(fail)
+        ok_future = dispatcher.submit(lambda: "ok")
+
+    assert isinstance(future.exception(), ValueError)
+    assert ok_future.result() == "ok"
+
+
+def test_action_dispatcher_call_with_retries():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("webhook unavailable")
+        return "sent"
+
+    dispatcher = ActionDispatcher(max_retries=2, retry_delay=0)
+    assert dispatcher.call_with_retries(flaky) == "sent"
+    assert len(attempts) == 3
+
+    attempts.clear()
+    dispatcher = ActionDispatcher(max_retries=1, retry_delay=0)
+    with pytest.raises(ConnectionError):
+        dispatcher.call_with_retries(flaky)
+    assert len(attempts) == 2
+
+
+def test_action_dispatcher_applies_backpressure():
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking_action():
+        started.set()
+        release.wait(timeout=10)
+
+    with ActionDispatcher(max_workers=1, max_queue_size=1) as dispatcher:
+        dispatcher.submit(blocking_action)
+        started.wait(timeout=10)
+        # The worker is busy, so this action waits in the queue and fills it
+        dispatcher.submit(lambda: None)
+
+        submitter = threading.Thread(target=dispatcher.submit, args=(lambda: None,))
+        submitter.start()
+        submitter.join(timeout=0.2)
+        assert submitter.is_alive()
+
+        release.set()
+        submitter.join(timeout=10)
+        assert not submitter.is_alive()
@@ -1,13 +1,22 @@
 # TODO: ADD TESTS ONCE GET_BATCH IS INTEGRATED!
 
+import os
+
 import pandas as pd
+import pytest
 from freezegun import freeze_time
 
 import great_expectations as ge
+from great_expectations.core import ExpectationSuite
+from great_expectations.core.batch import Batch, BatchDefinition, PartitionDefinition
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import BaseDataContext
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.validation_operators.validation_operators import (
+    ActionListValidationOperator,
     WarningAndFailureExpectationSuitesValidationOperator,
 )
+from great_expectations.validator.validator import Validator
 
 from ..test_utils import modify_locale
 
@@ -180,3 +189,450 @@ def test_errors_warnings_validation_operator_run_slack_query(
     print(json.dumps(slack_query, indent=2))
     print(json.dumps(expected_slack_query, indent=2))
     assert slack_query == expected_slack_query
+
+
+def test_action_list_validation_operator_run_shares_metric_cache():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [4, 3, 2, 1]})
+    validators = []
+    for suite_name in ["first_suite", "second_suite"]:
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=df)],
+            expectation_suite=ExpectationSuite(suite_name),
+        )
+        validator.expect_column_max_to_be_between("a", 1, 5)
+        validators.append(validator)
+    validators[1].expect_column_min_to_be_between("b", 1, 5)
+    for validator in validators:
+        validator.execution_engine.metric_cache.clear()
+
+    operator = ActionListValidationOperator(
+        data_context=None, action_list=[], name="action_list_operator"
+    )
+    result = operator.run(assets_to_validate=validators)
+
+    assert result.success
+    metric_cache = validators[0].execution_engine.metric_cache
+    assert validators[1].execution_engine.metric_cache is metric_cache
+    # Metrics computed while validating the first suite were reused by the second
+    assert metric_cache.statistics["hits"] > 0
+
+
+def test_action_list_validation_operator_run_shared_metric_cache_distinguishes_batch_data():
+    # Batches built without a batch_definition all have the same id
+    validators = []
+    for suite_name, max_value in [("first_suite", 4), ("second_suite", 6)]:
+        df = pd.DataFrame({"a": [1, 2, 3, max_value]})
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=df)],
+            expectation_suite=ExpectationSuite(suite_name),
+        )
+        validator.expect_column_max_to_be_between("a", 1, 5)
+        validators.append(validator)
+    assert (
+        validators[0].execution_engine.active_batch_data_id
+        == validators[1].execution_engine.active_batch_data_id
+    )
+
+    operator = ActionListValidationOperator(
+        data_context=None, action_list=[], name="action_list_operator"
+    )
+    result = operator.run(assets_to_validate=validators)
+
+    assert not result.success
+    validation_results = [
+        run_result["validation_result"] for run_result in result.run_results.values()
+    ]
+    assert [validation_result.success for validation_result in validation_results] == [
+        True,
+        False,
+    ]
+
+
+def test_action_list_validation_operator_run_releases_materializations():
+    df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    execution_engine = PandasExecutionEngine()
+    released = []
+    execution_engine.release_materializations = lambda: released.append(True)
+    validators = []
+    for suite_name in ["first_suite", "second_suite"]:
+        validator = Validator(
+            execution_engine=execution_engine,
+            batches=[Batch(data=df)],
+            expectation_suite=ExpectationSuite(suite_name),
+        )
+        validator.expect_column_max_to_be_between("a", 1, 5)
+        validators.append(validator)
+
+    operator = ActionListValidationOperator(
+        data_context=None,
+        action_list=[],
+        name="action_list_operator",
+        release_materializations=True,
+    )
+    result = operator.run(assets_to_validate=validators)
+
+    assert result.success
+    # The materializations of the shared execution engine are released once, at the end of the run
+    assert released == [True]
+    assert operator.validation_operator_config["kwargs"]["release_materializations"]
+
+
+def test_action_list_validation_operator_run_keeps_materializations_by_default():
+    df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    execution_engine = PandasExecutionEngine()
+    released = []
+    execution_engine.release_materializations = lambda: released.append(True)
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=df)],
+        expectation_suite=ExpectationSuite("my_suite"),
+    )
+    validator.expect_column_max_to_be_between("a", 1, 5)
+
+    operator = ActionListValidationOperator(
+        data_context=None, action_list=[], name="action_list_operator"
+    )
+    result = operator.run(assets_to_validate=[validator])
+
+    assert result.success
+    assert released == []
+    assert (
+        "release_materializations" not in operator.validation_operator_config["kwargs"]
+    )
+    # The Validator belongs to the caller, so it can still be used once the run is over
+    assert validator.validate().success
+    assert validator.expect_column_min_to_be_between("a", 1, 5).success
+
+
+def _build_validators_for_concurrent_validation():
+    validators = []
+    for index, suite_name in enumerate(["first_suite", "second_suite", "third_suite"]):
+        df = pd.DataFrame({"a": [1, 2, 3, 4 + index], "b": [4, 3, 2, 1]})
+        batch_definition = BatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="my_data_asset",
+            partition_definition=PartitionDefinition({"index": index}),
+        )
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=df, batch_definition=batch_definition)],
+            expectation_suite=ExpectationSuite(suite_name),
+        )
+        validator.expect_column_max_to_be_between("a", 1, 5)
+        validators.append(validator)
+    return validators
+
+
+def test_action_list_validation_operator_run_concurrently():
+    validators = _build_validators_for_concurrent_validation()
+    serial_operator = ActionListValidationOperator(
+        data_context=None, action_list=[], name="action_list_operator"
+    )
+    concurrent_operator = ActionListValidationOperator(
+        data_context=None,
+        action_list=[],
+        name="action_list_operator",
+        concurrency={"enabled": True, "max_workers": 3},
+    )
+
+    serial_result = serial_operator.run(
+        assets_to_validate=validators, run_name="serial"
+    )
+    concurrent_result = concurrent_operator.run(
+        assets_to_validate=validators, run_name="concurrent"
+    )
+
+    assert concurrent_operator.validation_operator_config["kwargs"]["concurrency"] == {
+        "enabled": True,
+        "max_workers": 3,
+    }
+    # Same results in the same order as the assets to validate
+    assert [
+        key.expectation_suite_identifier.expectation_suite_name
+        for key in concurrent_result.run_results
+    ] == ["first_suite", "second_suite", "third_suite"]
+    assert (
+        [
+            run_result["validation_result"].success
+            for run_result in concurrent_result.run_results.values()
+        ]
+        == [
+            run_result["validation_result"].success
+            for run_result in serial_result.run_results.values()
+        ]
+        == [True, True, False]
+    )
+    assert not concurrent_result.success
+
+
+def test_action_list_validation_operator_run_concurrently_isolates_failures(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    context = basic_in_memory_data_context_for_validation_operator
+    batches = [
+        ge.dataset.PandasDataset(
+            pd.DataFrame({"x": [1, 2, 3]}), batch_kwargs={"ge_batch_id": batch_id}
+        )
+        for batch_id in ["first_batch", "third_batch"]
+    ]
+    operator = ActionListValidationOperator(
+        data_context=context,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                    "target_store_name": "validation_result_store",
+                },
+            }
+        ],
+        name="action_list_operator",
+        concurrency={"enabled": True, "max_workers": 2},
+    )
+    run_id = RunIdentifier(run_name="isolated_failures")
+
+    result = operator.run(
+        assets_to_validate=[batches[0], ("not", "an asset"), batches[1]], run_id=run_id,
+    )
+
+    # The failure is recorded with the results of the other assets instead of being raised
+    assert not result.success
+    assert [key.batch_identifier for key in result.run_results] == [
+        "ge_batch_id=first_batch",
+        "ge_batch_id=third_batch",
+    ]
+    assert len(result.exceptions) == 1
+    assert result.exceptions[0]["asset_index"] == 1
+    assert result.exceptions[0]["validation_result_identifier"] is None
+    assert isinstance(result.exceptions[0]["exception"], ValueError)
+    assert "Unable to build batch from item" in str(result.exceptions[0]["exception"])
+    # The assets before and after the failing one were still validated and stored
+    assert {
+        key.batch_identifier
+        for key in context.validations_store.list_keys()
+        if key.run_id == run_id
+    } == {"ge_batch_id=first_batch", "ge_batch_id=third_batch"}
+
+
+def test_action_list_validation_operator_run_with_process_executor(
+    titanic_data_context,
+):
+    context = titanic_data_context
+    batch_kwargs = {
+        "datasource": "mydatasource",
+        "path": os.path.join(context.root_directory, "..", "data", "Titanic.csv"),
+    }
+    for suite_name, max_age in [("passing_suite", 80), ("failing_suite", 70)]:
+        batch = context.get_batch(
+            batch_kwargs, context.create_expectation_suite(suite_name)
+        )
+        batch.expect_column_max_to_be_between("Age", 0, max_age)
+        context.save_expectation_suite(
+            batch.get_expectation_suite(discard_failed_expectations=False)
+        )
+
+    operator = ActionListValidationOperator(
+        data_context=context,
+        action_list=[],
+        name="action_list_operator",
+        concurrency={"enabled": True, "max_workers": 2, "executor": "process"},
+    )
+    result = operator.run(
+        assets_to_validate=[
+            (batch_kwargs, "passing_suite"),
+            (batch_kwargs, "failing_suite"),
+        ],
+        run_name="process_executor",
+    )
+
+    assert [
+        (
+            key.expectation_suite_identifier.expectation_suite_name,
+            run_result["validation_result"].success,
+        )
+        for key, run_result in result.run_results.items()
+    ] == [("passing_suite", True), ("failing_suite", False)]
+
+    with pytest.raises(ValueError, match="batch_kwargs, expectation_suite_name"):
+        operator.run(
+            assets_to_validate=[context.get_batch(batch_kwargs, "passing_suite")] * 2
+        )
+
+
+def test_action_list_validation_operator_rejects_unknown_executor():
+    with pytest.raises(ValueError, match="concurrency executor"):
+        ActionListValidationOperator(
+            data_context=None,
+            action_list=[],
+            name="action_list_operator",
+            concurrency={"enabled": True, "executor": "fiber"},
+        )
+
+
+def test_action_list_validation_operator_run_with_action_dispatch(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    context = basic_in_memory_data_context_for_validation_operator
+    batches = [
+        ge.dataset.PandasDataset(
+            pd.DataFrame({"x": [1, 2, 3]}), batch_kwargs={"ge_batch_id": batch_id}
+        )
+        for batch_id in ["dispatched_batch_1", "dispatched_batch_2"]
+    ]
+    action_list = [
+        {
+            "name": "store_validation_result",
+            "action": {
+                "class_name": "StoreValidationResultAction",
+                "target_store_name": "validation_result_store",
+            },
+        }
+    ]
+    operator = ActionListValidationOperator(
+        data_context=context,
+        action_list=action_list,
+        name="action_list_operator",
+        action_dispatch={"enabled": True, "max_queue_size": 1, "max_retries": 1},
+    )
+    run_id = RunIdentifier(run_name="dispatched_actions")
+
+    result = operator.run(assets_to_validate=batches, run_id=run_id)
+
+    assert operator.validation_operator_config["kwargs"]["action_dispatch"] == {
+        "enabled": True,
+        "max_queue_size": 1,
+        "max_retries": 1,
+    }
+    assert [key.batch_identifier for key in result.run_results] == [
+        "ge_batch_id=dispatched_batch_1",
+        "ge_batch_id=dispatched_batch_2",
+    ]
+    # The dispatched actions are done, and their results collected, when run returns
+    for run_result in result.run_results.values():
+        assert run_result["actions_results"] == {
+            "store_validation_result": {"class": "StoreValidationResultAction"}
+        }
+    assert {
+        key.batch_identifier
+        for key in context.validations_store.list_keys()
+        if key.run_id == run_id
+    } == {"ge_batch_id=dispatched_batch_1", "ge_batch_id=dispatched_batch_2"}
+
+
+def test_action_list_validation_operator_records_failed_dispatched_actions(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    context = basic_in_memory_data_context_for_validation_operator
+    batches = [
+        ge.dataset.PandasDataset(
+            pd.DataFrame({"x": [1, 2, 3]}), batch_kwargs={"ge_batch_id": batch_id}
+        )
+        for batch_id in ["dispatched_batch_1", "failing_batch", "dispatched_batch_3"]
+    ]
+    operator = ActionListValidationOperator(
+        data_context=context,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                    "target_store_name": "validation_result_store",
+                },
+            }
+        ],
+        name="action_list_operator",
+        action_dispatch={"enabled": True},
+    )
+    store_action = operator.actions["store_validation_result"]
+    run_store_action = store_action.run
+
+    def run_or_fail(validation_result_suite_identifier, **kwargs):
+        if (
+            validation_result_suite_identifier.batch_identifier
+            == "ge_batch_id=failing_batch"
+        ):
+            raise RuntimeError("The store is unavailable")
+        return run_store_action(
+            validation_result_suite_identifier=validation_result_suite_identifier,
+            **kwargs,
+        )
+
+    store_action.run = run_or_fail
+    run_id = RunIdentifier(run_name="failed_dispatched_actions")
+
+    result = operator.run(assets_to_validate=batches, run_id=run_id)
+
+    # The failure is recorded instead of being raised, and the other results are kept
+    assert not result.success
+    assert [
+        run_result["actions_results"] for run_result in result.run_results.values()
+    ] == [
+        {"store_validation_result": {"class": "StoreValidationResultAction"}},
+        None,
+        {"store_validation_result": {"class": "StoreValidationResultAction"}},
+    ]
+    assert [
+        (
+            exception["asset_index"],
+            exception["validation_result_identifier"].batch_identifier,
+            str(exception["exception"]),
+        )
+        for exception in result.exceptions
+    ] == [(1, "ge_batch_id=failing_batch", "The store is unavailable")]
+    assert {
+        key.batch_identifier
+        for key in context.validations_store.list_keys()
+        if key.run_id == run_id
+    } == {"ge_batch_id=dispatched_batch_1", "ge_batch_id=dispatched_batch_3"}
+
+
+def test_action_list_validation_operator_runs_actions_on_validators(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    context = basic_in_memory_data_context_for_validation_operator
+    batch_definition = BatchDefinition(
+        datasource_name="my_datasource",
+        data_connector_name="my_data_connector",
+        data_asset_name="my_data_asset",
+        partition_definition=PartitionDefinition({"index": 0}),
+    )
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[
+            Batch(
+                data=pd.DataFrame({"a": [1, 2, 3]}), batch_definition=batch_definition
+            )
+        ],
+        expectation_suite=ExpectationSuite("validator_suite"),
+    )
+    validator.expect_column_max_to_be_between("a", 1, 5)
+    operator = ActionListValidationOperator(
+        data_context=context,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                    "target_store_name": "validation_result_store",
+                },
+            }
+        ],
+        name="action_list_operator",
+    )
+    run_id = RunIdentifier(run_name="validator_actions")
+
+    result = operator.run(assets_to_validate=[validator], run_id=run_id)
+
+    assert result.success
+    # The validation result is stored under the active batch id of the Validator
+    assert [
+        key.batch_identifier
+        for key in context.validations_store.list_keys()
+        if key.run_id == run_id
+    ] == [validator.active_batch_id]
+    assert [key.batch_identifier for key in result.run_results] == [
+        validator.active_batch_id
+    ]
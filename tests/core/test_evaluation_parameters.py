@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from timeit import timeit
 
 import pytest
 
 from great_expectations.core.evaluation_parameters import (
+    _compile_evaluation_parameter_expression,
     _deduplicate_evaluation_parameter_dependencies,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
@@ -112,6 +114,34 @@ def test_parser_timing():
     )
 
 
+def test_parse_evaluation_parameter_compiles_each_expression_once():
+    _compile_evaluation_parameter_expression.cache_clear()
+    assert parse_evaluation_parameter("a * 2 + b", {"a": 1, "b": 3}) == 5
+    assert parse_evaluation_parameter("a * 2 + b", {"a": 2, "b": -1}) == 3
+    assert find_evaluation_parameter_dependencies("a * 2 + b") == {
+        "urns": set(),
+        "other": {"a", "b"},
+    }
+    cache_info = _compile_evaluation_parameter_expression.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_parse_evaluation_parameter_concurrently():
+    _compile_evaluation_parameter_expression.cache_clear()
+    parameters = [
+        (f"x{idx % 7} * {idx} - trunc(y / 2)", {f"x{idx % 7}": idx, "y": idx})
+        for idx in range(200)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda parameter: parse_evaluation_parameter(*parameter), parameters
+            )
+        )
+    assert results == [idx * idx - int(idx / 2) for idx in range(200)]
+
+
 def test_find_evaluation_parameter_dependencies():
     parameter_expression = "(-3 * urn:great_expectations:validations:profile:expect_column_stdev_to_be_between.result.observed_value:column=norm) + urn:great_expectations:validations:profile:expect_column_mean_to_be_between.result.observed_value:column=norm"
     dependencies = find_evaluation_parameter_dependencies(parameter_expression)
@@ -0,0 +1,105 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import (
+    HyperLogLogSketch,
+    KLLQuantileSketch,
+    build_sketch,
+    merge_sketches,
+    sketch_from_json_dict,
+)
+
+
+@pytest.fixture
+def normal_values():
+    return pd.Series(np.random.RandomState(42).normal(size=100000))
+
+
+def _rank_errors(sorted_values, values, quantiles):
+    return [
+        abs(np.searchsorted(sorted_values, value) / len(sorted_values) - quantile)
+        for value, quantile in zip(values, quantiles)
+    ]
+
+
+def test_kll_quantile_sketch_is_exact_for_small_columns():
+    column = pd.Series([7, 1, None, 5, 3, 2, 4])
+    sketch = KLLQuantileSketch().update(column)
+
+    quantiles = [0, 0.1, 0.5, 0.9, 1]
+    assert sketch.count == 6
+    assert (
+        sketch.quantiles(quantiles)
+        == column.quantile(quantiles, interpolation="nearest").tolist()
+    )
+    assert np.isnan(KLLQuantileSketch().quantiles([0.5])[0])
+
+
+def test_kll_quantile_sketch_merge_and_serialization(normal_values):
+    quantiles = [0.01, 0.25, 0.5, 0.75, 0.99]
+    sorted_values = np.sort(normal_values.to_numpy())
+
+    sketch = KLLQuantileSketch.from_relative_error(0.01).update(normal_values)
+    assert (
+        max(_rank_errors(sorted_values, sketch.quantiles(quantiles), quantiles)) < 0.01
+    )
+    assert sketch.quantiles([0, 1]) == [sorted_values[0], sorted_values[-1]]
+
+    partition_sketches = [
+        KLLQuantileSketch.from_relative_error(0.01).update(partition)
+        for partition in np.array_split(normal_values, 10)
+    ]
+    partition_sketch_dicts = [sketch.to_json_dict() for sketch in partition_sketches]
+    merged_sketch = merge_sketches(partition_sketches)
+    assert merged_sketch.count == len(normal_values)
+    # The merged sketches are left unchanged
+    assert [
+        sketch.to_json_dict() for sketch in partition_sketches
+    ] == partition_sketch_dicts
+    assert (
+        max(_rank_errors(sorted_values, merged_sketch.quantiles(quantiles), quantiles))
+        < 0.01
+    )
+
+    deserialized_sketch = sketch_from_json_dict(
+        json.loads(json.dumps(merged_sketch.to_json_dict()))
+    )
+    assert deserialized_sketch.quantiles(quantiles) == merged_sketch.quantiles(
+        quantiles
+    )
+
+    with pytest.raises(ValueError):
+        sketch.merge(KLLQuantileSketch(k=100))
+
+
+def test_hyperloglog_sketch():
+    values = pd.Series(np.random.RandomState(42).randint(0, 20000, size=100000))
+    distinct_count = values.nunique()
+
+    sketch = HyperLogLogSketch.from_relative_error(0.01).update(values)
+    assert sketch.count() == pytest.approx(distinct_count, rel=0.03)
+
+    merged_sketch = merge_sketches(
+        [
+            HyperLogLogSketch(precision=sketch.precision).update(partition)
+            for partition in np.array_split(values, 4)
+        ]
+    )
+    assert merged_sketch.count() == sketch.count()
+
+    deserialized_sketch = sketch_from_json_dict(
+        json.loads(json.dumps(sketch.to_json_dict()))
+    )
+    assert deserialized_sketch.count() == sketch.count()
+
+    assert HyperLogLogSketch().update(["a", "b", None, "a"]).count() == 2
+    with pytest.raises(ValueError):
+        sketch.merge(HyperLogLogSketch(precision=4))
+
+
+def test_sketch_from_json_dict_raises_on_unknown_sketch_type():
+    with pytest.raises(ValueError):
+        sketch_from_json_dict({"sketch_type": "unknown"})
@@ -5,7 +5,7 @@ import pytest
 
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 
 def test_database_store_backend_schema_spec(caplog, sa, test_backends):
@@ -141,3 +141,141 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
     assert store_backend.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(store_backend.store_backend_id)
+
+
+@pytest.mark.parametrize(
+    "native_upsert,expected_statements",
+    [(True, ["INSERT"]), (False, ["SELECT", "INSERT", "UPDATE"])],
+)
+def test_database_store_backend_set_many(
+    sa, tmp_path, native_upsert, expected_statements
+):
+    store_backend = DatabaseStoreBackend(
+        credentials={
+            "drivername": "sqlite",
+            "database": str(tmp_path / "test_database_store_backend_set_many.db"),
+        },
+        table_name="test_database_store_backend_set_many",
+        key_columns=["k1", "k2"],
+    )
+    if not native_upsert:
+        store_backend._upsert_statement = None
+    store_backend.set_many(
+        [(("a", "1"), "first"), (("a", "2"), "second"), (("b", "1"), "third")]
+    )
+    assert store_backend.get(("a", "1")) == "first"
+    assert store_backend.get(("a", "2")) == "second"
+    assert store_backend.get(("b", "1")) == "third"
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    sa.event.listen(
+        store_backend.engine, "before_cursor_execute", before_cursor_execute
+    )
+    try:
+        store_backend.set_many(
+            [
+                (("a", "2"), "updated second"),
+                (("c", "1"), "fourth"),
+                (("c", "2"), "fifth"),
+                (("c", "1"), "updated fourth"),
+            ]
+        )
+    finally:
+        sa.event.remove(
+            store_backend.engine, "before_cursor_execute", before_cursor_execute
+        )
+
+    # A single executemany upsert or, without one, one lookup of the existing keys, one multi-row insert and one
+    # multi-row update
+    assert statements == expected_statements
+    # Updates only touch the row with the same composite key
+    assert store_backend.get(("a", "1")) == "first"
+    assert store_backend.get(("a", "2")) == "updated second"
+    assert store_backend.get(("c", "1")) == "updated fourth"
+    assert store_backend.get(("c", "2")) == "fifth"
+    assert sorted(store_backend.list_keys()) == [
+        ("a", "1"),
+        ("a", "2"),
+        ("b", "1"),
+        ("c", "1"),
+        ("c", "2"),
+    ]
+
+    with pytest.raises(StoreBackendError, match="already exist"):
+        store_backend.set_many([(("a", "1"), "again")], allow_update=False)
+    assert store_backend.get(("a", "1")) == "first"
+
+
+def test_database_store_backend_set_upserts_in_one_statement(sa, tmp_path):
+    store_backend = DatabaseStoreBackend(
+        credentials={
+            "drivername": "sqlite",
+            "database": str(tmp_path / "test_database_store_backend_upsert.db"),
+        },
+        table_name="test_database_store_backend_upsert",
+        key_columns=["k1", "k2"],
+    )
+    store_backend.set(("a", "1"), "first")
+    store_backend.set(("a", "2"), "second")
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(
+        store_backend.engine, "before_cursor_execute", before_cursor_execute
+    )
+    try:
+        store_backend.set(("a", "1"), "updated first")
+        store_backend.set(("b", "1"), "third")
+    finally:
+        sa.event.remove(
+            store_backend.engine, "before_cursor_execute", before_cursor_execute
+        )
+
+    assert len(statements) == 2
+    assert all("ON CONFLICT" in statement for statement in statements)
+    # The update only touched the row with the same composite key
+    assert store_backend.get(("a", "1")) == "updated first"
+    assert store_backend.get(("a", "2")) == "second"
+    assert store_backend.get(("b", "1")) == "third"
+    assert store_backend.has_key(("b", "1"))
+    assert not store_backend.has_key(("b", "2"))
+    assert sorted(store_backend.list_keys(("a",))) == [("a", "1"), ("a", "2")]
+
+    store_backend.remove_key(("a", "1"))
+    assert not store_backend.has_key(("a", "1"))
+    with pytest.raises(StoreError):
+        store_backend.get(("a", "1"))
+
+
+def test_database_store_backend_adds_unique_index_to_existing_table(sa, tmp_path):
+    credentials = {
+        "drivername": "sqlite",
+        "database": str(tmp_path / "test_database_store_backend_index.db"),
+    }
+    engine = sa.create_engine(f"sqlite:///{credentials['database']}")
+    engine.execute(
+        "CREATE TABLE test_database_store_backend_index (k1 VARCHAR, value VARCHAR)"
+    )
+    engine.execute("INSERT INTO test_database_store_backend_index VALUES ('a', 'x')")
+
+    store_backend = DatabaseStoreBackend(
+        credentials=credentials,
+        table_name="test_database_store_backend_index",
+        key_columns=["k1"],
+    )
+
+    indexes = sa.inspect(engine).get_indexes("test_database_store_backend_index")
+    assert [(index["column_names"], bool(index["unique"])) for index in indexes] == [
+        (["k1"], True)
+    ]
+    assert store_backend._upsert_statement is not None
+    store_backend.set(("a",), "y")
+    assert store_backend.get(("a",)) == "y"
+    assert store_backend.list_keys() == [("a",)]
@@ -1,6 +1,13 @@
 import pytest
 
 import tests.test_utils as test_utils
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.sketches import (
+    HyperLogLogSketch,
+    merge_sketches,
+    sketch_from_json_dict,
+)
 from great_expectations.data_context.util import instantiate_class_from_config
 
 
@@ -84,3 +91,44 @@ def test_metric_store_store_backend_id(in_memory_param_store):
     assert in_memory_param_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(in_memory_param_store.store_backend_id)
+
+
+def test_metric_store_keeps_mergeable_sketches(in_memory_param_store):
+    sketches = []
+    for run_name, values in [("first", [1, 2, 3, 4]), ("second", [4, 5, 6])]:
+        key = ValidationMetricIdentifier(
+            run_id=RunIdentifier(run_name=run_name),
+            data_asset_name=None,
+            expectation_suite_identifier="asset.default",
+            metric_name="column.distinct_values.sketch",
+            metric_kwargs_id="column=a",
+        )
+        in_memory_param_store.set(
+            key, HyperLogLogSketch().update(values).to_json_dict()
+        )
+        sketches.append(sketch_from_json_dict(in_memory_param_store.get(key)))
+
+    assert merge_sketches(sketches).count() == 6
+
+
+def test_metric_store_set_many(in_memory_param_store):
+    keys = [
+        ValidationMetricIdentifier(
+            run_id=RunIdentifier(run_name="bulk"),
+            data_asset_name=None,
+            expectation_suite_identifier="asset.default",
+            metric_name=metric_name,
+            metric_kwargs_id=None,
+        )
+        for metric_name in [
+            "statistics.evaluated_expectations",
+            "statistics.successful_expectations",
+        ]
+    ]
+
+    in_memory_param_store.set_many(zip(keys, [3, 2]))
+
+    assert in_memory_param_store.get(keys[0]) == 3
+    assert in_memory_param_store.get(keys[1]) == 2
+    with pytest.raises(TypeError):
+        in_memory_param_store.set_many([("not a key", 1)])
@@ -1,6 +1,13 @@
+import logging
+
 import pytest
 
 import tests.test_utils as test_utils
+from great_expectations.core.evaluation_parameters import (
+    fetch_store_evaluation_parameters,
+    parse_evaluation_parameter,
+)
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.data_context.store.query_store import SqlAlchemyQueryStore
 
 
@@ -59,6 +66,74 @@ def test_queries_with_return_types(sqlalchemy_query_store_specified_return_type)
         sqlalchemy_query_store_specified_return_type.get_query_result("error_query")
 
 
+def test_get_query_results_runs_each_query_once(
+    caplog, sqlalchemy_query_store_specified_return_type
+):
+    store = sqlalchemy_query_store_specified_return_type
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = store.get_query_results([("q3", None), ("q2", None), ("q3", {})])
+    assert results == [1313, ["1st", "2nd", "*", "3rd"], 1313]
+    assert [record.message for record in caplog.records] == [
+        "SqlAlchemyQueryStore ran 2 queries for 3 query results"
+    ]
+
+    # Results are reused until they expire
+    caplog.clear()
+    assert store.get_query_results([("q3", None)]) == [1313]
+    assert len(caplog.records) == 0
+
+
+def test_fetch_store_evaluation_parameters(
+    sqlalchemy_query_store_specified_return_type,
+):
+    class DataContextStub:
+        stores = {"query_store": sqlalchemy_query_store_specified_return_type}
+
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={
+                "min_value": {
+                    "$PARAMETER": "urn:great_expectations:stores:query_store:q3"
+                },
+                "max_value": {
+                    "$PARAMETER": "urn:great_expectations:stores:query_store:q3 * 2"
+                },
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_distinct_values_to_be_in_set",
+            kwargs={
+                "column": "PClass",
+                "value_set": {
+                    "$PARAMETER": "urn:great_expectations:stores:query_store:q2"
+                },
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal",
+            kwargs={
+                "value": {"$PARAMETER": "urn:great_expectations:stores:query_store:q1"}
+            },
+        ),
+    ]
+    evaluation_parameters = fetch_store_evaluation_parameters(
+        expectation_configurations,
+        evaluation_parameters={"urn:great_expectations:stores:query_store:q1": 1},
+        data_context=DataContextStub(),
+    )
+    assert evaluation_parameters == {
+        "urn:great_expectations:stores:query_store:q2": ["1st", "2nd", "*", "3rd"],
+        "urn:great_expectations:stores:query_store:q3": 1313,
+    }
+    assert (
+        parse_evaluation_parameter(
+            "urn:great_expectations:stores:query_store:q3 * 2", evaluation_parameters
+        )
+        == 2626
+    )
+
+
 def test_query_store_store_backend_id(basic_sqlalchemy_query_store):
     """
     What does this test and why?
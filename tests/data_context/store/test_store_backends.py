@@ -380,6 +380,178 @@ test_TupleFilesystemStoreBackend__dir0/
     assert url == "http://www.test.com/my_file_CCC"
 
 
+def test_TupleFilesystemStoreBackend_set_many(tmp_path_factory):
+    project_path = str(
+        tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_set_many__dir")
+    )
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_template="my_file_{0}",
+    )
+
+    filepaths = my_store.set_many(
+        [(("AAA",), "aaa"), (("BBB",), "bbb"), (("CCC",), b"ccc")]
+    )
+
+    assert filepaths == [
+        os.path.join(project_path, "my_file_AAA"),
+        os.path.join(project_path, "my_file_BBB"),
+        os.path.join(project_path, "my_file_CCC"),
+    ]
+    assert my_store.get(("AAA",)) == "aaa"
+    assert my_store.get(("CCC",)) == "ccc"
+    assert set(my_store.list_keys()) == {
+        (".ge_store_backend_id",),
+        ("AAA",),
+        ("BBB",),
+        ("CCC",),
+    }
+
+    with pytest.raises(TypeError):
+        my_store.set_many([(("DDD",), "ddd"), (("EEE",), 1)])
+    # Values are validated before anything is written
+    assert not my_store.has_key(("DDD",))
+
+
+def test_TupleFilesystemStoreBackend_key_index(tmp_path_factory):
+    project_path = str(
+        tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_key_index__dir")
+    )
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json", use_key_index=True,
+    )
+    my_store.set(("a", "x"), "ax")
+    my_store.set(("a", "y"), "ay")
+    my_store.set(("b", "z"), "bz")
+
+    scanning_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json"
+    )
+    assert sorted(my_store.list_keys()) == sorted(scanning_store.list_keys())
+    assert set(my_store.list_keys()) == {("a", "x"), ("a", "y"), ("b", "z")}
+    assert (
+        gen_directory_tree_str(project_path)
+        == """\
+test_TupleFilesystemStoreBackend_key_index__dir0/
+    .ge_key_index.sqlite
+    .ge_store_backend_id
+    a/
+        x.json
+        y.json
+    b/
+        z.json
+"""
+    )
+
+    with patch.object(
+        my_store, "_scan_keys", wraps=my_store._scan_keys
+    ) as mock_scan_keys:
+        assert my_store.list_keys(("a",)) == [("a", "x"), ("a", "y")]
+
+        my_store.set(("c", "d", "w"), "cdw")
+        my_store.remove_key(("a", "x"))
+        my_store.move(("b", "z"), ("a", "z"))
+        assert set(my_store.list_keys()) == {("a", "y"), ("a", "z"), ("c", "d", "w")}
+        assert my_store.list_keys(("c",)) == [("c", "d", "w")]
+        assert my_store.list_keys(("b",)) == []
+
+        # The store's own writes keep the index up to date
+        assert mock_scan_keys.call_count == 0
+    assert sorted(my_store.list_keys()) == sorted(scanning_store.list_keys())
+
+
+def test_TupleFilesystemStoreBackend_key_index_rescans_changed_directories(
+    tmp_path_factory,
+):
+    project_path = str(
+        tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_key_index__dir")
+    )
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json", use_key_index=True,
+    )
+    my_store.set(("a", "x"), "ax")
+    my_store.set(("b", "y"), "by")
+    assert set(my_store.list_keys()) == {("a", "x"), ("b", "y")}
+
+    other_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json"
+    )
+    other_store.set(("a", "w"), "aw")
+    other_store.remove_key(("b", "y"))
+    # Set the directory's modification time explicitly, for file systems with coarse timestamps
+    a_directory = os.path.join(project_path, "a")
+    os.utime(a_directory, ns=(0, os.stat(a_directory).st_mtime_ns + 10 ** 9))
+
+    with patch.object(
+        my_store, "_scan_keys", wraps=my_store._scan_keys
+    ) as mock_scan_keys:
+        assert my_store.list_keys(("a",)) == [("a", "w"), ("a", "x")]
+        mock_scan_keys.assert_called_once_with(("a",))
+        assert my_store.list_keys() == [("a", "w"), ("a", "x")]
+        assert mock_scan_keys.call_count == 2
+
+
+def test_TupleFilesystemStoreBackend_key_index_checks_directories_only(
+    tmp_path_factory,
+):
+    project_path = str(
+        tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_key_index__dir")
+    )
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json", use_key_index=True,
+    )
+    scanning_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json"
+    )
+    for suite_name in ["a", "b", "c"]:
+        for run_name in range(50):
+            my_store.set((suite_name, str(run_name)), "value")
+    assert len(my_store.list_keys()) == 150
+
+    # Listing the indexed keys only calls stat on each of the 4 directories, while scanning reads the 4 directories
+    # and also calls stat on each of the 150 files
+    for store, expected_stat_count, expected_scandir_count in [
+        (my_store, 4, 0),
+        (scanning_store, 154, 4),
+    ]:
+        with patch("os.stat", wraps=os.stat) as mock_stat, patch(
+            "os.scandir", wraps=os.scandir
+        ) as mock_scandir:
+            assert len(store.list_keys()) == 150
+        assert mock_stat.call_count == expected_stat_count
+        assert mock_scandir.call_count == expected_scandir_count
+
+    # Listing a prefix only calls stat on the directories under it
+    with patch("os.stat", wraps=os.stat) as mock_stat:
+        assert len(my_store.list_keys(("a",))) == 50
+    assert mock_stat.call_count == 1
+
+
+def test_TupleFilesystemStoreBackend_list_keys_by_modification_time(tmp_path_factory,):
+    project_path = str(
+        tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_key_index__dir")
+    )
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json", use_key_index=True,
+    )
+    scanning_store = TupleFilesystemStoreBackend(
+        base_directory=project_path, filepath_suffix=".json"
+    )
+    for day in range(1, 4):
+        filepath = my_store.set(("run", str(day)), str(day))
+        timestamp = datetime.datetime(2020, 11, day).timestamp()
+        os.utime(filepath, (timestamp, timestamp))
+
+    for store in [my_store, scanning_store]:
+        assert sorted(
+            store.list_keys(modified_after=datetime.datetime(2020, 11, 2))
+        ) == [("run", "2"), ("run", "3")]
+        assert store.list_keys(
+            ("run",),
+            modified_after=datetime.datetime(2020, 11, 2),
+            modified_before=datetime.datetime(2020, 11, 3).timestamp(),
+        ) == [("run", "2")]
+
+
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
 ):
@@ -491,6 +663,31 @@ def test_TupleS3StoreBackend_with_prefix():
     )
 
 
+@mock_s3
+def test_TupleS3StoreBackend_set_many():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}", bucket=bucket, prefix=prefix,
+    )
+
+    s3_object_keys = my_store.set_many(
+        [(("AAA",), "aaa"), (("BBB",), "bbb")], content_type="text/html; charset=utf-8",
+    )
+
+    assert s3_object_keys == [
+        "this_is_a_test_prefix/my_file_AAA",
+        "this_is_a_test_prefix/my_file_BBB",
+    ]
+    assert my_store.get(("AAA",)) == "aaa"
+    assert my_store.get(("BBB",)) == "bbb"
+    obj = boto3.client("s3").get_object(Bucket=bucket, Key=prefix + "/my_file_BBB")
+    assert obj["ContentType"] == "text/html; charset=utf-8"
+    assert obj["ContentEncoding"] == "utf-8"
+
+
 @mock_s3
 def test_tuple_s3_store_backend_slash_conditions():
     bucket = "my_bucket"
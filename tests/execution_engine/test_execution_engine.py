@@ -1,8 +1,15 @@
+import gc
+
 import pandas as pd
 import pytest
 
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.execution_engine import (
+    MetricCache,
+    _batch_data_tokens,
+    _get_batch_data_token,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -136,6 +143,177 @@ def test_resolve_metrics_with_extraneous_value_key():
     )
 
 
+def test_resolve_metrics_concurrently():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 4, 6, 8]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.mean", "column.standard_deviation", "column.max"]
+        for column in ["a", "b"]
+    ]
+
+    serial_metrics = engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+    # Make sure the metrics are recomputed rather than read from the metric cache
+    engine.metric_cache.clear()
+    concurrent_metrics = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics,
+        runtime_configuration={"concurrency": {"enabled": True, "max_workers": 4}},
+    )
+    assert concurrent_metrics == serial_metrics
+    assert list(concurrent_metrics.keys()) == [metric.id for metric in desired_metrics]
+
+
+def test_resolve_metrics_uses_metric_cache():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    max_ = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+
+    metrics = engine.resolve_metrics(metrics_to_resolve=(mean,))
+    assert metrics == {mean.id: 2.0}
+    assert engine.metric_cache.statistics["misses"] == 1
+    assert ("my_id", engine._batch_data_tokens["my_id"], mean.id) in engine.metric_cache
+
+    # Only the metric which is not cached yet is computed
+    metrics = engine.resolve_metrics(metrics_to_resolve=(mean, max_))
+    assert metrics == {mean.id: 2.0, max_.id: 3.0}
+    assert engine.metric_cache.statistics["hits"] == 1
+    assert engine.metric_cache.statistics["misses"] == 2
+
+    # Loading new data for a batch invalidates the metrics cached for it
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [4, 5, 6]}))
+    assert len(engine.metric_cache) == 0
+    metrics = engine.resolve_metrics(metrics_to_resolve=(mean, max_))
+    assert metrics == {mean.id: 5.0, max_.id: 6.0}
+
+    # Metrics of other batches are cached separately
+    engine.load_batch_data("my_other_id", pd.DataFrame({"a": [7, 8, 9]}))
+    metrics = engine.resolve_metrics(metrics_to_resolve=(mean,))
+    assert metrics == {mean.id: 8.0}
+    assert (
+        "my_other_id",
+        engine._batch_data_tokens["my_other_id"],
+        mean.id,
+    ) in engine.metric_cache
+    assert ("my_id", engine._batch_data_tokens["my_id"], mean.id) in engine.metric_cache
+
+
+def test_shared_metric_cache_distinguishes_batch_data():
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    first_engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3]})}
+    )
+    second_engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [4, 5, 6]})}
+    )
+    second_engine.metric_cache = first_engine.metric_cache
+
+    # The batch ids are the same, but the data is not
+    assert first_engine.resolve_metrics(metrics_to_resolve=(mean,)) == {mean.id: 2.0}
+    assert second_engine.resolve_metrics(metrics_to_resolve=(mean,)) == {mean.id: 5.0}
+    assert first_engine.metric_cache.statistics["hits"] == 0
+
+
+def test_batch_data_token_is_not_reused_after_garbage_collection():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    token = _get_batch_data_token(df)
+    assert _get_batch_data_token(df) == token
+
+    # A new object may get the id of a collected one, but not its token
+    df_id = id(df)
+    del df
+    gc.collect()
+    assert df_id not in _batch_data_tokens
+    assert _get_batch_data_token(pd.DataFrame({"a": [4, 5, 6]})) != token
+
+
+def test_metric_cache_returns_copies_of_mutable_values():
+    metric_cache = MetricCache()
+    value = {"a": [1, 2]}
+    metric_cache[("my_id", "token", "metric")] = value
+    value["a"].append(3)
+
+    cached_value = metric_cache.get(("my_id", "token", "metric"))
+    assert cached_value == {"a": [1, 2]}
+    cached_value["a"].append(4)
+    assert metric_cache.get(("my_id", "token", "metric")) == {"a": [1, 2]}
+
+
+def test_metric_cache_without_copies_shares_values():
+    metric_cache = MetricCache(max_size=1, copy_values=False)
+    value = {"a": [1, 2]}
+    metric_cache[("my_id", "token", "metric")] = value
+    assert metric_cache.get(("my_id", "token", "metric")) is value
+
+    metric_cache[("my_id", "token", "other_metric")] = {"b": [3]}
+    assert ("my_id", "token", "metric") not in metric_cache
+
+
+def test_metric_cache_does_not_cache_partial_function_results():
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, None]})}
+    )
+    condition = MetricConfiguration(
+        metric_name="column_values.nonnull.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    engine.resolve_metrics(metrics_to_resolve=(condition,))
+    assert len(engine.metric_cache) == 0
+
+
+def test_metric_cache_eviction():
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})},
+        metric_cache_max_size=2,
+    )
+    metrics_to_resolve = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.min", "column.max", "column.mean"]
+    ]
+    engine.resolve_metrics(metrics_to_resolve=metrics_to_resolve)
+    assert engine.metric_cache.statistics == {
+        "size": 2,
+        "max_size": 2,
+        "hits": 0,
+        "misses": 3,
+        "evictions": 1,
+    }
+    # The least recently used metric was evicted
+    assert (
+        "my_id",
+        engine._batch_data_tokens["my_id"],
+        metrics_to_resolve[0].id,
+    ) not in engine.metric_cache
+
+    # Disabling caching disables the metric cache
+    engine = PandasExecutionEngine(
+        caching=False, batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3]})}
+    )
+    engine.resolve_metrics(metrics_to_resolve=metrics_to_resolve)
+    assert len(engine.metric_cache) == 0
+
+
 # Testing that metric resolution also works with metric partial function
 def test_resolve_metrics_with_incomplete_metric_input():
     engine = PandasExecutionEngine()
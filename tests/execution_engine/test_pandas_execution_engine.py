@@ -9,7 +9,9 @@ import pytest
 from moto import mock_s3
 
 import great_expectations.exceptions.exceptions as ge_exceptions
+import great_expectations.execution_engine.pandas_execution_engine as pandas_execution_engine
 from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.datasource.data_connector import (
     ConfiguredAssetS3DataConnector,
     InferredAssetS3DataConnector,
@@ -22,9 +24,11 @@ from great_expectations.datasource.types.batch_spec import (
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasChunkedBatchData,
     PandasExecutionEngine,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 def test_reader_fn():
@@ -174,6 +178,51 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_compute_domain_reuses_row_condition_result():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs={"column": "a", **domain_kwargs}, domain_type="column"
+    )
+    # The row_condition is only evaluated once per batch, regardless of the domain
+    other_data, _, _ = engine.get_compute_domain(
+        domain_kwargs={"column": "b", **domain_kwargs}, domain_type="column"
+    )
+    assert len(engine._row_condition_cache) == 1
+    assert list(data["a"]) == [2, 3]
+
+    # Every caller gets its own DataFrame, so modifying one does not affect the others
+    assert other_data is not data
+    data.loc[0, "a"] = 100
+    data["c"] = 0
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs={"column": "a", **domain_kwargs}, domain_type="column"
+    )
+    assert list(data["a"]) == [2, 3]
+    assert "c" not in data.columns
+
+    # Loading new data for the batch invalidates the cached result
+    engine.load_batch_data(
+        batch_data=pd.DataFrame({"a": [5, 6], "b": [1, 3]}), batch_id="1234"
+    )
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs={"column": "a", **domain_kwargs}, domain_type="column"
+    )
+    assert list(data["a"]) == [6]
+
+    # Without caching, the row_condition is evaluated every time
+    engine = PandasExecutionEngine(caching=False)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type="table"
+    )
+    assert len(engine._row_condition_cache) == 0
+    assert list(data["a"]) == [2, 3]
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition():
     engine = PandasExecutionEngine()
@@ -227,6 +276,121 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_metric_bundle_evaluates_each_compute_domain_once():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [5, 6, 7, 8]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    compute_domains = []
+    get_compute_domain = engine.get_compute_domain
+
+    def spy_get_compute_domain(domain_kwargs, domain_type, *args, **kwargs):
+        compute_domains.append(dict(domain_kwargs))
+        return get_compute_domain(domain_kwargs, domain_type, *args, **kwargs)
+
+    engine.get_compute_domain = spy_get_compute_domain
+
+    domains = [
+        {"column": "a"},
+        {"column": "b"},
+        {"column": "b", "row_condition": "a>1", "condition_parser": "pandas"},
+    ]
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=dict(),
+        )
+        for domain_kwargs in domains
+        for metric_name in ["column.min", "column.max", "column.mean", "column.sum"]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+
+    assert [metrics[metric.id] for metric in desired_metrics] == [
+        1.0,
+        3.0,
+        2.0,
+        6.0,
+        5,
+        8,
+        6.5,
+        26,
+        6,
+        7,
+        6.5,
+        13,
+    ]
+    # Columns "a" and "b" share the unconditioned compute domain
+    assert compute_domains == [
+        {},
+        {"row_condition": "a>1", "condition_parser": "pandas"},
+    ]
+
+
+def test_resolve_metric_bundle_shares_column_reductions(monkeypatch):
+    df = pd.DataFrame(
+        {"a": [1.5, None, 2.25, 7.125, None], "b": ["x", "y", "w", "z", "x"]}
+    )
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    computed_reductions = []
+
+    class SpyColumnReductions(pandas_execution_engine._ColumnReductions):
+        @property
+        def reductions(self):
+            if self._reductions is None:
+                computed_reductions.append(self.column.name)
+            return super().reductions
+
+    monkeypatch.setattr(
+        pandas_execution_engine, "_ColumnReductions", SpyColumnReductions
+    )
+    metric_names = [
+        "column.min",
+        "column.max",
+        "column.sum",
+        "column.mean",
+        "column.standard_deviation",
+    ]
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in metric_names
+    ]
+    desired_metrics.append(
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs=dict(),
+        )
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+
+    assert [metrics[metric.id] for metric in desired_metrics] == [
+        df["a"].min(),
+        df["a"].max(),
+        df["a"].sum(),
+        df["a"].mean(),
+        df["a"].std(),
+        "z",
+    ]
+    # The reductions of "a" are computed once for all its metrics; "b" is not numeric
+    assert computed_reductions == ["a", "b"]
+
+
+def test_resolve_metric_bundle_with_nonexistent_column():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    max_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "i_dont_exist"},
+        metric_value_kwargs=dict(),
+    )
+
+    with pytest.raises(KeyError):
+        engine.resolve_metrics(metrics_to_resolve=(max_metric,))
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -294,6 +458,210 @@ def test_get_batch_with_split_on_whole_table_filesystem(
     assert test_df.shape == (5, 2)
 
 
+def test_get_batch_data_in_chunks(tmp_path):
+    path = str(tmp_path / "test.csv")
+    pd.DataFrame({"a": [1, 2, 3, None, 5, 6, 7], "b": [1, 2, 3, 4, 5, 6, 70]}).to_csv(
+        path, index=False
+    )
+    domains = [
+        {"column": "b"},
+        {"column": "b", "row_condition": "a>1", "condition_parser": "pandas"},
+    ]
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs=dict(),
+            metric_value_kwargs=dict(),
+        )
+    ] + [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=dict(),
+        )
+        for domain_kwargs in domains
+        for metric_name in [
+            "column.min",
+            "column.max",
+            "column.sum",
+            "column.mean",
+            "column.standard_deviation",
+        ]
+    ]
+
+    resolved_metrics = []
+    for reader_options in [{}, {"chunksize": 3}]:
+        engine = PandasExecutionEngine()
+        batch_data = engine.get_batch_data(
+            PathBatchSpec(path=path, reader_options=reader_options)
+        )
+        engine.load_batch_data("1234", batch_data)
+        resolved_metrics.append(
+            engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+        )
+    assert isinstance(batch_data, PandasChunkedBatchData)
+    assert batch_data.shape == (7, 2)
+    assert list(batch_data.columns) == ["a", "b"]
+    assert batch_data.head(4)["b"].tolist() == [1, 2, 3, 4]
+
+    # Metrics merged from the partial states of the chunks match those computed on the whole data
+    metrics, chunked_metrics = resolved_metrics
+    assert chunked_metrics.keys() == metrics.keys()
+    for metric_id, value in metrics.items():
+        assert chunked_metrics[metric_id] == pytest.approx(value)
+
+    # Approximate quantiles are merged from the sketches of the chunks
+    sketch = MetricConfiguration(
+        metric_name="column.quantile_values.sketch",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    sketch_metrics = engine.resolve_metrics(metrics_to_resolve=[sketch])
+    quantiles = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"quantiles": (0.25, 0.5), "allow_relative_error": 0.01},
+        metric_dependencies={"column.quantile_values.sketch": sketch},
+    )
+    assert engine.resolve_metrics(
+        metrics_to_resolve=[quantiles], metrics=sketch_metrics
+    ) == {quantiles.id: [3, 4]}
+
+    # Metrics which need a whole column in memory are not computed on data read in chunks
+    for metric_name, metric_value_kwargs in [
+        ("column.median", dict()),
+        ("column.quantile_values", {"quantiles": (0.25, 0.5)}),
+    ]:
+        with pytest.raises(ge_exceptions.ChunkedDataNotSupportedError):
+            engine.resolve_metrics(
+                metrics_to_resolve=[
+                    MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs={"column": "b"},
+                        metric_value_kwargs=metric_value_kwargs,
+                    )
+                ]
+            )
+    with pytest.raises(ge_exceptions.ChunkedDataNotSupportedError):
+        engine.get_compute_domain(
+            {"column": "a", "row_condition": "b>3", "condition_parser": "pandas"},
+            domain_type="column",
+        )
+
+
+def test_validate_column_map_expectations_on_data_in_chunks(tmp_path):
+    path = str(tmp_path / "test.csv")
+    pd.DataFrame(
+        {
+            "a": [1, 2, 3, None, 5, 6, 7, 8, 2, 9, None],
+            "b": ["x", "y", "x", "y", "z", "w", "x", "w", "w", "y", "z"],
+        }
+    ).to_csv(path, index=False)
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "a",
+                "value_set": [1, 2, 3],
+                "result_format": {
+                    "result_format": "SUMMARY",
+                    "partial_unexpected_count": 3,
+                },
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={
+                "column": "a",
+                "min_value": 2,
+                "max_value": 6,
+                "row_condition": 'b!="w"',
+                "condition_parser": "pandas",
+                "result_format": "BASIC",
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "result_format": "SUMMARY"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_distinct_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x", "y", "z"]},
+        ),
+    ]
+
+    results = []
+    for reader_options in [{}, {"chunksize": 3}]:
+        engine = PandasExecutionEngine()
+        engine.load_batch_data(
+            "1234",
+            engine.get_batch_data(
+                PathBatchSpec(path=path, reader_options=reader_options)
+            ),
+        )
+        validator = Validator(execution_engine=engine)
+        results.append(
+            validator.graph_validate(
+                configurations=configurations,
+                runtime_configuration={"catch_exceptions": False},
+            )
+        )
+    assert engine.is_chunked({})
+
+    # Unexpected counts and value counts are summed over the chunks, and the first unexpected values are kept
+    results, chunked_results = results
+    for index in [0, 1]:
+        assert chunked_results[index].result == results[index].result
+    assert chunked_results[0].result["unexpected_count"] == 5
+    assert chunked_results[0].result["partial_unexpected_list"] == [5, 6, 7]
+    assert chunked_results[1].result["unexpected_count"] == 3
+    # The unexpected values of expect_column_values_to_not_be_null are NaN, which are not equal to themselves
+    assert chunked_results[2].result["unexpected_count"] == 2
+    assert len(chunked_results[2].result["partial_unexpected_list"]) == 2
+    assert not chunked_results[3].success
+    assert chunked_results[3].result["observed_value"] == ["w", "x", "y", "z"]
+    value_counts = results[3].result["details"]["value_counts"]
+    assert chunked_results[3].result["details"]["value_counts"].equals(value_counts)
+
+    histogram = MetricConfiguration(
+        metric_name="column.histogram",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"bins": (0, 3, 6, 9)},
+    )
+    assert engine.resolve_metrics(metrics_to_resolve=[histogram]) == {
+        histogram.id: [3, 2, 4]
+    }
+
+    # Every unexpected value, and conditions comparing values across rows, would need the whole column in memory
+    for expectation_type, kwargs in [
+        (
+            "expect_column_values_to_be_in_set",
+            {"column": "a", "value_set": [1, 2, 3], "result_format": "COMPLETE"},
+        ),
+        ("expect_column_values_to_be_unique", {"column": "b"}),
+        ("expect_column_values_to_be_increasing", {"column": "a"}),
+    ]:
+        with pytest.raises(ge_exceptions.ChunkedDataNotSupportedError):
+            validator.graph_validate(
+                configurations=[
+                    ExpectationConfiguration(
+                        expectation_type=expectation_type, kwargs=kwargs
+                    )
+                ],
+                runtime_configuration={"catch_exceptions": False},
+            )
+    with pytest.raises(ge_exceptions.ChunkedDataNotSupportedError):
+        engine.resolve_metrics(
+            metrics_to_resolve=[
+                MetricConfiguration(
+                    metric_name="column.histogram",
+                    metric_domain_kwargs={"column": "a"},
+                    metric_value_kwargs={"bins": 3},
+                )
+            ]
+        )
+
+
 @mock_s3
 def test_get_batch_with_split_on_whole_table_s3_with_configured_asset_s3_data_connector():
     region_name: str = "us-east-1"
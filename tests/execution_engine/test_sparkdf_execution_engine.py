@@ -8,6 +8,7 @@ import pandas as pd
 import pytest
 
 import great_expectations.exceptions.exceptions as ge_exceptions
+import great_expectations.execution_engine.sparkdf_execution_engine as sparkdf_execution_engine
 from great_expectations.core.batch import Batch
 from great_expectations.datasource.types.batch_spec import (
     PathBatchSpec,
@@ -799,6 +800,124 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
     assert found_message
 
 
+# Ensuring that the metric bundles of several compute domains of a batch are computed in a single job
+def test_sparkdf_batch_aggregate_metrics_fused_across_domains(caplog, spark_session):
+    engine = _build_spark_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, None], "b": [4, 4, 4, 4, 4, 4]})
+    )
+    domains = [
+        {"column": "a"},
+        {"column": "a", "row_condition": "b < 4", "condition_parser": "spark"},
+        {"column": "b", "row_condition": "a > 1", "condition_parser": "spark"},
+    ]
+    partial_metrics = [
+        MetricConfiguration(
+            metric_name=f"column.{metric_name}.aggregate_fn",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=dict(),
+        )
+        for domain_kwargs in domains
+        for metric_name in ["max", "min"]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=partial_metrics)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=partial_metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        for partial_metric in partial_metrics
+    ]
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    res = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+
+    # The domain without any rows ("b < 4") is computed on its own
+    assert [res[metric.id] for metric in desired_metrics] == [3, 1, None, None, 4, 4]
+    assert "SparkDFExecutionEngine computed 6 metrics on 3 domains in a single job" in [
+        record.message for record in caplog.records
+    ]
+
+
+def test_sparkdf_row_condition_cache_is_bounded(spark_session):
+    engine = _build_spark_engine(pd.DataFrame({"a": [1, 2, 3, 4]}))
+    for value in range(sparkdf_execution_engine.ROW_CONDITION_CACHE_MAX_SIZE + 1):
+        engine.get_compute_domain(
+            {"row_condition": f"a > {value}", "condition_parser": "spark"},
+            domain_type="identity",
+        )
+    assert (
+        len(engine._row_condition_cache)
+        == sparkdf_execution_engine.ROW_CONDITION_CACHE_MAX_SIZE
+    )
+
+    # The filtered DataFrames are shared, not copied
+    df, _, _ = engine.get_compute_domain(
+        {"row_condition": "a > 2", "condition_parser": "spark"}, domain_type="identity"
+    )
+    assert (
+        engine.get_compute_domain(
+            {"row_condition": "a > 2", "condition_parser": "spark"},
+            domain_type="identity",
+        )[0]
+        is df
+    )
+    assert df.count() == 2
+
+
+def test_sparkdf_unexpected_values_collected_together(spark_session):
+    engine = _build_spark_engine(pd.DataFrame({"a": [1, 2, 3, 4, 5, 6]}))
+    desired_metrics = []
+    metrics = dict()
+    for value_set in [[1, 2], [1, 2, 3, 4, 5]]:
+        condition_metric = MetricConfiguration(
+            metric_name="column_values.in_set.condition",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"value_set": value_set},
+        )
+        metrics.update(engine.resolve_metrics(metrics_to_resolve=(condition_metric,)))
+        desired_metrics.append(
+            MetricConfiguration(
+                metric_name="column_values.in_set.unexpected_values",
+                metric_domain_kwargs={"column": "a"},
+                metric_value_kwargs={
+                    "value_set": value_set,
+                    "result_format": {
+                        "result_format": "BASIC",
+                        "partial_unexpected_count": 2,
+                    },
+                },
+                metric_dependencies={"unexpected_condition": condition_metric},
+            )
+        )
+
+    res = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+    assert res[desired_metrics[0].id] == [3, 4]
+    assert res[desired_metrics[1].id] == [6]
+
+
+def test_persisted_batch_data_is_released(spark_session):
+    engine = _build_spark_engine(pd.DataFrame({"a": [1, 2, 3]}))
+    batch_id = engine.active_batch_data_id
+    df = engine.dataframe
+    assert df.is_cached
+
+    # Reloading the same DataFrame keeps it persisted
+    engine.load_batch_data(batch_id, df)
+    assert df.is_cached
+
+    # Loading new data for the batch unpersists the previous DataFrame
+    new_df = spark_session.createDataFrame([(4,), (5,)], ["a"])
+    engine.load_batch_data(batch_id, new_df)
+    assert not df.is_cached
+    assert new_df.is_cached
+
+    engine.release_materializations()
+    assert not new_df.is_cached
+    assert engine.dataframe.count() == 2
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = _build_spark_engine(
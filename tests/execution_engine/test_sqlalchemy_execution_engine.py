@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 
@@ -11,6 +12,7 @@ from great_expectations.exceptions.exceptions import InvalidConfigError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
 from great_expectations.expectations.metrics import (
@@ -61,6 +63,60 @@ def test_instantiation_via_url(sa):
     )
 
 
+def test_batch_spec_materialization_reused_until_released(sa):
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": range(10)}).to_sql("test", eng, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+
+    def temp_tables():
+        return [
+            row[0]
+            for row in engine.engine.execute(
+                "SELECT name FROM sqlite_temp_master WHERE type = 'table'"
+            )
+        ]
+
+    whole_table_spec = BatchSpec(
+        table_name="test",
+        partition_definition={},
+        splitter_method="_split_on_whole_table",
+        splitter_kwargs={},
+    )
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec=whole_table_spec)
+    assert batch_data.row_count() == 10
+    assert temp_tables() == []
+
+    sampled_spec = BatchSpec(
+        table_name="test",
+        sampling_method="_sample_using_mod",
+        sampling_kwargs={"column_name": "a", "mod": 2, "value": 0},
+    )
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec=sampled_spec)
+    assert batch_data.row_count() == 5
+    assert temp_tables() == [batch_data.selectable.name]
+
+    # Loading the same BatchSpec again reuses its temporary table
+    reloaded_batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=BatchSpec(sampled_spec)
+    )
+    assert reloaded_batch_data is batch_data
+    assert len(temp_tables()) == 1
+
+    subselect_spec = BatchSpec(sampled_spec, materialization="subselect")
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec=subselect_spec)
+    assert batch_data.row_count() == 5
+    assert len(temp_tables()) == 1
+
+    with pytest.raises(ValueError):
+        engine.get_batch_data_and_markers(
+            batch_spec=BatchSpec(sampled_spec, materialization="table")
+        )
+
+    engine.release_materializations()
+    assert temp_tables() == []
+    assert engine.materialization_manager.materialized_batch_spec_ids == []
+
+
 def test_instantiation_via_credentials(sa, test_backends):
     if "postgresql" not in test_backends:
         pytest.skip("test_database_store_backend_get_url_for_key requires postgresql")
@@ -192,6 +248,339 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+def test_sa_resolve_metric_bundles_concurrently(sa, tmp_path):
+    db_file = str(tmp_path / "concurrent.db")
+    sa_engine = sa.create_engine(f"sqlite:///{db_file}")
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 5, 6, 7]}).to_sql(
+        "test", sa_engine
+    )
+    engine = SqlAlchemyExecutionEngine(engine=sa_engine)
+    # sqlite engines are replaced with a single connection, which cannot be shared across threads
+    assert not engine.supports_concurrent_metric_resolution
+
+    engine.engine = sa_engine
+    engine.load_batch_data(
+        "my_id", SqlAlchemyBatchData(engine=sa_engine, table_name="test")
+    )
+    assert engine.supports_concurrent_metric_resolution
+
+    domains = [
+        {"column": "a"},
+        {
+            "column": "a",
+            "row_condition": 'col("b")>4',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ]
+    aggregate_fn_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.max.aggregate_fn", "column.min.aggregate_fn"]
+        for domain_kwargs in domains
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=aggregate_fn_metrics)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": metric},
+        )
+        for metric in aggregate_fn_metrics
+    ]
+
+    serial_metrics = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+    # Make sure the metrics are recomputed rather than read from the metric cache
+    engine.metric_cache.clear()
+    concurrent_metrics = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics,
+        metrics=metrics,
+        runtime_configuration={"concurrency": {"enabled": True, "max_workers": 2}},
+    )
+    assert concurrent_metrics == serial_metrics
+    assert [concurrent_metrics[metric.id] for metric in desired_metrics] == [
+        3,
+        3,
+        1,
+        2,
+    ]
+
+
+def test_sa_concurrent_metric_resolution_disabled_for_temp_table_batches(sa):
+    # A single connection shared by every checkout keeps the temporary table visible to the test
+    sa_engine = sa.create_engine(
+        "sqlite://",
+        poolclass=sa.pool.StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}).to_sql("test", sa_engine)
+    engine = SqlAlchemyExecutionEngine(engine=sa_engine)
+    engine.engine = sa_engine
+    engine.load_batch_data(
+        "my_id", SqlAlchemyBatchData(engine=sa_engine, table_name="test")
+    )
+    assert engine.supports_concurrent_metric_resolution
+
+    batch_data = SqlAlchemyBatchData(
+        engine=sa_engine,
+        selectable=sa.select(["*"])
+        .select_from(sa.text("test"))
+        .where(sa.text("a > 1")),
+        create_temp_table=True,
+    )
+    assert batch_data.has_connection_scoped_temp_table
+    engine.load_batch_data("my_temp_table_id", batch_data)
+    # The temporary table is only visible to the connection which created it
+    assert not engine.supports_concurrent_metric_resolution
+    assert (
+        engine._get_concurrent_resolution_max_workers(
+            {"concurrency": {"enabled": True, "max_workers": 4}}
+        )
+        is None
+    )
+
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a", "batch_id": "my_temp_table_id"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=[aggregate_fn_metric])
+    max_ = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a", "batch_id": "my_temp_table_id"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"metric_partial_fn": aggregate_fn_metric},
+    )
+    resolved_metrics = engine.resolve_metrics(
+        metrics_to_resolve=[max_],
+        metrics=metrics,
+        runtime_configuration={"concurrency": {"enabled": True, "max_workers": 4}},
+    )
+    assert resolved_metrics == {max_.id: 3}
+
+
+def test_sa_resolve_metrics_async(sa, tmp_path):
+    db_file = str(tmp_path / "async.db")
+    sa_engine = sa.create_engine(f"sqlite:///{db_file}")
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 5, 6, 7]}).to_sql(
+        "test", sa_engine
+    )
+    engine = SqlAlchemyExecutionEngine(engine=sa_engine)
+    engine.engine = sa_engine
+    engine.load_batch_data(
+        "my_id", SqlAlchemyBatchData(engine=sa_engine, table_name="test")
+    )
+
+    aggregate_fn_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.max.aggregate_fn", "column.min.aggregate_fn"]
+        for domain_kwargs in [{"column": "a"}, {"column": "b"}]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=aggregate_fn_metrics)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": metric},
+        )
+        for metric in aggregate_fn_metrics
+    ]
+    unexpected_condition = MetricConfiguration(
+        metric_name="column_values.in_set.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2]},
+    )
+    metrics.update(engine.resolve_metrics(metrics_to_resolve=[unexpected_condition]))
+    unexpected_values = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "value_set": [1, 2],
+            "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20},
+        },
+        metric_dependencies={"unexpected_condition": unexpected_condition},
+    )
+    desired_metrics.append(unexpected_values)
+
+    serial_metrics = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+    engine.metric_cache.clear()
+    async_metrics = asyncio.get_event_loop().run_until_complete(
+        engine.resolve_metrics_async(
+            metrics_to_resolve=desired_metrics,
+            metrics=metrics,
+            runtime_configuration={"concurrency": {"max_workers": 3}},
+        )
+    )
+    assert async_metrics == serial_metrics
+    assert [async_metrics[metric.id] for metric in desired_metrics] == [
+        3,
+        7,
+        1,
+        4,
+        [3, 3],
+    ]
+
+
+def test_sa_resolve_metrics_async_serially_for_temp_table_batches(sa):
+    # A single connection shared by every checkout keeps the temporary table visible to the test
+    sa_engine = sa.create_engine(
+        "sqlite://",
+        poolclass=sa.pool.StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 5, 6, 7]}).to_sql(
+        "test", sa_engine
+    )
+    engine = SqlAlchemyExecutionEngine(engine=sa_engine)
+    engine.engine = sa_engine
+    engine.load_batch_data(
+        "my_id",
+        SqlAlchemyBatchData(
+            engine=sa_engine,
+            selectable=sa.select(["*"])
+            .select_from(sa.text("test"))
+            .where(sa.text("b > 4")),
+            create_temp_table=True,
+        ),
+    )
+    runtime_configuration = {"concurrency": {"max_workers": 3}}
+    assert engine._get_async_resolution_max_workers(runtime_configuration) == 1
+
+    aggregate_fn_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.max.aggregate_fn", "column.min.aggregate_fn"]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=aggregate_fn_metrics)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": metric},
+        )
+        for metric in aggregate_fn_metrics
+    ]
+    async_metrics = asyncio.get_event_loop().run_until_complete(
+        engine.resolve_metrics_async(
+            metrics_to_resolve=desired_metrics,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+    )
+    assert [async_metrics[metric.id] for metric in desired_metrics] == [3, 2]
+
+
+@pytest.mark.parametrize("supports_aggregate_filter", [True, False])
+def test_sa_batch_aggregate_metrics_of_row_conditions_in_single_query(
+    caplog, sa, monkeypatch, supports_aggregate_filter
+):
+    # Dialects without FILTER (WHERE ...) support fall back to CASE expressions
+    monkeypatch.setattr(
+        SqlAlchemyExecutionEngine,
+        "_supports_aggregate_filter",
+        supports_aggregate_filter,
+    )
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 5, 6, 7]})
+    )
+    domains = [
+        dict(),
+        {
+            "row_condition": 'col("b")>4',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {
+            "row_condition": 'col("b")>9',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ]
+    partial_metrics = []
+    for domain_kwargs in domains:
+        partial_metrics.append(
+            MetricConfiguration(
+                metric_name="column.max.aggregate_fn",
+                metric_domain_kwargs={"column": "a", **domain_kwargs},
+                metric_value_kwargs=dict(),
+            )
+        )
+        partial_metrics.append(
+            MetricConfiguration(
+                metric_name="table.row_count.aggregate_fn",
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs=dict(),
+            )
+        )
+    metrics = engine.resolve_metrics(metrics_to_resolve=partial_metrics)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=partial_metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        for partial_metric in partial_metrics
+    ]
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    res = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+
+    assert [res[metric.id] for metric in desired_metrics] == [3, 6, 3, 3, None, 0]
+    assert [record.message for record in caplog.records] == [
+        "SqlAlchemyExecutionEngine computed 6 metrics on 3 domains in a single query"
+    ]
+
+
+@pytest.mark.parametrize("supports_aggregate_filter", [True, False])
+def test_sa_conditional_aggregate_of_row_count(
+    sa, monkeypatch, supports_aggregate_filter
+):
+    monkeypatch.setattr(
+        SqlAlchemyExecutionEngine,
+        "_supports_aggregate_filter",
+        supports_aggregate_filter,
+    )
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 5, 6, 7]})
+    )
+    condition = sa.column("b") > 4
+
+    # table.row_count is COUNT() without arguments; with CASE expressions it becomes COUNT(CASE WHEN ... THEN 1 END)
+    row_count = engine._get_conditional_aggregate(sa.func.count(), condition)
+    assert row_count is not None
+    if not supports_aggregate_filter:
+        assert "count(CASE WHEN" in str(row_count)
+    max_a = engine._get_conditional_aggregate(sa.func.max(sa.column("a")), condition)
+    res = engine.engine.execute(
+        sa.select([row_count, max_a]).select_from(sa.table("test"))
+    ).fetchall()
+    assert list(res[0]) == [3, 3]
+
+    # Expressions that are not a single known aggregate are not rewritten
+    assert (
+        engine._get_conditional_aggregate(
+            sa.func.abs(sa.func.max(sa.column("a"))), condition
+        )
+        is None
+    )
+    assert engine._get_conditional_aggregate(sa.column("a"), condition) is None
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs(sa):
     engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]}))
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyBatchData,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.core.expect_column_values_to_be_unique import (
+    ExpectColumnValuesToBeUnique,
+)
+from great_expectations.validator.validator import Validator
+
+
+@pytest.mark.parametrize(
+    "column,success,unexpected_values",
+    [("unique", True, []), ("duplicated", False, [3, 3])],
+)
+def test_sa_expect_column_values_to_be_unique_impl(
+    sa, column, success, unexpected_values
+):
+    sa_engine = sa.create_engine("sqlite://")
+    pd.DataFrame(
+        {"unique": [1, 2, 3, 4, None], "duplicated": [1, 2, 3, 3, None]}
+    ).to_sql("unique_test_data", sa_engine, index=False)
+    batch_data = SqlAlchemyBatchData(engine=sa_engine, table_name="unique_test_data")
+    engine = SqlAlchemyExecutionEngine(
+        engine=sa_engine, batch_data_dict={"my_id": batch_data}
+    )
+
+    statements = []
+    sa.event.listen(
+        engine.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    expectation = ExpectColumnValuesToBeUnique(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_unique",
+            kwargs={"column": column, "result_format": "SUMMARY"},
+        )
+    )
+    result = expectation.validate(Validator(execution_engine=engine))
+    assert result.success is success
+    assert result.result["unexpected_count"] == len(unexpected_values)
+    assert result.result["partial_unexpected_list"] == unexpected_values
+
+    # Duplicates are only looked for when COUNT(DISTINCT) differs from COUNT
+    assert any("count(DISTINCT" in statement for statement in statements)
+    assert any("HAVING" in statement for statement in statements) is not success
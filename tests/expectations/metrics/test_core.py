@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from great_expectations.core.batch import Batch
 from great_expectations.execution_engine import (
@@ -12,6 +13,10 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.util import (
+    _get_json_schema_validator,
+    evaluate_on_distinct_values,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -153,6 +158,7 @@ def test_map_value_set_sa(sa):
         metric_value_kwargs={"value_set": [1, 2, 3]},
     )
     metrics = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    condition_metric, condition_metrics = desired_metric, metrics
 
     # Note: metric_dependencies is optional here in the config when called from a validator.
     aggregate_partial = MetricConfiguration(
@@ -176,6 +182,81 @@ def test_map_value_set_sa(sa):
     )
     assert results == {desired_metric.id: 0}
 
+    # With no unexpected values, the unexpected values are returned without querying for them
+    statements = []
+    sa.event.listen(
+        engine.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    unexpected_values = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "value_set": [1, 2, 3],
+            "result_format": {
+                "result_format": "SUMMARY",
+                "partial_unexpected_count": 20,
+            },
+        },
+        metric_dependencies={
+            "unexpected_condition": condition_metric,
+            "unexpected_count": desired_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_values,),
+        metrics={**condition_metrics, **results},
+    )
+    assert results == {unexpected_values.id: []}
+    assert statements == []
+
+
+def test_map_unexpected_value_counts_sa_limited_to_result_format(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 3, 4, 4, 4, None]}), sa)
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.in_set.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2]},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+
+    def resolve_unexpected_metric(metric_name, result_format):
+        desired_metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"value_set": [1, 2], "result_format": result_format},
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        return engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric,), metrics=metrics
+        )[desired_metric.id]
+
+    summary = {"result_format": "SUMMARY", "partial_unexpected_count": 1}
+    complete = {"result_format": "COMPLETE", "partial_unexpected_count": 1}
+    assert resolve_unexpected_metric(
+        "column_values.in_set.unexpected_value_counts", summary
+    ) == [(4.0, 3)]
+    assert sorted(
+        resolve_unexpected_metric(
+            "column_values.in_set.unexpected_value_counts", complete
+        )
+    ) == [(3.0, 2), (4.0, 3)]
+    assert (
+        len(
+            resolve_unexpected_metric("column_values.in_set.unexpected_values", summary)
+        )
+        == 1
+    )
+    assert (
+        len(
+            resolve_unexpected_metric(
+                "column_values.in_set.unexpected_values", complete
+            )
+        )
+        == 5
+    )
+
 
 def test_map_of_type_sa(sa):
     eng = sa.create_engine("sqlite://")
@@ -291,6 +372,121 @@ def test_map_unique_pd():
     assert list(results[desired_metric.id][0]) == [False, False, True, True]
 
 
+def test_map_json_schema_and_regex_conditions_pd():
+    engine = _build_pandas_engine(
+        pd.DataFrame(
+            {
+                "a": ['{"a": 1}', '{"a": "b"}', '{"a": 1}', None, '{"a": 1}'],
+                "b": ["abc", "bcd", "abc", None, "xyz"],
+            }
+        )
+    )
+    json_schema = {"properties": {"a": {"type": "integer"}}}
+    _get_json_schema_validator.cache_clear()
+
+    for column, condition_metric_name, metric_value_kwargs in [
+        ("a", "column_values.match_json_schema", {"json_schema": json_schema}),
+        ("a", "column_values.match_json_schema", {"json_schema": dict(json_schema)}),
+        ("b", "column_values.match_regex", {"regex": "^a"}),
+        ("b", "column_values.not_match_regex", {"regex": "^a"}),
+        (
+            "b",
+            "column_values.match_regex_list",
+            {"regex_list": ["^a", "c$"], "match_on": "all"},
+        ),
+        ("b", "column_values.not_match_regex_list", {"regex_list": ["^a", "c$"]}),
+    ]:
+        desired_metric = MetricConfiguration(
+            metric_name=f"{condition_metric_name}.condition",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+        assert (
+            list(results[desired_metric.id][0])
+            == {
+                "column_values.match_json_schema": [False, True, False, False],
+                "column_values.match_regex": [False, True, False, True],
+                "column_values.not_match_regex": [True, False, True, False],
+                "column_values.match_regex_list": [False, True, False, True],
+                "column_values.not_match_regex_list": [True, False, True, False],
+            }[condition_metric_name]
+        )
+
+    # Equal schemas share their compiled validator
+    assert _get_json_schema_validator.cache_info().currsize == 1
+
+
+def test_map_elementwise_condition_evaluated_per_distinct_value_pd():
+    evaluated_values = []
+
+    def is_short(column):
+        evaluated_values.append(list(column))
+        return column.map(lambda val: val is not None and len(val) <= 2)
+
+    column = pd.Series(["a", "bbb", "a", None, "bbb", "a"], index=list("uvwxyz"))
+    result = evaluate_on_distinct_values(column, is_short)
+    # Missing values are evaluated on their own rows
+    assert evaluated_values == [["a", "bbb"], [None]]
+    assert result.equals(
+        pd.Series([True, False, True, False, False, True], index=list("uvwxyz"))
+    )
+
+    # Mostly distinct columns are evaluated as a whole
+    evaluated_values.clear()
+    evaluate_on_distinct_values(pd.Series(["a", "bbb", "cc"]), is_short)
+    assert evaluated_values == [["a", "bbb", "cc"]]
+
+    engine = _build_pandas_engine(
+        pd.DataFrame({"a": ["2020-01-01", "not a date", None] * 4 + ["2020-01-02"]})
+    )
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.dateutil_parseable.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert list(results[desired_metric.id][0]) == [False, True] * 4 + [False]
+
+
+def test_map_unexpected_values_pd():
+    df = pd.DataFrame({"a": [1, None, 5, 2, 6, None, 7, 0], "b": list("abcdefgh")})
+    engine = _build_pandas_engine(df)
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.between.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"min_value": 0, "max_value": 4},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+
+    def _resolve_unexpected(metric_suffix, result_format):
+        desired_metric = MetricConfiguration(
+            metric_name=f"column_values.between.{metric_suffix}",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                "min_value": 0,
+                "max_value": 4,
+                "result_format": result_format,
+            },
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        return engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric,), metrics=metrics
+        )[desired_metric.id]
+
+    complete = {"result_format": "COMPLETE"}
+    basic = {"result_format": "BASIC", "partial_unexpected_count": 2}
+    assert _resolve_unexpected("unexpected_values", complete) == [5, 6, 7]
+    assert _resolve_unexpected("unexpected_values", basic) == [5, 6]
+    assert _resolve_unexpected("unexpected_index_list", complete) == [2, 4, 6]
+    assert _resolve_unexpected("unexpected_index_list", basic) == [2, 4]
+    assert _resolve_unexpected("unexpected_rows", basic)["b"].tolist() == ["c", "e"]
+    assert _resolve_unexpected("unexpected_value_counts", basic).tolist() == [1, 1]
+
+    # A single non-null mask of the column is shared by its map metrics
+    assert len(engine._nonnull_mask_cache) == 1
+
+
 def test_map_unique_spark(spark_session):
     engine = _build_spark_engine(
         pd.DataFrame(
@@ -361,6 +557,72 @@ def test_map_unique_spark(spark_session):
     assert results[desired_metric.id] == [(3, "bar"), (3, "baz")]
 
 
+def test_map_pandas_udf_conditions_spark(spark_session):
+    engine = _build_spark_engine(
+        pd.DataFrame(
+            {
+                "a": ['{"a": 1}', "not json", None, '{"a": "b"}'],
+                "b": ["2020-01-01", "01/01/2020", None, "2020-13-01"],
+                "c": ['{"a": 1}', '{"a": "b"}', None, '{"a": 2}'],
+            }
+        ),
+        spark_session,
+    )
+
+    for column, condition_metric_name, metric_value_kwargs, unexpected_count in [
+        ("a", "column_values.json_parseable", dict(), 1),
+        (
+            "c",
+            "column_values.match_json_schema",
+            {"json_schema": {"properties": {"a": {"type": "integer"}}}},
+            1,
+        ),
+        (
+            "b",
+            "column_values.match_strftime_format",
+            {"strftime_format": "%Y-%m-%d"},
+            2,
+        ),
+    ]:
+        condition_metric = MetricConfiguration(
+            metric_name=f"{condition_metric_name}.condition",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+        aggregate_partial = MetricConfiguration(
+            metric_name=f"{condition_metric_name}.unexpected_count.aggregate_fn",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=metric_value_kwargs,
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        metrics = engine.resolve_metrics(
+            metrics_to_resolve=(aggregate_partial,), metrics=metrics
+        )
+        desired_metric = MetricConfiguration(
+            metric_name=f"{condition_metric_name}.unexpected_count",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=metric_value_kwargs,
+            metric_dependencies={"metric_partial_fn": aggregate_partial},
+        )
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric,), metrics=metrics
+        )
+        assert results[desired_metric.id] == unexpected_count
+
+    # Invalid value kwargs are reported before any Spark job runs
+    with pytest.raises(ValueError):
+        engine.resolve_metrics(
+            metrics_to_resolve=(
+                MetricConfiguration(
+                    metric_name="column_values.match_strftime_format.condition",
+                    metric_domain_kwargs={"column": "b"},
+                    metric_value_kwargs={"strftime_format": "%D"},
+                ),
+            )
+        )
+
+
 def test_map_unique_sa(sa):
     engine = _build_sa_engine(
         pd.DataFrame(
@@ -949,3 +1211,72 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
         ):
             found_message = True
     assert found_message
+
+
+def test_approximate_metrics_from_sketches_pd():
+    rng = np.random.RandomState(42)
+    df = pd.DataFrame(
+        {"a": rng.normal(size=10000), "b": rng.randint(0, 1000, size=10000),}
+    )
+    engine = _build_pandas_engine(df)
+
+    sketch_metric = MetricConfiguration(
+        metric_name="column.quantile_values.sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": (0.25, 0.5, 0.75),
+            "allow_relative_error": 0.01,
+        },
+        metric_dependencies={"column.quantile_values.sketch": sketch_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == pytest.approx(
+        df["a"].quantile([0.25, 0.5, 0.75]).tolist(), abs=0.05
+    )
+
+    # Without a sketch, the quantiles of an in-memory column are computed exactly
+    engine = _build_pandas_engine(df)
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": (0.25, 0.5, 0.75),
+            "allow_relative_error": 0.01,
+        },
+    )
+    metric_provider, _ = get_metric_provider("column.quantile_values", engine)
+    assert "column.quantile_values.sketch" not in (
+        metric_provider.get_evaluation_dependencies(
+            metric=desired_metric, execution_engine=engine
+        )
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert (
+        results[desired_metric.id]
+        == df["a"].quantile([0.25, 0.5, 0.75], interpolation="nearest").tolist()
+    )
+
+    sketch_metric = MetricConfiguration(
+        metric_name="column.distinct_values.sketch",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.approx_count",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+        metric_dependencies={"column.distinct_values.sketch": sketch_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == pytest.approx(df["b"].nunique(), rel=0.03)
@@ -6,7 +6,9 @@ import pytest
 import great_expectations as ge
 from great_expectations.core.util import nested_update
 from great_expectations.dataset.util import check_sql_engine_dialect
+from great_expectations.exceptions import InvalidConfigError
 from great_expectations.util import (
+    SqlAlchemyEngineRegistry,
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
     lint_code,
@@ -325,3 +327,47 @@ def test_filter_properties_dict():
     d5_end = copy.deepcopy(d5_begin)
     d5_end_expected = {"c": "xyz_0", "d": 1}
     assert d5_end == d5_end_expected
+
+
+def test_sqlalchemy_engine_registry_shares_engines(sa, tmp_path):
+    registry = SqlAlchemyEngineRegistry()
+    db_file = str(tmp_path / "registry.db")
+
+    engine = registry.get_engine("sqlite:///" + db_file)
+    assert registry.get_engine("sqlite:///" + db_file) is engine
+    assert registry.get_engine(sa.engine.url.make_url("sqlite:///" + db_file)) is engine
+    assert (
+        registry.get_engine("sqlite:///" + db_file, connect_args={"timeout": 1})
+        is not engine
+    )
+    assert len(registry) == 2
+
+    # In-memory databases are private to their engine
+    assert registry.get_engine("sqlite://") is not registry.get_engine("sqlite://")
+    assert len(registry) == 2
+
+    registry.configure(pool_size=2, max_overflow=1, pool_pre_ping=True)
+    queue_pool_engine = registry.get_engine(
+        "sqlite:///" + db_file, poolclass=sa.pool.QueuePool
+    )
+    assert queue_pool_engine.pool.size() == 2
+    assert queue_pool_engine.pool._max_overflow == 1
+    assert queue_pool_engine.pool._pre_ping
+    # pool_size and max_overflow do not apply to the NullPool used for sqlite files
+    assert registry.get_engine("sqlite:///" + db_file + "_2").pool._pre_ping
+
+    # The pool_options of a datasource, execution engine or store override those of the registry
+    configured_engine = registry.get_engine(
+        "sqlite:///" + db_file,
+        pool_options={"pool_size": 3, "pool_pre_ping": False},
+        poolclass=sa.pool.QueuePool,
+    )
+    assert configured_engine is not queue_pool_engine
+    assert configured_engine.pool.size() == 3
+    assert configured_engine.pool._max_overflow == 1
+    assert not configured_engine.pool._pre_ping
+    with pytest.raises(InvalidConfigError):
+        registry.get_engine("sqlite:///" + db_file, pool_options={"pool_sise": 3})
+
+    registry.dispose()
+    assert len(registry) == 0
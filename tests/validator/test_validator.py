@@ -1,4 +1,7 @@
+import asyncio
+
 import pandas as pd
+import pytest
 
 import great_expectations.expectations.metrics
 from great_expectations.core import IDDict
@@ -7,6 +10,7 @@ from great_expectations.core.expectation_configuration import ExpectationConfigu
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
+from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.core import ExpectColumnMaxToBeBetween
@@ -79,6 +83,55 @@ def test_parse_validation_graph_with_bad_metrics_args():
     assert len(ready_metrics) == 4 and len(needed_metrics) == 5
 
 
+def test_get_resolution_waves():
+    expectationConfiguration = ExpectationConfiguration(
+        expectation_type="expect_column_value_z_scores_to_be_less_than",
+        kwargs={"column": "a", "mostly": 0.9, "threshold": 4, "double_sided": True,},
+    )
+    graph = ValidationGraph()
+    engine = PandasExecutionEngine()
+    expectation_impl = get_expectation_impl(
+        "expect_column_value_z_scores_to_be_less_than"
+    )
+    validation_dependencies = expectation_impl(
+        expectationConfiguration
+    ).get_validation_dependencies(expectationConfiguration, engine)
+    for metric_configuration in validation_dependencies["metrics"].values():
+        Validator(execution_engine=engine).build_metric_dependency_graph(
+            graph,
+            metric_configuration,
+            expectationConfiguration,
+            execution_engine=engine,
+        )
+
+    waves = graph.get_resolution_waves(metrics=dict())
+    assert len(waves[0]) == 4
+    assert sum(len(wave) for wave in waves) == 9
+
+    resolved_ids = set()
+    for wave in waves:
+        for metric in wave:
+            assert metric.id not in resolved_ids
+            for dependency in metric.metric_dependencies.values():
+                assert dependency.id in resolved_ids
+        resolved_ids.update(metric.id for metric in wave)
+
+    # Metrics that have already been computed are neither scheduled nor waited on
+    first_wave_ids = {metric.id: None for metric in waves[0]}
+    remaining_waves = graph.get_resolution_waves(metrics=first_wave_ids)
+    assert [len(wave) for wave in remaining_waves] == [len(wave) for wave in waves[1:]]
+
+
+def test_get_resolution_waves_with_circular_dependency():
+    metric_a = MetricConfiguration("metric_a", IDDict())
+    metric_b = MetricConfiguration("metric_b", IDDict())
+    graph = ValidationGraph(
+        edges=[MetricEdge(metric_a, metric_b), MetricEdge(metric_b, metric_a)]
+    )
+    with pytest.raises(GreatExpectationsError):
+        graph.get_resolution_waves()
+
+
 def test_populate_dependencies():
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
     expectationConfiguration = ExpectationConfiguration(
@@ -161,9 +214,13 @@ def test_graph_validate(basic_datasource):
         )
     )
 
-    result = Validator(
-        execution_engine=PandasExecutionEngine(), batches=[batch]
-    ).graph_validate(configurations=[expectationConfiguration])
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+    result = validator.graph_validate(configurations=[expectationConfiguration])
+    timing = validator.graph_resolution_timing
+    assert timing.planning_time >= 0
+    assert len(timing.waves) > 1
+    assert [wave.wave_index for wave in timing.waves] == list(range(len(timing.waves)))
+    assert timing.resolution_time == sum(wave.resolution_time for wave in timing.waves)
     assert result == [
         ExpectationValidationResult(
             success=True,
@@ -183,6 +240,55 @@ def test_graph_validate(basic_datasource):
     ]
 
 
+def test_graph_validate_async(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={"column": "b", "mostly": 0.9, "threshold": 4, "double_sided": True},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 1, "max_value": 20},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a", "value_set": [1, 3, 5, 10, 22]},
+        ),
+    ]
+
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        BatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "batch_data": df,
+                "partition_request": PartitionRequest(
+                    **{
+                        "partition_identifiers": {
+                            "pipeline_stage_name": 0,
+                            "run_id": 0,
+                            "custom_key_0": 0,
+                        }
+                    }
+                ),
+            }
+        )
+    )
+
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+    async_result = asyncio.get_event_loop().run_until_complete(
+        validator.graph_validate_async(
+            configurations=configurations,
+            runtime_configuration={"concurrency": {"max_workers": 2}},
+        )
+    )
+    assert len(validator.graph_resolution_timing.waves) > 1
+    validator.execution_engine.metric_cache.clear()
+    assert async_result == validator.graph_validate(configurations=configurations)
+    assert [result.success for result in async_result] == [True, False, True]
+
+
 # this might indicate that we need to validate configuration a little more strictly prior to actually validating
 def test_graph_validate_with_bad_config(basic_datasource):
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})